@@ -62,6 +62,13 @@ const SliderStyled = styled(SliderUnstyled)`
     z-index: 1;
   }
 
+  .mark {
+    height: 8px;
+    width: 2px;
+    background: ${({ theme }) => theme.palette.text.primary};
+    opacity: 0.5;
+  }
+
   .valueLabel::before {
     display: none;
   }
@@ -90,6 +97,7 @@ export type Range = [SliderValue, SliderValue];
 
 type BaseSliderProps<T extends Range | number> = {
   boundsAtom: RecoilValueReadOnly<Range>;
+  quantilesAtom?: RecoilValueReadOnly<number[]>;
   color: string;
   value: T;
   onChange: (e: ChangeEvent<{}>, v: T) => void;
@@ -104,6 +112,7 @@ type BaseSliderProps<T extends Range | number> = {
 
 const BaseSlider = <T extends Range | number>({
   boundsAtom,
+  quantilesAtom,
   color,
   fieldType,
   onChange,
@@ -116,6 +125,7 @@ const BaseSlider = <T extends Range | number>({
 }: BaseSliderProps<T>) => {
   const theme = useTheme();
   const bounds = useRecoilValue(boundsAtom);
+  const quantiles = quantilesAtom ? useRecoilValue(quantilesAtom) : [];
 
   const timeZone =
     fieldType && [DATE_FIELD, DATE_TIME_FIELD].includes(fieldType)
@@ -130,6 +140,9 @@ const BaseSlider = <T extends Range | number>({
   }
 
   const step = getStep(bounds, fieldType);
+  const marks = quantiles
+    .filter((q) => q > bounds[0] && q < bounds[1])
+    .map((q) => ({ value: q }));
   const { formatter, hasTitle } = getFormatter(
     fieldType,
     fieldType === DATE_FIELD ? "UTC" : timeZone,
@@ -186,6 +199,7 @@ const BaseSlider = <T extends Range | number>({
             track: "track",
             rail: "rail",
             active: "active",
+            mark: "mark",
             valueLabel: "valueLabel",
           }}
           valueLabelFormat={formatter}
@@ -193,6 +207,7 @@ const BaseSlider = <T extends Range | number>({
           valueLabelDisplay={
             (clicking || persistValue) && showValue ? "on" : "off"
           }
+          marks={marks}
           max={bounds[1]}
           min={bounds[0]}
           step={step}
@@ -247,6 +262,7 @@ export const Slider = ({ valueAtom, onChange, ...rest }: SliderProps) => {
 type RangeSliderProps = {
   valueAtom: RecoilState<Range>;
   boundsAtom: RecoilValueReadOnly<Range>;
+  quantilesAtom?: RecoilValueReadOnly<number[]>;
   color: string;
   showBounds?: boolean;
   fieldType: string;
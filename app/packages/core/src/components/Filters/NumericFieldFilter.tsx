@@ -264,6 +264,11 @@ const NumericFieldFilter = ({
               path,
               defaultRange,
             })}
+            quantilesAtom={
+              [DATE_FIELD, DATE_TIME_FIELD].includes(ftype)
+                ? undefined
+                : fos.quantilesAtom({ path })
+            }
             color={color}
             key={key}
           />
@@ -1,5 +1,5 @@
 /**
- * @generated SignedSource<<e37d762f250a359c1af7c71a7a793116>>
+ * @generated SignedSource<<9208155941042fb74d9c73860e5e5cb4>>
  * @lightSyntaxTransform
  * @nogrep
  */
@@ -18,6 +18,7 @@ export type AggregationForm = {
   index?: number | null;
   mixed: boolean;
   paths: ReadonlyArray<string>;
+  quantiles?: boolean;
   sampleIds: ReadonlyArray<string>;
   slice?: string | null;
   slices?: ReadonlyArray<string> | null;
@@ -47,6 +48,7 @@ export type aggregationsQuery$data = {
     readonly nan?: number;
     readonly ninf?: number;
     readonly path?: string;
+    readonly quantiles?: ReadonlyArray<number> | null;
     readonly slice?: number | null;
     readonly true?: number;
     readonly values?: ReadonlyArray<{
@@ -89,7 +91,14 @@ v3 = {
   "name": "min",
   "storageKey": null
 },
-v4 = [
+v4 = {
+  "alias": null,
+  "args": null,
+  "kind": "ScalarField",
+  "name": "quantiles",
+  "storageKey": null
+},
+v5 = [
   {
     "alias": null,
     "args": [
@@ -158,7 +167,8 @@ v4 = [
         "kind": "InlineFragment",
         "selections": [
           (v2/*: any*/),
-          (v3/*: any*/)
+          (v3/*: any*/),
+          (v4/*: any*/)
         ],
         "type": "IntAggregation",
         "abstractKey": null
@@ -188,7 +198,8 @@ v4 = [
             "kind": "ScalarField",
             "name": "ninf",
             "storageKey": null
-          }
+          },
+          (v4/*: any*/)
         ],
         "type": "FloatAggregation",
         "abstractKey": null
@@ -257,7 +268,7 @@ return {
     "kind": "Fragment",
     "metadata": null,
     "name": "aggregationsQuery",
-    "selections": (v4/*: any*/),
+    "selections": (v5/*: any*/),
     "type": "Query",
     "abstractKey": null
   },
@@ -266,19 +277,19 @@ return {
     "argumentDefinitions": (v0/*: any*/),
     "kind": "Operation",
     "name": "aggregationsQuery",
-    "selections": (v4/*: any*/)
+    "selections": (v5/*: any*/)
   },
   "params": {
-    "cacheID": "dadc0977809d96f1e7d1963b5abf37b0",
+    "cacheID": "fbc79570beccbd6d6e9b610a4dea3fd2",
     "id": null,
     "metadata": {},
     "name": "aggregationsQuery",
     "operationKind": "query",
-    "text": "query aggregationsQuery(\n  $form: AggregationForm!\n) {\n  aggregations(form: $form) {\n    __typename\n    ... on Aggregation {\n      __isAggregation: __typename\n      path\n      count\n      exists\n    }\n    ... on BooleanAggregation {\n      false\n      true\n    }\n    ... on IntAggregation {\n      max\n      min\n    }\n    ... on FloatAggregation {\n      inf\n      max\n      min\n      nan\n      ninf\n    }\n    ... on RootAggregation {\n      slice\n      expandedFieldCount\n      frameLabelFieldCount\n    }\n    ... on StringAggregation {\n      values {\n        count\n        value\n      }\n    }\n  }\n}\n"
+    "text": "query aggregationsQuery(\n  $form: AggregationForm!\n) {\n  aggregations(form: $form) {\n    __typename\n    ... on Aggregation {\n      __isAggregation: __typename\n      path\n      count\n      exists\n    }\n    ... on BooleanAggregation {\n      false\n      true\n    }\n    ... on IntAggregation {\n      max\n      min\n      quantiles\n    }\n    ... on FloatAggregation {\n      inf\n      max\n      min\n      nan\n      ninf\n      quantiles\n    }\n    ... on RootAggregation {\n      slice\n      expandedFieldCount\n      frameLabelFieldCount\n    }\n    ... on StringAggregation {\n      values {\n        count\n        value\n      }\n    }\n  }\n}\n"
   }
 };
 })();
 
-(node as any).hash = "e8a94130200106bfc8e3c6b02b19ee7c";
+(node as any).hash = "2ba7a75b437ada8e1a2623a3ec6e5e0d";
 
 export default node;
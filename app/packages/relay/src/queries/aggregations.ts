@@ -18,6 +18,7 @@ export default r(graphql`
       ... on IntAggregation {
         max
         min
+        quantiles
       }
       ... on FloatAggregation {
         inf
@@ -25,6 +26,7 @@ export default r(graphql`
         min
         nan
         ninf
+        quantiles
       }
       ... on RootAggregation {
         slice
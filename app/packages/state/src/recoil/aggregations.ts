@@ -28,6 +28,7 @@ export const aggregationQuery = graphQLSelectorFamily<
     root?: boolean;
     mixed?: boolean;
     customView?: Stage[];
+    quantiles?: boolean;
   },
   ResponseFrom<foq.aggregationsQuery>
 >({
@@ -43,6 +44,7 @@ export const aggregationQuery = graphQLSelectorFamily<
       root = false,
       mixed = false,
       customView = undefined,
+      quantiles = false,
     }) =>
     ({ get }) => {
       const dataset = get(selectors.datasetName);
@@ -60,6 +62,7 @@ export const aggregationQuery = graphQLSelectorFamily<
         hiddenLabels: !root ? get(selectors.hiddenLabelsArray) : [],
         paths,
         mixed,
+        quantiles,
         sampleIds:
           !root && modal && !get(groupId) && !mixed
             ? [get(sidebarSampleId)]
@@ -530,6 +533,24 @@ export const bounds = selectorFamily({
     },
 });
 
+export const quantiles = selectorFamily<
+  number[],
+  { extended: boolean; path: string; modal: boolean }
+>({
+  key: "quantiles",
+  get:
+    ({ path, ...params }) =>
+    ({ get }) => {
+      // quantiles are only requested for the slider's own path, so the
+      // sidebar's batched aggregations do not pay for them
+      const data = get(
+        aggregationQuery({ ...params, paths: [path], quantiles: true })
+      ).aggregations.filter((agg) => agg.path === path)[0];
+
+      return data?.quantiles ? [...data.quantiles] : [];
+    },
+});
+
 export const nonfiniteCounts = selectorFamily({
   key: "nonfiniteCounts",
   get:
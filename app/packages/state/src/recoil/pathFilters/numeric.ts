@@ -194,6 +194,16 @@ export const boundsAtom = selectorFamily<
     },
 });
 
+export const quantilesAtom = selectorFamily<number[], { path: string }>({
+  key: "numericFieldQuantiles",
+  get:
+    ({ path }) =>
+    ({ get }) =>
+      get(
+        aggregationAtoms.quantiles({ path, extended: false, modal: false })
+      ),
+});
+
 export const rangeAtom = selectorFamily<
   Range,
   {
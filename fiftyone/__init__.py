@@ -7,6 +7,7 @@ See https://voxel51.com/fiftyone for more information.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import importlib as _importlib
 from pkgutil import extend_path as _extend_path
 import os as _os
 
@@ -23,6 +24,7 @@ import fiftyone.constants as _foc
 __version__ = _foc.VERSION
 
 from fiftyone.__public__ import *
+from fiftyone.__public__ import _LAZY_IMPORTS
 
 import fiftyone.core.uid as _fou
 import fiftyone.core.logging as _fol
@@ -31,5 +33,20 @@ import fiftyone.migrations as _fom
 _fol.init_logging()
 
 if _os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
-    _fom.migrate_database_if_necessary()
+    # When imports are lazy, migrations run when the database is first used
+    if not config.lazy_import:
+        _fom.migrate_database_if_necessary()
+
     _fou.log_import_if_allowed()
+
+
+def __getattr__(name):
+    for module_name, names in _LAZY_IMPORTS.items():
+        if name in names:
+            value = getattr(_importlib.import_module(module_name), name)
+            globals()[name] = value
+            return value
+
+    raise AttributeError(
+        "module '%s' has no attribute '%s'" % (__name__, name)
+    )
@@ -12,10 +12,12 @@ config = _foc.load_config()
 annotation_config = _foc.load_annotation_config()
 app_config = _foc.load_app_config()
 
-_foo.establish_db_conn(config)
+_foo.establish_db_conn(config, lazy=config.lazy_import)
 
 from .core.aggregations import (
     Aggregation,
+    ApproxCountDistinct,
+    ApproxQuantiles,
     Bounds,
     Count,
     CountValues,
@@ -134,22 +136,6 @@ from .core.odm import (
     KeypointSkeleton,
     SidebarGroupDocument,
 )
-from .core.plots import (
-    plot_confusion_matrix,
-    plot_pr_curve,
-    plot_pr_curves,
-    plot_roc_curve,
-    lines,
-    scatterplot,
-    location_scatterplot,
-    Plot,
-    ResponsivePlot,
-    InteractivePlot,
-    ViewPlot,
-    ViewGrid,
-    CategoricalHistogram,
-    NumericalHistogram,
-)
 from .core.sample import Sample
 from .core.spaces import (
     Space,
@@ -198,11 +184,6 @@ from .core.stages import (
     ToTrajectories,
     ToFrames,
 )
-from .core.session import (
-    close_app,
-    launch_app,
-    Session,
-)
 from .core.utils import (
     disable_progress_bars,
     pprint,
@@ -224,3 +205,54 @@ from .utils.eval.segmentation import (
     SegmentationResults,
 )
 from .utils.quickstart import quickstart
+
+#
+# Members of heavy modules that are imported on first access when
+# `config.lazy_import` is True. See `fiftyone.__getattr__()`
+#
+_LAZY_IMPORTS = {
+    "fiftyone.core.plots": (
+        "plot_confusion_matrix",
+        "plot_pr_curve",
+        "plot_pr_curves",
+        "plot_roc_curve",
+        "lines",
+        "scatterplot",
+        "location_scatterplot",
+        "Plot",
+        "ResponsivePlot",
+        "InteractivePlot",
+        "ViewPlot",
+        "ViewGrid",
+        "CategoricalHistogram",
+        "NumericalHistogram",
+    ),
+    "fiftyone.core.session": (
+        "close_app",
+        "launch_app",
+        "Session",
+    ),
+}
+
+if not config.lazy_import:
+    from .core.plots import (
+        plot_confusion_matrix,
+        plot_pr_curve,
+        plot_pr_curves,
+        plot_roc_curve,
+        lines,
+        scatterplot,
+        location_scatterplot,
+        Plot,
+        ResponsivePlot,
+        InteractivePlot,
+        ViewPlot,
+        ViewGrid,
+        CategoricalHistogram,
+        NumericalHistogram,
+    )
+    from .core.session import (
+        close_app,
+        launch_app,
+        Session,
+    )
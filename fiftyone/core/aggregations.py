@@ -270,6 +270,375 @@ class AggregationError(Exception):
     """An error raised during the execution of an :class:`Aggregation`."""
 
 
+class ApproxCountDistinct(Aggregation):
+    """Computes an approximate count of the distinct values of a field or
+    expression of a collection.
+
+    ``None``-valued fields are ignored.
+
+    Unlike :class:`Distinct`, which gathers every distinct value into a single
+    document, this aggregation builds a
+    `HyperLogLog <https://en.wikipedia.org/wiki/HyperLogLog>`_ sketch of the
+    values. Each register of the sketch is computed by a ``$group`` partial in
+    the database, so the amount of data returned by the database is bounded
+    by the number of registers regardless of the number of values, and the
+    sketch is merged into a cardinality estimate client-side.
+
+    The relative standard error of the estimate is approximately
+    ``1.04 / sqrt(2 ** precision)``, i.e., 0.8% for the default precision.
+
+    This aggregation is typically applied to *countable* field types (or lists
+    of such types):
+
+    -   :class:`fiftyone.core.fields.BooleanField`
+    -   :class:`fiftyone.core.fields.IntField`
+    -   :class:`fiftyone.core.fields.StringField`
+
+    Examples::
+
+        import fiftyone as fo
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        #
+        # Approximate the number of distinct labels in a list field
+        #
+
+        aggregation = fo.ApproxCountDistinct("ground_truth.detections.label")
+        count = dataset.aggregate(aggregation)
+        print(count)  # the approximate count
+
+        #
+        # Approximate the number of distinct filepaths
+        #
+
+        aggregation = fo.ApproxCountDistinct("filepath", precision=10)
+        count = dataset.aggregate(aggregation)
+        print(count)  # the approximate count
+
+    Args:
+        field_or_expr: a field name, ``embedded.field.name``,
+            :class:`fiftyone.core.expressions.ViewExpression`, or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            defining the field or expression to aggregate
+        precision (14): the number of index bits of the sketch, in
+            ``[4, 16]``. The sketch uses ``2 ** precision`` registers
+        expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            to apply to ``field_or_expr`` (which must be a field) before
+            aggregating
+        safe (False): whether to ignore nan/inf values when dealing with
+            floating point values
+    """
+
+    def __init__(self, field_or_expr, precision=14, expr=None, safe=False):
+        if not isinstance(precision, int) or not 4 <= precision <= 16:
+            raise ValueError(
+                "Precision must be an integer in [4, 16]; found %s" % precision
+            )
+
+        super().__init__(field_or_expr, expr=expr, safe=safe)
+        self._precision = precision
+
+    def _kwargs(self):
+        return [
+            ["field_or_expr", self._field_name],
+            ["precision", self._precision],
+            ["expr", self._expr],
+            ["safe", self._safe],
+        ]
+
+    def default_result(self):
+        """Returns the default result for this aggregation.
+
+        Returns:
+            ``0``
+        """
+        return 0
+
+    def parse_result(self, d):
+        """Parses the output of :meth:`to_mongo`.
+
+        Args:
+            d: the result dict
+
+        Returns:
+            the approximate number of distinct values
+        """
+        m = 2**self._precision
+        registers = np.zeros(m, dtype=float)
+        for r in d["registers"]:
+            registers[int(r["i"])] = r["r"]
+
+        # https://en.wikipedia.org/wiki/HyperLogLog#Operations
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m**2 / np.sum(2.0**-registers)
+
+        num_zeros = m - len(d["registers"])
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # Small range correction (linear counting)
+            estimate = m * np.log(m / num_zeros)
+
+        return int(round(estimate))
+
+    def to_mongo(self, sample_collection, context=None):
+        path, pipeline, _, _, _ = _parse_field_and_expr(
+            sample_collection,
+            self._field_name,
+            expr=self._expr,
+            safe=self._safe,
+            context=context,
+        )
+
+        m = 2**self._precision
+        num_bits = 63 - self._precision
+
+        # Map the signed 64-bit hash onto [0, 2 ** 63) without overflow
+        hash_expr = {"$toHashedIndexKey": "$" + path}
+        unsigned_expr = {
+            "$cond": [
+                {"$lt": ["$hash", 0]},
+                {"$subtract": [-1, "$hash"]},
+                "$hash",
+            ]
+        }
+
+        # The low bits select a register, and the register stores the maximum
+        # position of the leading 1 in the remaining bits
+        remainder = {"$floor": {"$divide": ["$hash", m]}}
+        rank_expr = {
+            "$cond": [
+                {"$gt": [remainder, 0]},
+                {
+                    "$subtract": [
+                        num_bits,
+                        {"$floor": {"$log": [remainder, 2]}},
+                    ]
+                },
+                num_bits + 1,
+            ]
+        }
+
+        pipeline.extend(
+            [
+                {"$match": {"$expr": {"$gt": ["$" + path, None]}}},
+                {"$project": {"hash": hash_expr}},
+                {"$project": {"hash": unsigned_expr}},
+                {
+                    "$group": {
+                        "_id": {"$mod": ["$hash", m]},
+                        "r": {"$max": rank_expr},
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": None,
+                        "registers": {"$push": {"i": "$_id", "r": "$r"}},
+                    }
+                },
+            ]
+        )
+
+        return pipeline
+
+
+class ApproxQuantiles(Aggregation):
+    """Computes approximate quantile(s) of the numeric field values of a
+    collection.
+
+    ``None``-valued fields are ignored.
+
+    Unlike :class:`Quantiles`, which gathers all values into a single document
+    and sorts them, this aggregation builds a
+    `DDSketch <https://arxiv.org/abs/1908.10693>`_ of the values: values are
+    counted in logarithmically-sized buckets by a ``$group`` partial in the
+    database, and the resulting sketch is merged into quantile estimates
+    client-side. The amount of data returned by the database depends only on
+    the dynamic range of the values, not on their number.
+
+    Each returned quantile is within ``relative_accuracy`` (relative error) of
+    a value whose rank is the requested quantile. The minimum and maximum
+    values (quantiles ``0`` and ``1``) are exact.
+
+    This aggregation is typically applied to *numeric* field types (or lists of
+    such types):
+
+    -   :class:`fiftyone.core.fields.IntField`
+    -   :class:`fiftyone.core.fields.FloatField`
+
+    Examples::
+
+        import fiftyone as fo
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        #
+        # Approximate the quantiles of a numeric list field
+        #
+
+        aggregation = fo.ApproxQuantiles(
+            "predictions.detections.confidence", [0.1, 0.5, 0.9]
+        )
+        quantiles = dataset.aggregate(aggregation)
+        print(quantiles)  # the approximate quantiles
+
+    Args:
+        field_or_expr: a field name, ``embedded.field.name``,
+            :class:`fiftyone.core.expressions.ViewExpression`, or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            defining the field or expression to aggregate
+        quantiles: the quantile or iterable of quantiles to compute. Each
+            quantile must be a numeric value in ``[0, 1]``
+        relative_accuracy (0.01): the relative accuracy of the sketch, in
+            ``(0, 1)``
+        expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            to apply to ``field_or_expr`` (which must be a field) before
+            aggregating
+        safe (False): whether to ignore nan/inf values when dealing with
+            floating point values
+    """
+
+    def __init__(
+        self,
+        field_or_expr,
+        quantiles,
+        relative_accuracy=0.01,
+        expr=None,
+        safe=False,
+    ):
+        quantiles_list, is_scalar = Quantiles._parse_quantiles(quantiles)
+
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                "Relative accuracy must be in (0, 1); found %s"
+                % relative_accuracy
+            )
+
+        super().__init__(field_or_expr, expr=expr, safe=safe)
+        self._quantiles = quantiles
+        self._relative_accuracy = relative_accuracy
+
+        self._quantiles_list = quantiles_list
+        self._is_scalar = is_scalar
+
+    def _kwargs(self):
+        return [
+            ["field_or_expr", self._field_name],
+            ["quantiles", self._quantiles],
+            ["relative_accuracy", self._relative_accuracy],
+            ["expr", self._expr],
+            ["safe", self._safe],
+        ]
+
+    @property
+    def _gamma(self):
+        a = self._relative_accuracy
+        return (1 + a) / (1 - a)
+
+    def default_result(self):
+        """Returns the default result for this aggregation.
+
+        Returns:
+            ``None`` or ``[None, None, None]``
+        """
+        if self._is_scalar:
+            return None
+
+        return [None] * len(self._quantiles_list)
+
+    def parse_result(self, d):
+        """Parses the output of :meth:`to_mongo`.
+
+        Args:
+            d: the result dict
+
+        Returns:
+            the approximate quantile or list of quantiles
+        """
+        gamma = self._gamma
+        vmin, vmax = d["min"], d["max"]
+
+        # Sort buckets by value: negative buckets have decreasing magnitude
+        buckets = sorted(d["buckets"], key=lambda b: (b["s"], b["s"] * b["k"]))
+        counts = np.cumsum([b["n"] for b in buckets])
+        num_values = counts[-1]
+
+        quantiles = []
+        for q in self._quantiles_list:
+            # Same nearest-rank definition as `Quantiles`
+            rank = max(int(np.ceil(q * num_values)) - 1, 0)
+
+            if rank == 0:
+                value = vmin
+            elif rank == num_values - 1:
+                value = vmax
+            else:
+                b = buckets[int(np.searchsorted(counts, rank, side="right"))]
+                if b["s"] == 0:
+                    value = 0.0
+                else:
+                    value = b["s"] * 2 * gamma ** b["k"] / (gamma + 1)
+
+                value = min(max(value, vmin), vmax)
+
+            quantiles.append(value)
+
+        if self._is_scalar:
+            return quantiles[0]
+
+        return quantiles
+
+    def to_mongo(self, sample_collection, context=None):
+        path, pipeline, _, _, _ = _parse_field_and_expr(
+            sample_collection,
+            self._field_name,
+            expr=self._expr,
+            safe=self._safe,
+            context=context,
+        )
+
+        value = "$" + path
+        log_gamma = float(np.log(self._gamma))
+
+        sign_expr = {"$cmp": [value, 0]}
+        key_expr = {
+            "$cond": [
+                {"$eq": [value, 0]},
+                0,
+                {"$ceil": {"$divide": [{"$ln": {"$abs": value}}, log_gamma]}},
+            ]
+        }
+
+        pipeline.extend(
+            [
+                {"$match": {"$expr": {"$isNumber": value}}},
+                {
+                    "$group": {
+                        "_id": {"s": sign_expr, "k": key_expr},
+                        "n": {"$sum": 1},
+                        "min": {"$min": value},
+                        "max": {"$max": value},
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": None,
+                        "buckets": {
+                            "$push": {"s": "$_id.s", "k": "$_id.k", "n": "$n"}
+                        },
+                        "min": {"$min": "$min"},
+                        "max": {"$max": "$max"},
+                    }
+                },
+            ]
+        )
+
+        return pipeline
+
+
 class Bounds(Aggregation):
     """Computes the bounds of a numeric field of a collection.
 
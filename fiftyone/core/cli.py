@@ -4069,6 +4069,16 @@ class TransformVideosCommand(Command):
             action="store_true",
             help="whether to delete the original videos after transforming",
         )
+        parser.add_argument(
+            "-n",
+            "--num-workers",
+            default=None,
+            type=int,
+            help=(
+                "the number of worker processes to use. The default is "
+                "`multiprocessing.cpu_count()`"
+            ),
+        )
         parser.add_argument(
             "-s",
             "--skip-failures",
@@ -4104,6 +4114,7 @@ class TransformVideosCommand(Command):
             rel_dir=args.rel_dir,
             update_filepaths=args.update_filepaths,
             delete_originals=args.delete_originals,
+            num_workers=args.num_workers,
             skip_failures=args.skip_failures,
             verbose=args.verbose,
         )
@@ -317,9 +317,12 @@ class ClipsView(fov.DatasetView):
         # Regenerate the clips dataset
         #
         # This assumes that calling `load_view()` when the current clips
-        # dataset has been deleted will cause a new one to be generated
+        # dataset has been deleted will cause a new one to be generated.
+        # Cached (persistent) datasets are instead incrementally updated
         #
-        self._clips_dataset.delete()
+        if not self._clips_dataset.persistent:
+            self._clips_dataset.delete()
+
         _view = self._clips_stage.load_view(self._source_collection)
         self._clips_dataset = _view._clips_dataset
 
@@ -5,6 +5,7 @@ Interface for sample collections.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
 from collections import defaultdict
 from copy import copy
 import fnmatch
@@ -18,14 +19,18 @@ import timeit
 import warnings
 
 from bson import ObjectId
+import numpy as np
 from pymongo import InsertOne, UpdateOne, UpdateMany
+from pymongo.errors import CursorNotFound
 
 import eta.core.serial as etas
 import eta.core.utils as etau
 
+import fiftyone as fo
 import fiftyone.core.aggregations as foa
 import fiftyone.core.annotation as foan
 import fiftyone.core.brain as fob
+import fiftyone.core.embeddings as foem
 import fiftyone.core.expressions as foe
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.evaluation as foev
@@ -50,6 +55,16 @@ foue = fou.lazy_import("fiftyone.utils.eval")
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of concurrent pipelines used to compute aggregations
+_MAX_FACET_PIPELINES = 8
+
+# Relative costs of pipeline stages when balancing facets across pipelines
+_FACET_STAGE_COSTS = {"$unwind": 4, "$sort": 4, "$group": 2}
+
+# The fraction of a document's list elements that must be updated before the
+# entire list is rewritten in a single update rather than via array filters
+_LIST_REWRITE_RATIO = 0.5
+
 
 def _make_registrar():
     registry = {}
@@ -80,10 +95,15 @@ class SaveContext(object):
             :class:`fiftyone.core.collections.SampleCollection`
         batch_size (None): the batching strategy to use. Can either be an
             integer specifying the number of samples to save in a batch, or a
-            float number of seconds between batched saves
+            float number of seconds between batched saves. By default,
+            ``fiftyone.config.default_save_batch_size`` is used, or 0.2
+            seconds if that is not set
     """
 
     def __init__(self, sample_collection, batch_size=None):
+        if batch_size is None:
+            batch_size = fo.config.default_save_batch_size
+
         if batch_size is None:
             batch_size = 0.2
 
@@ -149,6 +169,9 @@ class SaveContext(object):
     def _save_batch(self):
         self._curr_batch_size = 0
 
+        if self._sample_ops or self._frame_ops:
+            self._dataset._mark_modified()
+
         if self._sample_ops:
             foo.bulk_write(self._sample_ops, self._sample_coll, ordered=False)
             self._sample_ops.clear()
@@ -922,13 +945,153 @@ class SampleCollection(object):
         Args:
             batch_size (None): the batching strategy to use. Can either be an
                 integer specifying the number of samples to save in a batch, or
-                a float number of seconds between batched saves
+                a float number of seconds between batched saves. By default,
+                ``fiftyone.config.default_save_batch_size`` is used, or 0.2
+                seconds if that is not set
 
         Returns:
             a :class:`SaveContext`
         """
         return SaveContext(self, batch_size=batch_size)
 
+    def iter_batches(self, fields, batch_size=1000, progress=False):
+        """Returns an iterator that emits the values of the given fields for
+        the samples in the collection as column-oriented batches.
+
+        Unlike :meth:`iter_samples`, this method reads values straight from
+        the database without constructing
+        :class:`fiftyone.core.sample.Sample` or
+        :class:`fiftyone.core.labels.Label` instances, which makes it
+        suitable for efficiently scanning large collections.
+
+        Each batch is a dict mapping field names to arrays of the same length:
+
+        -   Numeric and boolean fields are returned as numpy arrays. ``None``
+            values of float fields are returned as ``nan``, while other
+            numeric fields that contain ``None`` values are returned as
+            object arrays
+        -   :class:`fiftyone.core.fields.VectorField` and
+            :class:`fiftyone.core.fields.ArrayField` values are stacked into a
+            single numpy array when they all have the same shape, and are
+            returned as object arrays of numpy arrays otherwise
+        -   All other values are returned as object arrays containing the raw
+            database values, e.g., dicts for embedded documents
+
+        Frame-level fields of video collections can be included by prefixing
+        them with ``"frames."``, in which case each element of the returned
+        array contains the list of values for the frames of the corresponding
+        sample.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            for batch in dataset.iter_batches(
+                ["id", "uniqueness"], batch_size=100
+            ):
+                print(batch["id"].shape, batch["uniqueness"].mean())
+
+        Args:
+            fields: a field name or ``embedded.field.name``, or an iterable of
+                such names
+            batch_size (1000): the maximum number of samples per batch
+            progress (False): whether to render a progress bar tracking the
+                iterator's progress
+
+        Returns:
+            an iterator that emits dicts mapping field names to arrays
+        """
+        fields = _parse_batch_fields(fields)
+        aggregations, pipeline = self._build_values_batch_pipeline(fields)
+
+        num_samples = len(self) if progress else None
+        with fou.ProgressBar(total=num_samples, quiet=not progress) as pb:
+            for docs in self._iter_value_docs(pipeline, batch_size):
+                yield _make_columns(self, fields, aggregations, docs)
+                pb.update(len(docs))
+
+    def to_arrays(self, fields, batch_size=1000):
+        """Extracts the values of the given fields for all samples in the
+        collection as column-oriented arrays.
+
+        This method is equivalent to concatenating the batches emitted by
+        :meth:`iter_batches`. See that method for details about how values are
+        converted into arrays.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            arrays = dataset.to_arrays(["filepath", "uniqueness"])
+
+            print(arrays["filepath"].dtype)  # object
+            print(arrays["uniqueness"].dtype)  # float64
+
+        Args:
+            fields: a field name or ``embedded.field.name``, or an iterable of
+                such names
+            batch_size (1000): the number of documents to read from the
+                database per batch
+
+        Returns:
+            a dict mapping field names to arrays
+        """
+        fields = _parse_batch_fields(fields)
+        aggregations, pipeline = self._build_values_batch_pipeline(fields)
+
+        docs = []
+        for _docs in self._iter_value_docs(pipeline, batch_size):
+            docs.extend(_docs)
+
+        return _make_columns(self, fields, aggregations, docs)
+
+    def _build_values_batch_pipeline(self, fields):
+        aggregations = {}
+        for idx, field_name in enumerate(fields):
+            if "[]" in field_name:
+                raise ValueError(
+                    "Unwound field '%s' is not supported; batches always "
+                    "contain one value per sample" % field_name
+                )
+
+            aggregations[idx] = foa.Values(
+                field_name, _big_result=True, _raw=True
+            )
+
+        pipeline = self._build_batch_pipeline(aggregations)
+
+        return aggregations, pipeline
+
+    def _iter_value_docs(self, pipeline, batch_size):
+        index = 0
+        docs = []
+
+        try:
+            cursor = foo.aggregate(self._dataset._sample_collection, pipeline)
+            for d in cursor.batch_size(batch_size):
+                docs.append(d)
+                if len(docs) >= batch_size:
+                    index += len(docs)
+                    yield docs
+                    docs = []
+        except CursorNotFound:
+            # The cursor has timed out so we yield from a new one after
+            # skipping to the last offset
+            pipeline = pipeline + [{"$skip": index}]
+            for _docs in self._iter_value_docs(pipeline, batch_size):
+                yield _docs
+
+            return
+
+        if docs:
+            yield docs
+
     def _get_default_sample_fields(
         self,
         path=None,
@@ -2529,13 +2692,11 @@ class SampleCollection(object):
     ):
         root = list_field
         leaf = field_name[len(root) + 1 :]
-        elem_id = root + "._id"
-        if leaf:
-            elem = root + ".$." + leaf
-        else:
-            elem = root + ".$"
 
+        # Updates are coalesced into a single op per document
         ops = []
+        num_elems = 0
+        num_rewrites = 0
         for _id, _elem_ids, _values in zip(ids, elem_ids, values):
             if not _elem_ids:
                 continue
@@ -2543,6 +2704,8 @@ class SampleCollection(object):
             if etau.is_str(_id):
                 _id = ObjectId(_id)
 
+            _ids = []
+            _vals = []
             for _elem_id, value in zip(_elem_ids, _values):
                 if value is None and skip_none:
                     continue
@@ -2560,12 +2723,26 @@ class SampleCollection(object):
                 if etau.is_str(_elem_id):
                     _elem_id = ObjectId(_elem_id)
 
-                ops.append(
-                    UpdateOne(
-                        {"_id": _id, elem_id: _elem_id},
-                        {"$set": {elem: value}},
-                    )
-                )
+                _ids.append(_elem_id)
+                _vals.append(value)
+
+            if not _ids:
+                continue
+
+            op, rewrite = _make_list_update(
+                _id, root, leaf, _ids, _vals, len(_elem_ids)
+            )
+            ops.append(op)
+            num_elems += len(_ids)
+            num_rewrites += int(rewrite)
+
+        logger.debug(
+            "Setting %d '%s' values via %d ops (%d list rewrites)",
+            num_elems,
+            field_name,
+            len(ops),
+            num_rewrites,
+        )
 
         self._dataset._bulk_write(ops, frames=frames)
 
@@ -2657,7 +2834,11 @@ class SampleCollection(object):
         self._dataset.delete_labels(ids=ids, fields=fields)
 
     def compute_metadata(
-        self, overwrite=False, num_workers=None, skip_failures=True
+        self,
+        overwrite=False,
+        num_workers=None,
+        skip_failures=True,
+        use_threads=False,
     ):
         """Populates the ``metadata`` field of all samples in the collection.
 
@@ -2666,16 +2847,22 @@ class SampleCollection(object):
 
         Args:
             overwrite (False): whether to overwrite existing metadata
-            num_workers (None): the number of processes to use. By default,
+            num_workers (None): the number of processes (or threads, when
+                ``use_threads`` is True) to use. By default,
                 ``multiprocessing.cpu_count()`` is used
             skip_failures (True): whether to gracefully continue without
                 raising an error if metadata cannot be computed for a sample
+            use_threads (False): whether to use a thread pool rather than a
+                process pool to compute metadata. Threads are a good choice
+                when computing metadata is I/O-bound, e.g., for remote or
+                network filesystem media
         """
         fomt.compute_metadata(
             self,
             overwrite=overwrite,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            use_threads=use_threads,
         )
 
     def apply_model(
@@ -2761,6 +2948,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        embeddings_key=None,
         **kwargs,
     ):
         """Computes embeddings for the samples in the collection using the
@@ -2783,7 +2971,10 @@ class SampleCollection(object):
         :meth:`fiftyone.core.models.Model.has_embeddings` must return ``True``.
 
         If an ``embeddings_field`` is provided, the embeddings are saved to the
-        samples; otherwise, the embeddings are returned in-memory.
+        samples. If an ``embeddings_key`` is provided, the embeddings are
+        saved to the dataset's memory-mapped embeddings side-store, from which
+        they can be efficiently loaded via :meth:`load_embeddings`. Otherwise,
+        the embeddings are returned in-memory.
 
         Args:
             model: a :class:`fiftyone.core.models.Model` or
@@ -2800,13 +2991,18 @@ class SampleCollection(object):
                 raising an error if embeddings cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
                 instances
+            embeddings_key (None): a key under which to store the embeddings
+                in the dataset's embeddings side-store. Only applicable when
+                computing sample-level embeddings. Samples for which
+                embeddings could not be computed are stored as ``nan`` rows
             **kwargs: optional model-specific keyword arguments passed through
                 to the underlying inference implementation
 
         Returns:
             one of the following:
 
-            -   ``None``, if an ``embeddings_field`` is provided
+            -   ``None``, if an ``embeddings_field`` or ``embeddings_key`` is
+                provided
             -   a ``num_samples x num_dim`` array of embeddings, when computing
                 embeddings for image/video collections with image/video models,
                 respectively, and no ``embeddings_field`` is provided. If
@@ -2829,6 +3025,7 @@ class SampleCollection(object):
             batch_size=batch_size,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            embeddings_key=embeddings_key,
             **kwargs,
         )
 
@@ -2843,6 +3040,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        embeddings_key=None,
     ):
         """Computes embeddings for the image patches defined by
         ``patches_field`` of the samples in the collection using the given
@@ -2859,7 +3057,10 @@ class SampleCollection(object):
         :meth:`fiftyone.core.models.Model.has_embeddings` must return ``True``.
 
         If an ``embeddings_field`` is provided, the embeddings are saved to the
-        samples; otherwise, the embeddings are returned in-memory.
+        samples. If an ``embeddings_key`` is provided, the embeddings are
+        saved to the dataset's memory-mapped embeddings side-store, from which
+        they can be efficiently loaded via :meth:`load_embeddings`. Otherwise,
+        the embeddings are returned in-memory.
 
         Args:
             model: a :class:`fiftyone.core.models.Model`
@@ -2894,11 +3095,16 @@ class SampleCollection(object):
                 applicable for Torch-based models
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a sample
+            embeddings_key (None): a key under which to store the embeddings
+                in the dataset's embeddings side-store. Only applicable to
+                image collections. Patches for which embeddings could not be
+                computed are omitted
 
         Returns:
             one of the following:
 
-            -   ``None``, if an ``embeddings_field`` is provided
+            -   ``None``, if an ``embeddings_field`` or ``embeddings_key`` is
+                provided
             -   a dict mapping sample IDs to ``num_patches x num_dim`` arrays
                 of patch embeddings, when computing patch embeddings for image
                 collections and no ``embeddings_field`` is provided. If
@@ -2924,8 +3130,50 @@ class SampleCollection(object):
             alpha=alpha,
             handle_missing=handle_missing,
             skip_failures=skip_failures,
+            embeddings_key=embeddings_key,
         )
 
+    def list_embeddings(self):
+        """Returns the keys of all embeddings in this collection's embeddings
+        side-store.
+
+        Returns:
+            a list of embeddings keys
+        """
+        return foem.list_embeddings(self)
+
+    def load_embeddings(self, key):
+        """Loads the embeddings with the given key from this collection's
+        embeddings side-store.
+
+        Embeddings are added to the side-store by passing the
+        ``embeddings_key`` parameter to :meth:`compute_embeddings` or
+        :meth:`compute_patch_embeddings`, or via
+        :func:`fiftyone.core.embeddings.save_embeddings`.
+
+        The returned embeddings are aligned with the order of the samples (or
+        labels, for patch embeddings) in this collection. When possible, e.g.,
+        when loading embeddings for an entire dataset, a read-only
+        memory-mapped array is returned, so no data is read from disk until it
+        is accessed.
+
+        Args:
+            key: an embeddings key
+
+        Returns:
+            a ``num_embeddings x num_dims`` array
+        """
+        return foem.load_embeddings(self, key)
+
+    def delete_embeddings(self, key):
+        """Deletes the embeddings with the given key from this collection's
+        embeddings side-store.
+
+        Args:
+            key: an embeddings key
+        """
+        foem.delete_embeddings(self, key)
+
     def evaluate_regressions(
         self,
         pred_field,
@@ -3068,6 +3316,7 @@ class SampleCollection(object):
         use_boxes=False,
         classwise=True,
         dynamic=True,
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -3160,6 +3409,9 @@ class SampleCollection(object):
                 label (True) or allow matches between classes (False)
             dynamic (True): whether to declare the dynamic object-level
                 attributes that are populated on the dataset's schema
+            num_workers (None): an optional number of worker processes to use
+                to perform the per-sample matching. By default, matching is
+                performed serially in the main process
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -3180,6 +3432,7 @@ class SampleCollection(object):
             use_boxes=use_boxes,
             classwise=classwise,
             dynamic=dynamic,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -3190,6 +3443,7 @@ class SampleCollection(object):
         eval_key=None,
         mask_targets=None,
         method="simple",
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified semantic segmentation masks in this
@@ -3240,6 +3494,9 @@ class SampleCollection(object):
                 labels
             method ("simple"): a string specifying the evaluation method to
                 use. Supported values are ``("simple")``
+            num_workers (None): the number of worker processes to use to load
+                and evaluate masks. By default,
+                ``multiprocessing.cpu_count()`` is used
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.segmentation.SegmentationEvaluationConfig`
                 being used
@@ -3254,6 +3511,7 @@ class SampleCollection(object):
             eval_key=eval_key,
             mask_targets=mask_targets,
             method=method,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -6322,6 +6580,10 @@ class SampleCollection(object):
             keep_label_lists (False): whether to store the patches in label
                 list fields of the same type as the input collection rather
                 than using their single label variants
+            cache (False): whether to persist the generated patches between
+                loads of this view. When True, subsequent loads only
+                regenerate the patches of samples that have been added,
+                modified, or deleted since the last load
 
         Returns:
             a :class:`fiftyone.core.patches.PatchesView`
@@ -6393,6 +6655,10 @@ class SampleCollection(object):
                 -   a field or list of fields to include
                 -   ``True`` to include all other fields
                 -   ``None``/``False`` to include no other fields
+            cache (False): whether to persist the generated patches between
+                loads of this view. When True, subsequent loads only
+                regenerate the patches of samples that have been added,
+                modified, or deleted since the last load
 
         Returns:
             a :class:`fiftyone.core.patches.EvaluationPatchesView`
@@ -6489,6 +6755,10 @@ class SampleCollection(object):
             trajectories (False): whether to create clips for each unique
                 object trajectory defined by their ``(label, index)``. Only
                 applicable when ``field_or_expr`` is a frame-level field
+            cache (False): whether to persist the generated clips between
+                loads of this view. When True, subsequent loads only
+                regenerate the clips of videos that have been added, modified,
+                or deleted since the last load
 
         Returns:
             a :class:`fiftyone.core.clips.ClipsView`
@@ -6537,6 +6807,10 @@ class SampleCollection(object):
                 -   :class:`fiftyone.core.labels.Detections`
                 -   :class:`fiftyone.core.labels.Polylines`
                 -   :class:`fiftyone.core.labels.Keypoints`
+            cache (False): whether to persist the generated clips between
+                loads of this view. When True, subsequent loads only
+                regenerate the clips of videos that have been added, modified,
+                or deleted since the last load
             **kwargs: optional keyword arguments for
                 :meth:`fiftyone.core.clips.make_clips_dataset` specifying how
                 to perform the conversion
@@ -6700,6 +6974,10 @@ class SampleCollection(object):
                 raising an error if a video cannot be sampled
             verbose (False): whether to log information about the frames that
                 will be sampled, if any
+            cache (False): whether to persist the generated frames between
+                loads of this view. When True, subsequent loads only
+                regenerate the frames of videos that have been added,
+                modified, or deleted since the last load
 
         Returns:
             a :class:`fiftyone.core.video.FramesView`
@@ -6717,6 +6995,136 @@ class SampleCollection(object):
         """
         return list(aggregation.all)
 
+    @aggregation
+    def approx_count_distinct(
+        self, field_or_expr, precision=14, expr=None, safe=False
+    ):
+        """Computes an approximate count of the distinct values of a field or
+        expression of the collection.
+
+        ``None``-valued fields are ignored.
+
+        Unlike :meth:`distinct`, this aggregation uses a fixed amount of
+        memory regardless of the number of distinct values. See
+        :class:`fiftyone.core.aggregations.ApproxCountDistinct` for details.
+
+        This aggregation is typically applied to *countable* field types (or
+        lists of such types):
+
+        -   :class:`fiftyone.core.fields.BooleanField`
+        -   :class:`fiftyone.core.fields.IntField`
+        -   :class:`fiftyone.core.fields.StringField`
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            #
+            # Approximate the number of distinct labels in a list field
+            #
+
+            count = dataset.approx_count_distinct(
+                "ground_truth.detections.label"
+            )
+            print(count)  # the approximate count
+
+        Args:
+            field_or_expr: a field name, ``embedded.field.name``,
+                :class:`fiftyone.core.expressions.ViewExpression`, or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                defining the field or expression to aggregate. This can also
+                be a list or tuple of such arguments, in which case a tuple of
+                corresponding aggregation results (each receiving the same
+                additional keyword arguments, if any) will be returned
+            precision (14): the number of index bits of the sketch, in
+                ``[4, 16]``
+            expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                to apply to ``field_or_expr`` (which must be a field) before
+                aggregating
+            safe (False): whether to ignore nan/inf values when dealing with
+                floating point values
+
+        Returns:
+            the approximate number of distinct values
+        """
+        make = lambda field_or_expr: foa.ApproxCountDistinct(
+            field_or_expr, precision=precision, expr=expr, safe=safe
+        )
+        return self._make_and_aggregate(make, field_or_expr)
+
+    @aggregation
+    def approx_quantiles(
+        self,
+        field_or_expr,
+        quantiles,
+        relative_accuracy=0.01,
+        expr=None,
+        safe=False,
+    ):
+        """Computes approximate quantile(s) of the numeric field values of the
+        collection.
+
+        ``None``-valued fields are ignored.
+
+        Unlike :meth:`quantiles`, this aggregation does not gather all values
+        into a single document, so it can be applied to arbitrarily large
+        collections. See :class:`fiftyone.core.aggregations.ApproxQuantiles`
+        for details.
+
+        This aggregation is typically applied to *numeric* field types (or
+        lists of such types):
+
+        -   :class:`fiftyone.core.fields.IntField`
+        -   :class:`fiftyone.core.fields.FloatField`
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            #
+            # Approximate the quantiles of a numeric list field
+            #
+
+            quantiles = dataset.approx_quantiles(
+                "predictions.detections.confidence", [0.1, 0.5, 0.9]
+            )
+            print(quantiles)  # the approximate quantiles
+
+        Args:
+            field_or_expr: a field name, ``embedded.field.name``,
+                :class:`fiftyone.core.expressions.ViewExpression`, or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                defining the field or expression to aggregate
+            quantiles: the quantile or iterable of quantiles to compute. Each
+                quantile must be a numeric value in ``[0, 1]``
+            relative_accuracy (0.01): the relative accuracy of the sketch, in
+                ``(0, 1)``
+            expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                to apply to ``field_or_expr`` (which must be a field) before
+                aggregating
+            safe (False): whether to ignore nan/inf values when dealing with
+                floating point values
+
+        Returns:
+            the approximate quantile or list of quantiles
+        """
+        make = lambda field_or_expr: foa.ApproxQuantiles(
+            field_or_expr,
+            quantiles,
+            relative_accuracy=relative_accuracy,
+            expr=expr,
+            safe=safe,
+        )
+        return self._make_and_aggregate(make, field_or_expr)
+
     @aggregation
     def bounds(self, field_or_expr, expr=None, safe=False):
         """Computes the bounds of a numeric field of the collection.
@@ -7945,6 +8353,7 @@ class SampleCollection(object):
         label_field=None,
         frame_labels_field=None,
         overwrite=False,
+        num_workers=None,
         **kwargs,
     ):
         """Exports the samples in the collection to disk.
@@ -8118,6 +8527,11 @@ class SampleCollection(object):
             overwrite (False): whether to delete existing directories before
                 performing the export (True) or to merge the export with
                 existing files and directories (False)
+            num_workers (None): an optional number of worker threads to use to
+                copy or symlink media files in parallel. Labels are always
+                written in the main thread in sample order, and media that
+                was already copied by a previous export is skipped. By
+                default, media is exported in the main thread
             **kwargs: optional keyword arguments to pass to the dataset
                 exporter's constructor. If you are exporting image patches,
                 this can also contain keyword arguments for
@@ -8143,6 +8557,7 @@ class SampleCollection(object):
             label_field=label_field,
             frame_labels_field=frame_labels_field,
             overwrite=overwrite,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -8977,10 +9392,9 @@ class SampleCollection(object):
             pipelines.append(pipeline)
 
         # Build facet-able pipelines
-        compiled_facet_aggs, facet_pipelines = self._build_facets(facet_aggs)
-        for idx, pipeline in facet_pipelines.items():
-            idx_map[idx] = len(pipelines)
-            pipelines.append(pipeline)
+        compiled_facet_aggs, facets = self._build_facets(facet_aggs)
+        facets_offset = len(pipelines)
+        pipelines.extend(pipeline for _, pipeline in facets)
 
         # Run all aggregations
         _results = foo.aggregate(self._dataset._sample_collection, pipelines)
@@ -8997,16 +9411,11 @@ class SampleCollection(object):
             results[idx] = self._parse_big_result(aggregation, result)
 
         # Parse facet-able results
-        for idx, aggregation in compiled_facet_aggs.items():
-            result = list(_results[idx_map[idx]])
-            data = self._parse_faceted_result(aggregation, result)
-            if (
-                isinstance(aggregation, foa.FacetAggregations)
-                and aggregation._compiled
+        for _idx, (keys, _) in enumerate(facets, facets_offset):
+            result = list(_results[_idx])
+            for idx, data in self._parse_facets_result(
+                compiled_facet_aggs, keys, result
             ):
-                for idx, d in data.items():
-                    results[idx] = d
-            else:
                 results[idx] = data
 
         return results[0] if scalar_result else results
@@ -9020,44 +9429,44 @@ class SampleCollection(object):
         if scalar_result:
             aggregations = [aggregations]
 
+        # Placeholder to store results
+        results = [None] * len(aggregations)
+
+        async for idx, result in self._async_iter_aggregate(aggregations):
+            results[idx] = result
+
+        return results[0] if scalar_result else results
+
+    async def _async_iter_aggregate(self, aggregations):
+        """Asynchronously computes the given aggregations, yielding
+        ``(index, result)`` tuples as soon as the pipeline that computes each
+        aggregation completes, so that partial results can be reported while
+        slower pipelines are still running.
+        """
         _, _, facet_aggs = self._parse_aggregations(
             aggregations, allow_big=False
         )
 
-        # Placeholder to store results
-        results = [None] * len(aggregations)
+        if not facet_aggs:
+            return
 
-        idx_map = {}
-        pipelines = []
+        compiled_facet_aggs, facets = self._build_facets(facet_aggs)
 
-        if facet_aggs:
-            # Build facet-able pipelines
-            compiled_facet_aggs, facet_pipelines = self._build_facets(
-                facet_aggs
-            )
-            for idx, pipeline in facet_pipelines.items():
-                idx_map[idx] = len(pipelines)
-                pipelines.append(pipeline)
-
-            # Run all aggregations
-            coll_name = self._dataset._sample_collection_name
-            collection = foo.get_async_db_conn()[coll_name]
-            _results = await foo.aggregate(collection, pipelines)
-
-            # Parse facet-able results
-            for idx, aggregation in compiled_facet_aggs.items():
-                result = list(_results[idx_map[idx]])
-                data = self._parse_faceted_result(aggregation, result)
-                if (
-                    isinstance(aggregation, foa.FacetAggregations)
-                    and aggregation._compiled
-                ):
-                    for idx, d in data.items():
-                        results[idx] = d
-                else:
-                    results[idx] = data
+        coll_name = self._dataset._sample_collection_name
+        collection = foo.get_async_db_conn()[coll_name]
 
-        return results[0] if scalar_result else results
+        async def _run_facet(keys, pipeline):
+            result = await foo.aggregate(collection, [pipeline])
+            return keys, result[0]
+
+        for future in asyncio.as_completed(
+            [_run_facet(keys, pipeline) for keys, pipeline in facets]
+        ):
+            keys, result = await future
+            for idx, data in self._parse_facets_result(
+                compiled_facet_aggs, keys, result
+            ):
+                yield idx, data
 
     def _parse_aggregations(self, aggregations, allow_big=True):
         big_aggs = {}
@@ -9157,15 +9566,150 @@ class SampleCollection(object):
                 idx, (_, aggregation) = next(iter(aggregations.items()))
                 compiled[idx] = aggregation
 
-        pipelines = {}
-        for idx, aggregation in compiled.items():
-            pipelines[idx] = self._pipeline(
-                pipeline=aggregation.to_mongo(self),
-                attach_frames=aggregation._needs_frames(self),
-                group_slices=aggregation._needs_group_slices(self),
+        #
+        # Each compiled aggregation requires a full pass over the collection,
+        # so, rather than running one pipeline per aggregation, we pack the
+        # simple aggregations that attach the same data into a bounded number
+        # of cost-balanced `$facet` pipelines
+        #
+
+        facets = []
+        groups = defaultdict(list)
+        groups_args = {}
+        for key, aggregation in compiled.items():
+            pipeline = aggregation.to_mongo(self)
+            attach_frames = aggregation._needs_frames(self)
+            group_slices = aggregation._needs_group_slices(self)
+
+            # $facet stages cannot be nested, so facets that must first unwind
+            # their root field are run in their own pipelines
+            if isinstance(aggregation, foa.FacetAggregations) and any(
+                "$project" not in stage for stage in pipeline[:-1]
+            ):
+                facets.append(
+                    (
+                        [key],
+                        self._pipeline(
+                            pipeline=pipeline,
+                            attach_frames=attach_frames,
+                            group_slices=group_slices,
+                        ),
+                    )
+                )
+                continue
+
+            if group_slices is not None:
+                group_key = (attach_frames, tuple(sorted(group_slices)))
+            else:
+                group_key = (attach_frames, None)
+
+            groups[group_key].append((key, aggregation, pipeline))
+            groups_args[group_key] = (attach_frames, group_slices)
+
+        num_items = sum(len(items) for items in groups.values())
+        for group_key, items in groups.items():
+            attach_frames, group_slices = groups_args[group_key]
+            num_groups = max(
+                1, round(_MAX_FACET_PIPELINES * len(items) / num_items)
+            )
+            for _items in _balance_facets(items, num_groups):
+                facets.append(
+                    self._build_facet_group(
+                        _items, attach_frames, group_slices
+                    )
+                )
+
+        return compiled, facets
+
+    def _build_facet_group(self, items, attach_frames, group_slices):
+        if len(items) == 1:
+            key, _, pipeline = items[0]
+            return [key], self._pipeline(
+                pipeline=pipeline,
+                attach_frames=attach_frames,
+                group_slices=group_slices,
             )
 
-        return compiled, pipelines
+        keys = []
+        facets = {}
+        project = {}
+        for idx, (key, aggregation, pipeline) in enumerate(items):
+            keys.append(key)
+
+            if isinstance(aggregation, foa.FacetAggregations):
+                for _key, _pipeline in pipeline[-1]["$facet"].items():
+                    facets["f%d_%s" % (idx, _key)] = _pipeline
+            else:
+                facets["f%d" % idx] = pipeline
+
+            if project is not None:
+                root = self._get_facet_root(aggregation)
+                if root is False or group_slices:
+                    project = None
+                elif root is not None:
+                    project[root] = True
+
+        # Only pass the fields that the facets need into the facet stage
+        if project is not None:
+            pipeline = [{"$project": project or {"_id": True}}]
+        else:
+            pipeline = []
+
+        pipeline.append({"$facet": facets})
+
+        return keys, self._pipeline(
+            pipeline=pipeline,
+            attach_frames=attach_frames,
+            group_slices=group_slices,
+        )
+
+    def _get_facet_root(self, aggregation):
+        # Returns the root field that the aggregation reads, None if it reads
+        # no fields, or False if its fields cannot be determined
+        field_name = aggregation.field_name
+        if field_name is None:
+            return None if aggregation.expr is None else False
+
+        if aggregation.expr is not None:
+            return False
+
+        field_name = field_name.replace("[]", "")
+        if self._is_frame_field(field_name):
+            return "frames"
+
+        return self._handle_db_field(field_name.split(".", 1)[0])
+
+    def _parse_facets_result(self, compiled, keys, result):
+        if len(keys) > 1:
+            d = result[0] if result else {}
+            results = []
+            for idx, key in enumerate(keys):
+                if isinstance(compiled[key], foa.FacetAggregations):
+                    prefix = "f%d_" % idx
+                    _d = {
+                        k[len(prefix) :]: v
+                        for k, v in d.items()
+                        if k.startswith(prefix)
+                    }
+                    results.append([_d])
+                else:
+                    results.append(d.get("f%d" % idx, []))
+        else:
+            results = [result]
+
+        parsed = []
+        for key, result in zip(keys, results):
+            aggregation = compiled[key]
+            data = self._parse_faceted_result(aggregation, result)
+            if (
+                isinstance(aggregation, foa.FacetAggregations)
+                and aggregation._compiled
+            ):
+                parsed.extend(data.items())
+            else:
+                parsed.append((key, data))
+
+        return parsed
 
     def _parse_big_result(self, aggregation, result):
         if result:
@@ -9871,6 +10415,73 @@ def _iter_schema_label_fields(schema):
                             yield path + "." + _path, _field
 
 
+def _parse_batch_fields(fields):
+    if etau.is_str(fields):
+        return [fields]
+
+    return list(fields)
+
+
+def _make_columns(sample_collection, fields, aggregations, docs):
+    columns = {}
+    for idx, field_name in enumerate(fields):
+        aggregation = aggregations[idx]
+        values = aggregation.parse_result(docs)
+
+        # Values aggregations do not report primitive field types
+        field = aggregation._field
+        if field is None:
+            field = sample_collection.get_field(field_name)
+
+        columns[field_name] = _to_array(
+            values, field, aggregation._num_list_fields
+        )
+
+    return columns
+
+
+def _to_array(values, field, num_list_fields):
+    if isinstance(field, (fof.VectorField, fof.ArrayField)):
+        values = _transform_values(
+            values, field.to_python, level=1 + num_list_fields
+        )
+
+        if num_list_fields == 0 and values and _all_not_none(values):
+            try:
+                return np.stack(values)
+            except ValueError:
+                pass  # arrays have heterogeneous shapes
+
+        return _to_object_array(values)
+
+    if num_list_fields == 0:
+        if isinstance(field, fof.FloatField):
+            return np.array(
+                [np.nan if v is None else v for v in values], dtype=float
+            )
+
+        if isinstance(field, (fof.IntField, fof.BooleanField)):
+            if _all_not_none(values):
+                dtype = bool if isinstance(field, fof.BooleanField) else int
+                return np.array(values, dtype=dtype)
+
+    return _to_object_array(values)
+
+
+def _all_not_none(values):
+    return all(v is not None for v in values)
+
+
+def _to_object_array(values):
+    # Assign elements individually so that list values are not broadcast into
+    # additional array dimensions
+    array = np.empty(len(values), dtype=object)
+    for idx, value in enumerate(values):
+        array[idx] = value
+
+    return array
+
+
 def _serialize_value(field_name, field, value, validate=True):
     if value is None:
         return None
@@ -10600,6 +11211,80 @@ def _get_non_none_value(values, level=0):
     return None
 
 
+def _balance_facets(items, num_groups):
+    # Greedily assigns each facet, in descending order of cost, to the group
+    # with the lowest total cost
+    costs = [0] * num_groups
+    groups = [[] for _ in range(num_groups)]
+
+    def _cost(item):
+        return sum(
+            _FACET_STAGE_COSTS.get(next(iter(stage), None), 1)
+            for stage in item[2]
+        )
+
+    for item in sorted(items, key=_cost, reverse=True):
+        idx = costs.index(min(costs))
+        costs[idx] += _cost(item)
+        groups[idx].append(item)
+
+    return [g for g in groups if g]
+
+
+def _make_list_update(_id, root, leaf, elem_ids, values, num_elems):
+    if len(elem_ids) == 1:
+        if leaf:
+            path = root + ".$." + leaf
+        else:
+            path = root + ".$"
+
+        op = UpdateOne(
+            {"_id": _id, root + "._id": elem_ids[0]},
+            {"$set": {path: values[0]}},
+        )
+        return op, False
+
+    # When most elements change, rewrite the list in a single pass. Nested
+    # leaves can't be merged into elements, so they use array filters
+    if "." not in leaf and len(elem_ids) >= _LIST_REWRITE_RATIO * num_elems:
+        value = {"$arrayElemAt": [{"$literal": values}, "$$idx"]}
+        if leaf:
+            value = {"$mergeObjects": ["$$elem", {leaf: value}]}
+
+        elems = {
+            "$map": {
+                "input": "$" + root,
+                "as": "elem",
+                "in": {
+                    "$let": {
+                        "vars": {
+                            "idx": {"$indexOfArray": [elem_ids, "$$elem._id"]}
+                        },
+                        "in": {
+                            "$cond": [{"$lt": ["$$idx", 0]}, "$$elem", value]
+                        },
+                    }
+                },
+            }
+        }
+
+        op = UpdateOne({"_id": _id}, [{"$set": {root: elems}}])
+        return op, True
+
+    update = {}
+    array_filters = []
+    for idx, (elem_id, value) in enumerate(zip(elem_ids, values)):
+        path = root + ".$[e%d]" % idx
+        if leaf:
+            path += "." + leaf
+
+        update[path] = value
+        array_filters.append({"e%d._id" % idx: elem_id})
+
+    op = UpdateOne({"_id": _id}, {"$set": update}, array_filters=array_filters)
+    return op, False
+
+
 def _export(
     sample_collection,
     export_dir=None,
@@ -10612,6 +11297,7 @@ def _export(
     label_field=None,
     frame_labels_field=None,
     overwrite=False,
+    num_workers=None,
     **kwargs,
 ):
     if dataset_type is None and dataset_exporter is None:
@@ -10683,6 +11369,7 @@ def _export(
         dataset_exporter=dataset_exporter,
         label_field=label_field,
         frame_labels_field=frame_labels_field,
+        num_workers=num_workers,
         **kwargs,
     )
 
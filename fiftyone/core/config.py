@@ -103,6 +103,12 @@ class FiftyOneConfig(EnvConfig):
         self.model_zoo_dir = self.parse_path(
             d, "model_zoo_dir", env_var="FIFTYONE_MODEL_ZOO_DIR", default=None
         )
+        self.embeddings_dir = self.parse_path(
+            d,
+            "embeddings_dir",
+            env_var="FIFTYONE_EMBEDDINGS_DIR",
+            default=None,
+        )
         self.module_path = self.parse_string_array(
             d,
             "module_path",
@@ -154,6 +160,12 @@ class FiftyOneConfig(EnvConfig):
             env_var="FIFTYONE_DEFAULT_BATCH_SIZE",
             default=None,
         )
+        self.default_save_batch_size = self.parse_number(
+            d,
+            "default_save_batch_size",
+            env_var="FIFTYONE_DEFAULT_SAVE_BATCH_SIZE",
+            default=None,
+        )
         self.default_sequence_idx = self.parse_string(
             d,
             "default_sequence_idx",
@@ -184,12 +196,30 @@ class FiftyOneConfig(EnvConfig):
             env_var="FIFTYONE_DEFAULT_APP_ADDRESS",
             default="localhost",
         )
+        self.app_metadata_cache_size = self.parse_int(
+            d,
+            "app_metadata_cache_size",
+            env_var="FIFTYONE_APP_METADATA_CACHE_SIZE",
+            default=10000,
+        )
+        self.app_metadata_writeback = self.parse_bool(
+            d,
+            "app_metadata_writeback",
+            env_var="FIFTYONE_APP_METADATA_WRITEBACK",
+            default=False,
+        )
         self.desktop_app = self.parse_bool(
             d,
             "desktop_app",
             env_var="FIFTYONE_DESKTOP_APP",
             default=False,
         )
+        self.lazy_import = self.parse_bool(
+            d,
+            "lazy_import",
+            env_var="FIFTYONE_LAZY_IMPORT",
+            default=False,
+        )
         self.logging_level = self.parse_string(
             d,
             "logging_level",
@@ -246,6 +276,17 @@ class FiftyOneConfig(EnvConfig):
         return super().custom_attributes(dynamic=True)
 
     def _init(self):
+        # Environment variables are always parsed as floats, but integer batch
+        # sizes have a different meaning than float latencies, so we respect
+        # the type that the user wrote
+        save_batch_size = os.environ.get("FIFTYONE_DEFAULT_SAVE_BATCH_SIZE")
+        if (
+            save_batch_size is not None
+            and "." not in save_batch_size
+            and self.default_save_batch_size.is_integer()
+        ):
+            self.default_save_batch_size = int(self.default_save_batch_size)
+
         if self.default_dataset_dir is None:
             self.default_dataset_dir = os.path.join(
                 os.path.expanduser("~"), "fiftyone"
@@ -259,6 +300,11 @@ class FiftyOneConfig(EnvConfig):
                 self.default_dataset_dir, "__models__"
             )
 
+        if self.embeddings_dir is None:
+            self.embeddings_dir = os.path.join(
+                self.default_dataset_dir, "__embeddings__"
+            )
+
         if self.plugins_dir is None:
             self.plugins_dir = os.path.join(
                 self.default_dataset_dir,
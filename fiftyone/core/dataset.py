@@ -9,14 +9,20 @@ from collections import defaultdict
 import contextlib
 from datetime import datetime
 import fnmatch
+import hashlib
 import itertools
 import logging
 import numbers
 import os
 import random
+import re
 import string
 
+from concurrent.futures import ThreadPoolExecutor
+
+import bson
 from bson import json_util, ObjectId, DBRef
+from bson.raw_bson import RawBSONDocument
 import cachetools
 from deprecated import deprecated
 import mongoengine.errors as moe
@@ -29,6 +35,7 @@ import eta.core.utils as etau
 import fiftyone as fo
 import fiftyone.constants as focn
 import fiftyone.core.collections as foc
+import fiftyone.core.embeddings as foem
 import fiftyone.core.expressions as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.frame as fofr
@@ -52,6 +59,9 @@ foud = fou.lazy_import("fiftyone.utils.data")
 
 logger = logging.getLogger(__name__)
 
+# Target encoded size of each batch of samples written when adding samples
+_INGEST_BATCH_SIZE_BYTES = 2**22
+
 
 def list_datasets(glob_patt=None, tags=None, info=False):
     """Lists the available FiftyOne datasets.
@@ -285,6 +295,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._brain_cache = cachetools.LRUCache(5)
         self._evaluation_cache = cachetools.LRUCache(5)
 
+        self._modification_count = 0
         self._deleted = False
 
         if not _virtual:
@@ -2461,30 +2472,60 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         Returns:
             a list of IDs of the samples in the dataset
         """
+        return self._add_samples(
+            samples,
+            expand_schema=expand_schema,
+            dynamic=dynamic,
+            validate=validate,
+            num_samples=num_samples,
+        )
+
+    def _add_samples(
+        self,
+        samples,
+        expand_schema=True,
+        dynamic=False,
+        validate=True,
+        num_samples=None,
+        attach_samples=True,
+    ):
+        # When `attach_samples=False`, the caller only needs the IDs of the
+        # added samples, so we skip the (expensive) construction of backing
+        # documents for the input sample instances
         if num_samples is None:
             try:
                 num_samples = len(samples)
             except:
                 pass
 
-        # Dynamically size batches so that they are as large as possible while
-        # still achieving a nice frame rate on the progress bar
-        batcher = fou.DynamicBatcher(
-            samples,
-            target_latency=0.2,
-            init_batch_size=1,
-            max_batch_beta=2.0,
-            progress=True,
-            total=num_samples,
-        )
+        batcher = self._make_ingest_batcher(samples, num_samples)
 
+        # Samples are prepared and encoded in the main thread while the
+        # previous batch is being inserted in a background thread
         sample_ids = []
-        with batcher:
-            for batch in batcher:
-                _ids = self._add_samples_batch(
-                    batch, expand_schema, dynamic, validate
-                )
-                sample_ids.extend(_ids)
+        pending = None
+        with batcher, ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                for batch in batcher:
+                    samples, dicts, docs = self._prepare_samples_batch(
+                        batch, expand_schema, dynamic, validate
+                    )
+                    batcher.record_size(sum(len(d.raw) for d in docs))
+
+                    if pending is not None:
+                        sample_ids.extend(self._finish_samples_batch(*pending))
+                        pending = None
+
+                    future = executor.submit(self._insert_samples_docs, docs)
+                    pending = (future, samples, dicts, attach_samples)
+
+                if pending is not None:
+                    sample_ids.extend(self._finish_samples_batch(*pending))
+                    pending = None
+            finally:
+                # Ensure that in-memory samples reflect any successful inserts
+                if pending is not None and not pending[0].exception():
+                    self._finish_samples_batch(*pending)
 
         return sample_ids
 
@@ -2535,7 +2576,31 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         )
         return self.skip(num_samples).values("id")
 
+    def _make_ingest_batcher(self, samples, num_samples):
+        # Dynamically size batches so that their encoded size is as large as
+        # possible without exceeding reasonable request sizes, starting from
+        # the batch size learned by previous calls for this collection
+        return fou.DynamicBatcher(
+            samples,
+            init_batch_size=1,
+            max_batch_size=100000,  # mongodb limit
+            max_batch_beta=8.0,
+            progress=True,
+            total=num_samples,
+            target_size_bytes=_INGEST_BATCH_SIZE_BYTES,
+            warm_start_key=self._sample_collection_name,
+        )
+
     def _add_samples_batch(self, samples, expand_schema, dynamic, validate):
+        samples, dicts, docs = self._prepare_samples_batch(
+            samples, expand_schema, dynamic, validate
+        )
+        self._insert_samples_docs(docs)
+        return self._finish_samples_batch(None, samples, dicts)
+
+    def _prepare_samples_batch(
+        self, samples, expand_schema, dynamic, validate
+    ):
         samples = [s.copy() if s._in_db else s for s in samples]
 
         if self.media_type is None and samples:
@@ -2547,16 +2612,42 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if validate:
             self._validate_samples(samples)
 
-        dicts = [self._make_dict(sample) for sample in samples]
+        array_fields = self._get_encoded_array_fields()
+        dicts = []
+        for sample in samples:
+            d = self._make_dict(sample, array_fields=array_fields)
+            d["_id"] = ObjectId()
+            dicts.append(d)
+
+        docs = self._encode_docs(dicts)
+
+        return samples, dicts, docs
 
+    def _encode_docs(self, dicts):
+        codec_options = self._sample_collection.codec_options
+        return [
+            RawBSONDocument(bson.encode(d, codec_options=codec_options))
+            for d in dicts
+        ]
+
+    def _insert_samples_docs(self, docs):
         try:
-            # adds `_id` to each dict
-            self._sample_collection.insert_many(dicts)
+            self._sample_collection.insert_many(docs)
         except BulkWriteError as bwe:
             msg = bwe.details["writeErrors"][0]["errmsg"]
             raise ValueError(msg) from bwe
+        finally:
+            self._mark_modified()
+
+    def _finish_samples_batch(self, future, samples, dicts, attach=True):
+        if future is not None:
+            future.result()
 
         for sample, d in zip(samples, dicts):
+            # Video samples must always be attached to save their frames
+            if not attach and sample.media_type != fom.VIDEO:
+                continue
+
             doc = self._sample_dict_to_doc(d)
             sample._set_backing_doc(doc, dataset=self)
             if sample.media_type == fom.VIDEO:
@@ -2578,23 +2669,46 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             except:
                 pass
 
-        # Dynamically size batches so that they are as large as possible while
-        # still achieving a nice frame rate on the progress bar
-        batcher = fou.DynamicBatcher(
-            samples,
-            target_latency=0.2,
-            init_batch_size=1,
-            max_batch_beta=2.0,
-            progress=True,
-        )
+        batcher = self._make_ingest_batcher(samples, num_samples)
 
-        with batcher:
-            for batch in batcher:
-                self._upsert_samples_batch(
-                    batch, expand_schema, dynamic, validate
-                )
+        # Samples are prepared and encoded in the main thread while the
+        # previous batch is being written in a background thread
+        pending = None
+        with batcher, ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                for batch in batcher:
+                    samples, dicts, docs = self._prepare_upsert_batch(
+                        batch, expand_schema, dynamic, validate
+                    )
+                    batcher.record_size(sum(len(d.raw) for d in docs))
+
+                    if pending is not None:
+                        self._finish_upsert_batch(*pending)
+                        pending = None
+
+                    future = executor.submit(
+                        self._write_upsert_docs, samples, docs
+                    )
+                    pending = (future, samples, dicts)
+
+                if pending is not None:
+                    self._finish_upsert_batch(*pending)
+                    pending = None
+            finally:
+                # Ensure that in-memory samples reflect any successful writes
+                if pending is not None and not pending[0].exception():
+                    self._finish_upsert_batch(*pending)
 
     def _upsert_samples_batch(self, samples, expand_schema, dynamic, validate):
+        samples, dicts, docs = self._prepare_upsert_batch(
+            samples, expand_schema, dynamic, validate
+        )
+        self._write_upsert_docs(samples, docs)
+        self._finish_upsert_batch(None, samples, dicts)
+
+    def _prepare_upsert_batch(self, samples, expand_schema, dynamic, validate):
+        samples = list(samples)
+
         if self.media_type is None and samples:
             self.media_type = _get_media_type(samples[0])
 
@@ -2604,19 +2718,38 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if validate:
             self._validate_samples(samples)
 
+        array_fields = self._get_encoded_array_fields()
+
         dicts = []
-        ops = []
         for sample in samples:
-            d = self._make_dict(sample, include_id=True)
+            d = self._make_dict(
+                sample, include_id=True, array_fields=array_fields
+            )
+            if not sample.id:
+                d["_id"] = ObjectId()
+
             dicts.append(d)
 
+        docs = self._encode_docs(dicts)
+
+        return samples, dicts, docs
+
+    def _write_upsert_docs(self, samples, docs):
+        ops = []
+        for sample, doc in zip(samples, docs):
             if sample.id:
-                ops.append(ReplaceOne({"_id": sample._id}, d, upsert=True))
+                ops.append(ReplaceOne({"_id": sample._id}, doc, upsert=True))
             else:
-                d.pop("_id", None)
-                ops.append(InsertOne(d))  # adds `_id` to dict
+                ops.append(InsertOne(doc))
+
+        try:
+            foo.bulk_write(ops, self._sample_collection, ordered=False)
+        finally:
+            self._mark_modified()
 
-        foo.bulk_write(ops, self._sample_collection, ordered=False)
+    def _finish_upsert_batch(self, future, samples, dicts):
+        if future is not None:
+            future.result()
 
         for sample, d in zip(samples, dicts):
             doc = self._sample_dict_to_doc(d)
@@ -2625,8 +2758,34 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             if sample.media_type == fom.VIDEO:
                 sample.frames.save()
 
-    def _make_dict(self, sample, include_id=False):
-        d = sample.to_mongo_dict(include_id=include_id)
+    def _get_encoded_array_fields(self):
+        return {
+            field_name: field
+            for field_name, field in self.get_field_schema().items()
+            if isinstance(field, (fof.VectorField, fof.ArrayField))
+            and field.encoding not in (None, "zlib")
+            and field.db_field in (None, field_name)
+        }
+
+    def _make_dict(self, sample, include_id=False, array_fields=None):
+        if array_fields and not sample._in_db:
+            # Serialize arrays directly with the encodings declared by our
+            # schema
+            d = sample._doc.to_dict(fields=array_fields)
+            if not include_id:
+                d.pop("_id", None)
+        else:
+            d = sample.to_mongo_dict(include_id=include_id)
+
+            # Samples from other datasets serialize arrays with the encodings
+            # of their own dataset's schema
+            if array_fields:
+                schema = sample._dataset.get_field_schema()
+                for field_name, field in array_fields.items():
+                    if field_name in d and _get_array_encoding(
+                        schema.get(field_name, None)
+                    ) != _get_array_encoding(field):
+                        d[field_name] = field.to_mongo(sample[field_name])
 
         # We omit None here to allow samples with None-valued new fields to
         # be added without raising nonexistent field errors. This is safe
@@ -2644,6 +2803,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             coll = self._sample_collection
 
         foo.bulk_write(ops, coll, ordered=ordered)
+        self._mark_modified()
 
         if frames:
             fofr.Frame._reload_docs(self._frame_collection_name)
@@ -3193,6 +3353,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             else:
                 sample_ops.extend(ops)
 
+        if sample_ops or frame_ops:
+            self._mark_modified()
+
         if sample_ops:
             foo.bulk_write(sample_ops, self._sample_collection)
             fos.Sample._reload_docs(self._sample_collection_name)
@@ -3296,6 +3459,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                                 )
                             )
 
+        if sample_ops or frame_ops:
+            self._mark_modified()
+
         if sample_ops:
             foo.bulk_write(sample_ops, self._sample_collection)
 
@@ -3709,6 +3875,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             d = {}
 
         self._sample_collection.delete_many(d)
+        self._mark_modified()
+
         fos.Sample._reset_docs(
             self._sample_collection_name, sample_ids=sample_ids
         )
@@ -3798,6 +3966,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             self._frame_collection.delete_many(
                 {"_id": {"$in": [ObjectId(_id) for _id in frame_ids]}}
             )
+            self._mark_modified()
+
             fofr.Frame._reset_docs_by_frame_id(
                 self._frame_collection_name, frame_ids
             )
@@ -3815,6 +3985,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             d = {}
 
         self._frame_collection.delete_many(d)
+        self._mark_modified()
+
         fofr.Frame._reset_docs(
             self._frame_collection_name, sample_ids=sample_ids
         )
@@ -3839,6 +4011,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     }
                 }
             )
+            self._mark_modified()
+
             fofr.Frame._reset_docs_by_frame_id(
                 self._frame_collection_name, frame_ids, keep=True
             )
@@ -3867,6 +4041,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             return
 
         foo.bulk_write(ops, self._frame_collection)
+        self._mark_modified()
+
         for sample_id, fns in zip(sample_ids, frame_numbers):
             fofr.Frame._reset_docs_for_sample(
                 self._frame_collection_name, sample_id, fns, keep=True
@@ -3943,6 +4119,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         # Update singleton
         self._instances.pop(self._doc.name, None)
 
+        foem.delete_all_embeddings(self)
+
+        # Delete any cached datasets generated from this dataset, as well as
+        # the fingerprints of the source samples of this dataset, if any
+        _delete_cached_datasets(self)
+        _get_sources_collection(self).drop()
+
         _delete_dataset_doc(self._doc)
         self._deleted = True
 
@@ -6549,7 +6732,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._brain_cache.clear()
         self._evaluation_cache.clear()
 
+    def _mark_modified(self):
+        # Invalidates any pipelines/counts cached by views into this dataset
+        self._modification_count += 1
+
     def _reload(self, hard=False):
+        self._mark_modified()
+
         if not hard:
             self._doc.reload()
             return
@@ -6575,6 +6764,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._update_last_loaded_at()
 
     def _reload_docs(self, hard=False):
+        self._mark_modified()
+
         fos.Sample._reload_docs(self._sample_collection_name, hard=hard)
 
         if self._has_frame_fields():
@@ -6718,6 +6909,262 @@ def _create_indexes(sample_collection_name, frame_collection_name):
         )
 
 
+def _load_cached_dataset(
+    sample_collection, key, make_dataset, link_field=None
+):
+    """Loads the persistent generated dataset for the given collection and
+    key, creating it or incrementally updating it as necessary.
+
+    A fingerprint of each source sample is stored alongside the generated
+    dataset so that, on subsequent loads, only the generated samples whose
+    source samples have been added, modified, or deleted since the last load
+    need to be regenerated.
+
+    Args:
+        sample_collection: the source
+            :class:`fiftyone.core.collections.SampleCollection`
+        key: a JSON-serializable key describing how the generated dataset is
+            constructed from ``sample_collection``
+        make_dataset: a function that accepts a sample collection and returns
+            a new non-persistent generated dataset for it
+        link_field (None): the field of the generated samples that contains
+            the ID of their source sample. If not provided, any change to the
+            source collection causes the generated dataset to be regenerated
+            from scratch
+
+    Returns:
+        a :class:`Dataset`
+    """
+    src_dataset = sample_collection._dataset
+
+    schema = {
+        k: str(v) for k, v in sample_collection.get_field_schema().items()
+    }
+    if sample_collection._has_frame_fields():
+        frame_schema = sample_collection.get_frame_field_schema()
+        schema["frames"] = {k: str(v) for k, v in frame_schema.items()}
+
+    prefix = "%s-cache-%s-" % (src_dataset._doc.id, _hash(key))
+    name = prefix + _hash(schema)
+
+    if not dataset_exists(name):
+        # Delete any caches generated for a previous source schema
+        _delete_cached_datasets(src_dataset, prefix=prefix)
+        return _make_cached_dataset(sample_collection, name, make_dataset)
+
+    dataset = load_dataset(name)
+
+    sources = _get_sources_collection(dataset)
+    stored = {d["_id"]: d["hash"] for d in sources.find({})}
+    current = _get_source_fingerprints(sample_collection)
+
+    changed = [_id for _id, h in current.items() if stored.get(_id) != h]
+    removed = [_id for _id in stored.keys() if _id not in current]
+
+    if not changed and not removed:
+        return dataset
+
+    # Regenerating from scratch is cheaper than large incremental updates
+    if link_field is None or 2 * (len(changed) + len(removed)) > len(current):
+        dataset.delete()
+        return _make_cached_dataset(sample_collection, name, make_dataset)
+
+    logger.info(
+        "Updating cached dataset for %d added/modified and %d deleted source "
+        "samples...",
+        len(changed),
+        len(removed),
+    )
+
+    if changed:
+        tmp_dataset = make_dataset(sample_collection.select(changed))
+    else:
+        tmp_dataset = None
+
+    try:
+        if tmp_dataset is not None:
+            tmp_ids = [
+                d["_id"]
+                for d in tmp_dataset._sample_collection.find({}, {"_id": True})
+            ]
+            num_existing = dataset._sample_collection.count_documents(
+                {"_id": {"$in": tmp_ids}}
+            )
+
+            # Existing samples are replaced in-place, while new samples are
+            # appended, so the generated dataset must be re-sorted below if
+            # any samples are inserted
+            tmp_dataset._sample_collection.aggregate(
+                [
+                    {"$addFields": {"_dataset_id": dataset._doc.id}},
+                    {
+                        "$merge": {
+                            "into": dataset._sample_collection_name,
+                            "on": "_id",
+                            "whenMatched": "replace",
+                            "whenNotMatched": "insert",
+                        }
+                    },
+                ],
+                allowDiskUse=True,
+            )
+            keep_ids = set(tmp_ids)
+        else:
+            tmp_ids = []
+            num_existing = 0
+            keep_ids = set()
+
+        for batch in fou.iter_batches(changed + removed, 100000):
+            del_ids = [
+                d["_id"]
+                for d in dataset._sample_collection.find(
+                    {link_field: {"$in": list(batch)}}, {"_id": True}
+                )
+                if d["_id"] not in keep_ids
+            ]
+            if del_ids:
+                dataset._sample_collection.delete_many(
+                    {"_id": {"$in": del_ids}}
+                )
+
+        if num_existing < len(tmp_ids):
+            _sort_cached_samples(dataset, list(current), tmp_ids, link_field)
+    finally:
+        if tmp_dataset is not None:
+            tmp_dataset.delete()
+
+    # Fingerprints are only updated once the generated samples have been, so
+    # that an interrupted update is retried on the next load
+    for batch in fou.iter_batches(removed, 100000):
+        sources.delete_many({"_id": {"$in": list(batch)}})
+
+    if changed:
+        _write_source_fingerprints(
+            dataset, sample_collection.select(changed), merge=True
+        )
+
+    dataset._reload_docs(hard=True)
+
+    return dataset
+
+
+def _sort_cached_samples(dataset, src_ids, tmp_ids, link_field):
+    # Generated samples are sorted by the order of their source samples and
+    # then by their order within the dataset that generated them, which is
+    # the order that a regenerated dataset would have
+    src_index = {_id: idx for idx, _id in enumerate(src_ids)}
+    tmp_index = {_id: idx for idx, _id in enumerate(tmp_ids)}
+
+    keys = {}
+    for idx, d in enumerate(
+        dataset._sample_collection.find({}, {link_field: True})
+    ):
+        _id = d["_id"]
+        keys[_id] = (src_index[d[link_field]], tmp_index.get(_id, idx))
+
+    ids = sorted(keys, key=keys.get)
+
+    conn = foo.get_db_conn()
+    order_collection = conn["order." + dataset._sample_collection_name]
+    order_collection.drop()
+
+    try:
+        for batch in fou.iter_batches(enumerate(ids), 100000):
+            order_collection.insert_many(
+                [{"_id": _id, "_order": idx} for idx, _id in batch]
+            )
+
+        # $out replaces the collection atomically and retains its indexes
+        order_collection.aggregate(
+            [
+                {"$sort": {"_order": 1}},
+                {
+                    "$lookup": {
+                        "from": dataset._sample_collection_name,
+                        "localField": "_id",
+                        "foreignField": "_id",
+                        "as": "doc",
+                    }
+                },
+                {"$replaceRoot": {"newRoot": {"$first": "$doc"}}},
+                {"$out": dataset._sample_collection_name},
+            ],
+            allowDiskUse=True,
+        )
+    finally:
+        order_collection.drop()
+
+
+def _make_cached_dataset(sample_collection, name, make_dataset):
+    dataset = make_dataset(sample_collection)
+    dataset.name = name
+    dataset.persistent = True
+
+    # Fingerprints are computed after generation, since generating some
+    # datasets, e.g., sampling frames, writes to the source collection
+    _write_source_fingerprints(dataset, sample_collection)
+
+    return dataset
+
+
+def _hash(obj):
+    s = json_util.dumps(obj, sort_keys=True)
+    return hashlib.sha1(s.encode()).hexdigest()[:16]
+
+
+def _get_sources_collection(dataset):
+    conn = foo.get_db_conn()
+    return conn["sources." + dataset._sample_collection_name]
+
+
+def _fingerprint_pipeline():
+    return [{"$project": {"hash": {"$toHashedIndexKey": "$$ROOT"}}}]
+
+
+def _get_source_fingerprints(sample_collection):
+    return {
+        d["_id"]: d["hash"]
+        for d in sample_collection._aggregate(
+            attach_frames=sample_collection._has_frame_fields(),
+            post_pipeline=_fingerprint_pipeline(),
+        )
+    }
+
+
+def _write_source_fingerprints(dataset, sample_collection, merge=False):
+    sources = _get_sources_collection(dataset)
+
+    if merge:
+        out = {
+            "$merge": {
+                "into": sources.name,
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        }
+    else:
+        out = {"$out": sources.name}
+
+    sample_collection._aggregate(
+        attach_frames=sample_collection._has_frame_fields(),
+        post_pipeline=_fingerprint_pipeline() + [out],
+    )
+
+
+def _delete_cached_datasets(dataset, prefix=None):
+    if prefix is None:
+        prefix = "%s-cache-" % dataset._doc.id
+
+    conn = foo.get_db_conn()
+    query = {"name": {"$regex": "^" + re.escape(prefix)}}
+    for name in conn.datasets.find(query).distinct("name"):
+        try:
+            load_dataset(name).delete()
+        except:
+            logger.warning("Failed to delete cached dataset '%s'", name)
+
+
 def _create_group_indexes(sample_collection_name, group_field):
     conn = foo.get_db_conn()
 
@@ -8315,6 +8762,10 @@ def _finalize_frames(sample_collection, key_field, frame_key_field):
     foo.bulk_write(ops, frame_coll)
 
 
+def _get_array_encoding(field):
+    return getattr(field, "encoding", None) or "zlib"
+
+
 def _get_media_type(sample):
     for field, value in sample.iter_fields():
         if isinstance(value, fog.Group):
@@ -0,0 +1,359 @@
+"""
+Memory-mapped embeddings side-store.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+
+import numpy as np
+
+import eta.core.serial as etas
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.labels as fol
+
+
+logger = logging.getLogger(__name__)
+
+
+_EMBEDDINGS_FILENAME = "embeddings.bin"
+_IDS_FILENAME = "ids.npy"
+_INFO_FILENAME = "info.json"
+_ID_DTYPE = "<U24"
+
+
+def list_embeddings(sample_collection):
+    """Returns the keys of all embeddings in the side-store of the given
+    collection's dataset.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+
+    Returns:
+        a list of embeddings keys
+    """
+    dataset_dir = _get_dataset_dir(sample_collection)
+    if not os.path.isdir(dataset_dir):
+        return []
+
+    return sorted(
+        key
+        for key in os.listdir(dataset_dir)
+        if os.path.isfile(os.path.join(dataset_dir, key, _INFO_FILENAME))
+    )
+
+
+def has_embeddings(sample_collection, key):
+    """Determines whether the side-store of the given collection's dataset
+    contains embeddings with the given key.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        key: an embeddings key
+
+    Returns:
+        True/False
+    """
+    info_path = os.path.join(
+        _get_embeddings_dir(sample_collection, key), _INFO_FILENAME
+    )
+    return os.path.isfile(info_path)
+
+
+def save_embeddings(sample_collection, key, embeddings, label_field=None):
+    """Writes the given embeddings to the memory-mapped side-store of the
+    collection's dataset under the given key.
+
+    Embeddings are stored as a single ``num_embeddings x num_dims`` matrix on
+    disk along with an index of the sample or label IDs of each row, so that
+    they can be efficiently loaded for any view into the dataset via
+    :func:`load_embeddings`.
+
+    Any existing embeddings with the same key are overwritten.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        key: an embeddings key
+        embeddings: the embeddings to save. If no ``label_field`` is provided,
+            this can be a ``num_samples x num_dims`` array or a list of
+            ``num_samples`` embeddings, where ``None`` entries are stored as
+            ``nan`` rows. If a ``label_field`` is provided, this must be a
+            dict mapping sample IDs to ``num_labels x num_dims`` arrays of
+            embeddings for the labels in ``label_field`` of each sample, as
+            returned by
+            :meth:`fiftyone.core.collections.SampleCollection.compute_patch_embeddings`
+        label_field (None): the name of a label field whose label IDs the
+            embeddings correspond to. Must be of type
+            :class:`fiftyone.core.labels.Detection`,
+            :class:`fiftyone.core.labels.Detections`,
+            :class:`fiftyone.core.labels.Polyline`, or
+            :class:`fiftyone.core.labels.Polylines`
+    """
+    _validate_key(key)
+
+    if label_field is not None:
+        ids, embeddings = _parse_label_embeddings(
+            sample_collection, label_field, embeddings
+        )
+    else:
+        if isinstance(embeddings, dict):
+            raise ValueError(
+                "Only sample-level embeddings can be stored without a "
+                "`label_field`; found %s" % type(embeddings)
+            )
+
+        ids = sample_collection.values("id")
+        if len(embeddings) != len(ids):
+            raise ValueError(
+                "Expected %d embeddings but found %d"
+                % (len(ids), len(embeddings))
+            )
+
+    ids = np.array(ids, dtype=_ID_DTYPE)
+    dtype, num_dims = _parse_embeddings(embeddings)
+
+    embeddings_dir = _get_embeddings_dir(sample_collection, key)
+    etau.delete_dir(embeddings_dir)
+    etau.ensure_dir(embeddings_dir)
+
+    embeddings_path = os.path.join(embeddings_dir, _EMBEDDINGS_FILENAME)
+    with open(embeddings_path, "wb") as f:
+        if isinstance(embeddings, np.ndarray):
+            np.ascontiguousarray(embeddings, dtype=dtype).tofile(f)
+        else:
+            nan_row = np.full(num_dims, np.nan, dtype=dtype)
+            for embedding in embeddings:
+                if embedding is None:
+                    embedding = nan_row
+
+                np.asarray(embedding, dtype=dtype).tofile(f)
+
+    np.save(os.path.join(embeddings_dir, _IDS_FILENAME), ids)
+
+    # Written last, since its presence marks the embeddings as complete
+    info = {
+        "dtype": np.dtype(dtype).str,
+        "shape": [len(ids), num_dims],
+        "label_field": label_field,
+    }
+    etas.write_json(info, os.path.join(embeddings_dir, _INFO_FILENAME))
+
+
+def load_embeddings(sample_collection, key):
+    """Loads the embeddings with the given key from the side-store of the
+    collection's dataset.
+
+    The returned embeddings are aligned with the order of the samples (or
+    labels, for patch embeddings) in the collection. When the collection's
+    samples correspond to a contiguous block of stored embeddings, e.g., when
+    loading embeddings for the entire dataset, the returned array is a
+    read-only memory-mapped view that does not read any data into memory until
+    it is accessed. Otherwise, only the relevant rows are loaded into memory.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        key: an embeddings key
+
+    Returns:
+        a ``num_embeddings x num_dims`` array
+
+    Raises:
+        ValueError: if the embeddings do not exist or if any samples/labels in
+            the collection have no stored embeddings
+    """
+    embeddings_dir = _get_embeddings_dir(sample_collection, key)
+    info_path = os.path.join(embeddings_dir, _INFO_FILENAME)
+    if not os.path.isfile(info_path):
+        raise ValueError(
+            "%s has no embeddings with key '%s'"
+            % (sample_collection.__class__.__name__, key)
+        )
+
+    info = etas.read_json(info_path)
+    dtype = np.dtype(info["dtype"])
+    shape = tuple(info["shape"])
+    label_field = info.get("label_field", None)
+
+    ids = np.load(os.path.join(embeddings_dir, _IDS_FILENAME))
+
+    if label_field is not None:
+        id_path = _get_label_ids_path(sample_collection, label_field)
+        view_ids = sample_collection.values(id_path, unwind=True)
+    else:
+        view_ids = sample_collection.values("id")
+
+    view_ids = np.array(view_ids, dtype=_ID_DTYPE)
+    rows = _get_rows(ids, view_ids, key)
+
+    if shape[0] * shape[1] == 0:
+        embeddings = np.empty(shape, dtype=dtype)
+    else:
+        embeddings = np.memmap(
+            os.path.join(embeddings_dir, _EMBEDDINGS_FILENAME),
+            dtype=dtype,
+            mode="r",
+            shape=shape,
+        )
+
+    return embeddings[rows]
+
+
+def delete_embeddings(sample_collection, key):
+    """Deletes the embeddings with the given key from the side-store of the
+    collection's dataset.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        key: an embeddings key
+    """
+    etau.delete_dir(_get_embeddings_dir(sample_collection, key))
+
+
+def delete_all_embeddings(sample_collection):
+    """Deletes all embeddings in the side-store of the collection's dataset.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+    """
+    etau.delete_dir(_get_dataset_dir(sample_collection))
+
+
+def _get_dataset_dir(sample_collection):
+    dataset = sample_collection._root_dataset
+    return os.path.join(fo.config.embeddings_dir, str(dataset._doc.id))
+
+
+def _get_embeddings_dir(sample_collection, key):
+    _validate_key(key)
+    return os.path.join(_get_dataset_dir(sample_collection), key)
+
+
+def _validate_key(key):
+    if not key or not isinstance(key, str) or os.path.basename(key) != key:
+        raise ValueError("Invalid embeddings key '%s'" % key)
+
+    if key.startswith("."):
+        raise ValueError("Embeddings keys cannot start with '.'")
+
+
+def _parse_embeddings(embeddings):
+    if isinstance(embeddings, np.ndarray):
+        if embeddings.ndim != 2:
+            raise ValueError(
+                "Expected a 2D array of embeddings; found shape %s"
+                % (embeddings.shape,)
+            )
+
+        return embeddings.dtype, embeddings.shape[1]
+
+    dtype = None
+    num_dims = 0
+    for embedding in embeddings:
+        if embedding is not None:
+            embedding = np.asarray(embedding)
+            dtype = embedding.dtype
+            num_dims = embedding.size
+            break
+
+    has_missing = any(e is None for e in embeddings)
+
+    if dtype is None or (
+        has_missing and not np.issubdtype(dtype, np.floating)
+    ):
+        dtype = np.dtype(float)
+
+    return dtype, num_dims
+
+
+def _parse_label_embeddings(sample_collection, label_field, embeddings_dict):
+    if not isinstance(embeddings_dict, dict):
+        raise ValueError(
+            "Expected a dict mapping sample IDs to label embeddings; found %s"
+            % type(embeddings_dict)
+        )
+
+    id_path = _get_label_ids_path(sample_collection, label_field)
+    sample_ids, label_ids = sample_collection.values(["id", id_path])
+
+    ids = []
+    embeddings = []
+    for sample_id, _label_ids in zip(sample_ids, label_ids):
+        _embeddings = embeddings_dict.get(sample_id, None)
+        if _embeddings is None or not _label_ids:
+            continue
+
+        if not isinstance(_label_ids, list):
+            _label_ids = [_label_ids]
+
+        # Embeddings that don't correspond to labels, e.g., those generated
+        # with `handle_missing="image"`, cannot be stored
+        if len(_embeddings) != len(_label_ids):
+            continue
+
+        ids.extend(_label_ids)
+        embeddings.extend(_embeddings)
+
+    return ids, embeddings
+
+
+def _get_label_ids_path(sample_collection, label_field):
+    label_type, id_path = sample_collection._get_label_field_path(
+        label_field, "id"
+    )
+
+    if sample_collection._is_frame_field(id_path):
+        raise ValueError("Frame-level embeddings are not supported")
+
+    if not issubclass(
+        label_type,
+        (fol.Detection, fol.Detections, fol.Polyline, fol.Polylines),
+    ):
+        raise ValueError(
+            "Field '%s' must be a %s type; found %s"
+            % (
+                label_field,
+                (fol.Detection, fol.Detections, fol.Polyline, fol.Polylines),
+                label_type,
+            )
+        )
+
+    return id_path
+
+
+def _get_rows(ids, view_ids, key):
+    if len(view_ids) == len(ids) and np.array_equal(view_ids, ids):
+        return slice(None)
+
+    if len(view_ids) == 0:
+        return slice(0, 0)
+
+    if len(ids) == 0:
+        found = np.zeros(len(view_ids), dtype=bool)
+    else:
+        order = np.argsort(ids)
+        inds = np.searchsorted(ids, view_ids, sorter=order)
+        rows = order[np.minimum(inds, len(ids) - 1)]
+        found = ids[rows] == view_ids
+
+    if not found.all():
+        raise ValueError(
+            "%d samples/labels in the collection have no embeddings with key "
+            "'%s'" % (np.count_nonzero(~found), key)
+        )
+
+    # Contiguous rows can be returned as a (zero-copy) slice
+    first = rows[0]
+    if rows[-1] - first + 1 == len(rows) and np.all(np.diff(rows) == 1):
+        return slice(first, first + len(rows))
+
+    return rows
@@ -955,24 +955,40 @@ class VectorField(mongoengine.fields.BinaryField, Field):
 
     :class:`VectorField` instances accept numeric lists, tuples, and 1D numpy
     array values. The underlying data is serialized and stored in the database
-    as zlib-compressed bytes generated by ``numpy.save`` and always retrieved
-    as a numpy array.
+    as bytes in the specified ``encoding`` and always retrieved as a numpy
+    array.
+
+    By default, arrays are stored as zlib-compressed bytes generated by
+    ``numpy.save``. For incompressible data like float embeddings, the
+    ``"raw"`` encoding avoids compression entirely and allows arrays to be
+    loaded without copying their data. See
+    :func:`fiftyone.core.utils.serialize_numpy_array` for details.
+
+    Note that, as a consequence, arrays loaded from ``"raw"``-encoded values
+    are read-only views into the stored bytes. To modify such an array
+    in-place, first make a copy of it via ``array.copy()``.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        encoding (None): an optional encoding to use when storing arrays. The
+            supported values are ``("zlib", "none", "raw", "lz4")``. The
+            default is ``"zlib"``. Values stored in any encoding can always be
+            read, regardless of this setting
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(self, description=None, info=None, encoding=None, **kwargs):
+        _validate_array_encoding(encoding)
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self.encoding = encoding
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_numpy_array(value, encoding=self.encoding)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -999,24 +1015,38 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
     """An n-dimensional array field.
 
     :class:`ArrayField` instances accept numpy array values. The underlying
-    data is serialized and stored in the database as zlib-compressed bytes
-    generated by ``numpy.save`` and always retrieved as a numpy array.
+    data is serialized and stored in the database as bytes in the specified
+    ``encoding`` and always retrieved as a numpy array.
+
+    By default, arrays are stored as zlib-compressed bytes generated by
+    ``numpy.save``. See :func:`fiftyone.core.utils.serialize_numpy_array` for
+    the available encodings.
+
+    Arrays loaded from values stored with the ``"raw"`` encoding are read-only,
+    since they are views into the stored bytes rather than copies. Use
+    ``array.copy()`` to obtain an array that can be modified in-place.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        encoding (None): an optional encoding to use when storing arrays. The
+            supported values are ``("zlib", "none", "raw", "lz4")``. The
+            default is ``"zlib"``. Values stored in any encoding can always be
+            read, regardless of this setting
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(self, description=None, info=None, encoding=None, **kwargs):
+        _validate_array_encoding(encoding)
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self.encoding = encoding
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_numpy_array(value, encoding=self.encoding)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -1030,6 +1060,14 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
             self.error("Only numpy arrays may be used in an array field")
 
 
+def _validate_array_encoding(encoding):
+    if encoding is not None and encoding not in fou.NUMPY_ARRAY_ENCODINGS:
+        raise ValueError(
+            "Unsupported array encoding '%s'; supported values are %s"
+            % (encoding, fou.NUMPY_ARRAY_ENCODINGS)
+        )
+
+
 class FrameNumberField(IntField):
     """A video frame number field.
 
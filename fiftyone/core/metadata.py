@@ -8,8 +8,10 @@ Metadata stored in dataset samples.
 import itertools
 import logging
 import multiprocessing
+import multiprocessing.dummy
 import os
 import requests
+import timeit
 
 from PIL import Image
 
@@ -24,6 +26,8 @@ import fiftyone.core.utils as fou
 
 logger = logging.getLogger(__name__)
 
+_WRITE_BATCH_SIZE = 1000
+
 
 class Metadata(DynamicEmbeddedDocument):
     """Base class for storing metadata about generic samples.
@@ -229,21 +233,34 @@ def compute_sample_metadata(sample, overwrite=False, skip_failures=False):
 
 
 def compute_metadata(
-    sample_collection, overwrite=False, num_workers=None, skip_failures=True
+    sample_collection,
+    overwrite=False,
+    num_workers=None,
+    skip_failures=True,
+    use_threads=False,
 ):
     """Populates the ``metadata`` field of all samples in the collection.
 
     Any samples with existing metadata are skipped, unless
     ``overwrite == True``.
 
+    Metadata is computed by reading only the headers of the media files
+    whenever possible, and the results are written to the database in
+    batches.
+
     Args:
         sample_collection: a
             :class:`fiftyone.core.collections.SampleCollection`
         overwrite (False): whether to overwrite existing metadata
-        num_workers (None): the number of processes to use. By default,
+        num_workers (None): the number of processes (or threads, when
+            ``use_threads`` is True) to use. By default,
             ``multiprocessing.cpu_count()`` is used
         skip_failures (True): whether to gracefully continue without raising an
             error if metadata cannot be computed for a sample
+        use_threads (False): whether to use a thread pool rather than a
+            process pool to compute metadata. Threads are a good choice when
+            computing metadata is I/O-bound, e.g., for remote or network
+            filesystem media
     """
     if num_workers is None:
         num_workers = multiprocessing.cpu_count()
@@ -260,6 +277,7 @@ def compute_metadata(
             sample_collection,
             num_workers,
             overwrite=overwrite,
+            use_threads=use_threads,
         )
 
     num_missing = len(sample_collection.exists("metadata", False))
@@ -290,20 +308,48 @@ def get_image_info(f):
 
 
 def _compute_metadata(sample_collection, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
+    inputs = _get_metadata_inputs(sample_collection, overwrite=overwrite)
+    num_samples = len(inputs)
 
-    num_samples = len(sample_collection)
     if num_samples == 0:
         return
 
     logger.info("Computing metadata...")
+    start_time = timeit.default_timer()
+
     with fou.ProgressBar(total=num_samples) as pb:
-        for sample in pb(sample_collection.select_fields()):
-            compute_sample_metadata(sample, skip_failures=True)
+        results = map(_do_compute_metadata, inputs)
+        _write_metadata(sample_collection, results, pb)
+
+    _log_throughput(num_samples, start_time)
 
 
-def _compute_metadata_multi(sample_collection, num_workers, overwrite=False):
+def _compute_metadata_multi(
+    sample_collection, num_workers, overwrite=False, use_threads=False
+):
+    inputs = _get_metadata_inputs(sample_collection, overwrite=overwrite)
+    num_samples = len(inputs)
+
+    if num_samples == 0:
+        return
+
+    if use_threads:
+        pool_cls = multiprocessing.dummy.Pool
+    else:
+        pool_cls = fou.get_multiprocessing_context().Pool
+
+    logger.info("Computing metadata...")
+    start_time = timeit.default_timer()
+
+    with fou.ProgressBar(total=num_samples) as pb:
+        with pool_cls(processes=num_workers) as pool:
+            results = pool.imap_unordered(_do_compute_metadata, inputs)
+            _write_metadata(sample_collection, results, pb)
+
+    _log_throughput(num_samples, start_time)
+
+
+def _get_metadata_inputs(sample_collection, overwrite=False):
     if not overwrite:
         sample_collection = sample_collection.exists("metadata", False)
 
@@ -312,25 +358,47 @@ def _compute_metadata_multi(sample_collection, num_workers, overwrite=False):
         _allow_missing=True,
     )
 
-    inputs = list(zip(ids, filepaths, media_types))
-    num_samples = len(inputs)
+    return list(zip(ids, filepaths, media_types))
 
-    if num_samples == 0:
-        return
 
-    logger.info("Computing metadata...")
+def _write_metadata(sample_collection, results, pb):
+    # Results are written in batches to avoid one database round trip per
+    # sample
+    sample_ids = []
+    metadatas = []
+    for sample_id, metadata in results:
+        sample_ids.append(sample_id)
+        metadatas.append(metadata)
+        pb.update()
 
-    view = sample_collection.select_fields()
-    with fou.ProgressBar(total=num_samples) as pb:
-        with fou.get_multiprocessing_context().Pool(
-            processes=num_workers
-        ) as pool:
-            for sample_id, metadata in pb(
-                pool.imap_unordered(_do_compute_metadata, inputs)
-            ):
-                sample = view[sample_id]
-                sample.metadata = metadata
-                sample.save()
+        if len(sample_ids) >= _WRITE_BATCH_SIZE:
+            _set_metadata(sample_collection, sample_ids, metadatas)
+            sample_ids.clear()
+            metadatas.clear()
+
+    if sample_ids:
+        _set_metadata(sample_collection, sample_ids, metadatas)
+
+
+def _set_metadata(sample_collection, sample_ids, metadatas):
+    sample_collection.set_values(
+        "metadata",
+        metadatas,
+        skip_none=True,
+        expand_schema=False,
+        _sample_ids=sample_ids,
+    )
+
+
+def _log_throughput(num_samples, start_time):
+    elapsed = timeit.default_timer() - start_time
+    if elapsed > 0:
+        logger.info(
+            "Computed metadata for %d samples in %.1fs (%.1f samples/sec)",
+            num_samples,
+            elapsed,
+            num_samples / elapsed,
+        )
 
 
 def _do_compute_metadata(args):
@@ -27,6 +27,7 @@ import fiftyone.core.validation as fov
 
 tud = fou.lazy_import("torch.utils.data")
 
+foem = fou.lazy_import("fiftyone.core.embeddings")
 foue = fou.lazy_import("fiftyone.utils.eta")
 fouf = fou.lazy_import("fiftyone.utils.flash")
 foui = fou.lazy_import("fiftyone.utils.image")
@@ -292,29 +293,30 @@ def _apply_image_model_single(
     needs_samples = isinstance(model, SamplesMixin)
 
     with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            try:
-                img = foui.read(sample.filepath)
+        with samples.save_context() as ctx:
+            for sample in pb(samples):
+                try:
+                    img = foui.read(sample.filepath)
 
-                if needs_samples:
-                    labels = model.predict(img, sample=sample)
-                else:
-                    labels = model.predict(img)
+                    if needs_samples:
+                        labels = model.predict(img, sample=sample)
+                    else:
+                        labels = model.predict(img)
 
-                if filename_maker is not None:
-                    _export_arrays(labels, sample.filepath, filename_maker)
+                    if filename_maker is not None:
+                        _export_arrays(labels, sample.filepath, filename_maker)
 
-                sample.add_labels(
-                    labels,
-                    label_field=label_field,
-                    confidence_thresh=confidence_thresh,
-                )
-                sample.save()
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                    sample.add_labels(
+                        labels,
+                        label_field=label_field,
+                        confidence_thresh=confidence_thresh,
+                    )
+                    ctx.save(sample)
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
 
 def _apply_image_model_batch(
@@ -330,40 +332,45 @@ def _apply_image_model_batch(
     samples_loader = fou.iter_batches(samples, batch_size)
 
     with fou.ProgressBar(samples) as pb:
-        for sample_batch in samples_loader:
-            try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
+        with samples.save_context() as ctx:
+            for sample_batch in samples_loader:
+                try:
+                    imgs = [
+                        foui.read(sample.filepath) for sample in sample_batch
+                    ]
 
-                if needs_samples:
-                    labels_batch = model.predict_all(
-                        imgs, samples=sample_batch
-                    )
-                else:
-                    labels_batch = model.predict_all(imgs)
+                    if needs_samples:
+                        labels_batch = model.predict_all(
+                            imgs, samples=sample_batch
+                        )
+                    else:
+                        labels_batch = model.predict_all(imgs)
 
-                for sample, labels in zip(sample_batch, labels_batch):
-                    if filename_maker is not None:
-                        _export_arrays(labels, sample.filepath, filename_maker)
+                    for sample, labels in zip(sample_batch, labels_batch):
+                        if filename_maker is not None:
+                            _export_arrays(
+                                labels, sample.filepath, filename_maker
+                            )
 
-                    sample.add_labels(
-                        labels,
-                        label_field=label_field,
-                        confidence_thresh=confidence_thresh,
-                    )
-                    sample.save()
+                        sample.add_labels(
+                            labels,
+                            label_field=label_field,
+                            confidence_thresh=confidence_thresh,
+                        )
+                        ctx.save(sample)
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning(
-                    "Batch: %s - %s\nError: %s\n",
-                    sample_batch[0].id,
-                    sample_batch[-1].id,
-                    e,
-                )
+                    logger.warning(
+                        "Batch: %s - %s\nError: %s\n",
+                        sample_batch[0].id,
+                        sample_batch[-1].id,
+                        e,
+                    )
 
-            pb.update(len(sample_batch))
+                pb.update(len(sample_batch))
 
 
 def _apply_image_model_data_loader(
@@ -383,41 +390,44 @@ def _apply_image_model_data_loader(
     )
 
     with fou.ProgressBar(samples) as pb:
-        for sample_batch, imgs in zip(samples_loader, data_loader):
-            try:
-                if isinstance(imgs, Exception):
-                    raise imgs
+        with samples.save_context() as ctx:
+            for sample_batch, imgs in zip(samples_loader, data_loader):
+                try:
+                    if isinstance(imgs, Exception):
+                        raise imgs
 
-                if needs_samples:
-                    labels_batch = model.predict_all(
-                        imgs, samples=sample_batch
-                    )
-                else:
-                    labels_batch = model.predict_all(imgs)
+                    if needs_samples:
+                        labels_batch = model.predict_all(
+                            imgs, samples=sample_batch
+                        )
+                    else:
+                        labels_batch = model.predict_all(imgs)
 
-                for sample, labels in zip(sample_batch, labels_batch):
-                    if filename_maker is not None:
-                        _export_arrays(labels, sample.filepath, filename_maker)
+                    for sample, labels in zip(sample_batch, labels_batch):
+                        if filename_maker is not None:
+                            _export_arrays(
+                                labels, sample.filepath, filename_maker
+                            )
 
-                    sample.add_labels(
-                        labels,
-                        label_field=label_field,
-                        confidence_thresh=confidence_thresh,
-                    )
-                    sample.save()
+                        sample.add_labels(
+                            labels,
+                            label_field=label_field,
+                            confidence_thresh=confidence_thresh,
+                        )
+                        ctx.save(sample)
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning(
-                    "Batch: %s - %s\nError: %s\n",
-                    sample_batch[0].id,
-                    sample_batch[-1].id,
-                    e,
-                )
+                    logger.warning(
+                        "Batch: %s - %s\nError: %s\n",
+                        sample_batch[0].id,
+                        sample_batch[-1].id,
+                        e,
+                    )
 
-            pb.update(len(sample_batch))
+                pb.update(len(sample_batch))
 
 
 def _apply_image_model_to_frames_single(
@@ -433,45 +443,48 @@ def _apply_image_model_to_frames_single(
     is_clips = samples._dataset._is_clips
 
     with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
+        with samples.save_context() as ctx:
+            for idx, sample in enumerate(samples):
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
+
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        for img in video_reader:
+                            if needs_samples:
+                                frame = sample.frames[
+                                    video_reader.frame_number
+                                ]
+                                labels = model.predict(img, sample=frame)
+                            else:
+                                labels = model.predict(img)
 
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    for img in video_reader:
-                        if needs_samples:
-                            frame = sample.frames[video_reader.frame_number]
-                            labels = model.predict(img, sample=frame)
-                        else:
-                            labels = model.predict(img)
+                            if filename_maker is not None:
+                                _export_arrays(
+                                    labels, sample.filepath, filename_maker
+                                )
 
-                        if filename_maker is not None:
-                            _export_arrays(
-                                labels, sample.filepath, filename_maker
+                            sample.add_labels(
+                                {video_reader.frame_number: labels},
+                                label_field=label_field,
+                                confidence_thresh=confidence_thresh,
                             )
+                            ctx.save(sample)
 
-                        sample.add_labels(
-                            {video_reader.frame_number: labels},
-                            label_field=label_field,
-                            confidence_thresh=confidence_thresh,
-                        )
-                        sample.save()
-
-                        pb.update()
+                            pb.update()
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
+                # Explicitly set in case actual # frames differed from expected #
+                pb.set_iteration(frame_counts[idx])
 
 
 def _apply_image_model_to_frames_batch(
@@ -488,51 +501,54 @@ def _apply_image_model_to_frames_batch(
     is_clips = samples._dataset._is_clips
 
     with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
-
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    for fns, imgs in _iter_batches(video_reader, batch_size):
-                        if needs_samples:
-                            _frames = [sample.frames[fn] for fn in fns]
-                            labels_batch = model.predict_all(
-                                imgs, samples=_frames
-                            )
-                        else:
-                            labels_batch = model.predict_all(imgs)
-
-                        if filename_maker is not None:
-                            for labels in labels_batch:
-                                _export_arrays(
-                                    labels, sample.filepath, filename_maker
+        with samples.save_context() as ctx:
+            for idx, sample in enumerate(samples):
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
+
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        for fns, imgs in _iter_batches(
+                            video_reader, batch_size
+                        ):
+                            if needs_samples:
+                                _frames = [sample.frames[fn] for fn in fns]
+                                labels_batch = model.predict_all(
+                                    imgs, samples=_frames
                                 )
+                            else:
+                                labels_batch = model.predict_all(imgs)
 
-                        sample.add_labels(
-                            {
-                                fn: labels
-                                for fn, labels in zip(fns, labels_batch)
-                            },
-                            label_field=label_field,
-                            confidence_thresh=confidence_thresh,
-                        )
-                        sample.save()
+                            if filename_maker is not None:
+                                for labels in labels_batch:
+                                    _export_arrays(
+                                        labels, sample.filepath, filename_maker
+                                    )
 
-                        pb.update(len(imgs))
+                            sample.add_labels(
+                                {
+                                    fn: labels
+                                    for fn, labels in zip(fns, labels_batch)
+                                },
+                                label_field=label_field,
+                                confidence_thresh=confidence_thresh,
+                            )
+                            ctx.save(sample)
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                            pb.update(len(imgs))
+
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
+                # Explicitly set in case actual # frames differed from expected #
+                pb.set_iteration(frame_counts[idx])
 
 
 def _apply_video_model(
@@ -547,35 +563,36 @@ def _apply_video_model(
     is_clips = samples._dataset._is_clips
 
     with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
+        with samples.save_context() as ctx:
+            for sample in pb(samples):
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
 
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    if needs_samples:
-                        labels = model.predict(video_reader, sample=sample)
-                    else:
-                        labels = model.predict(video_reader)
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        if needs_samples:
+                            labels = model.predict(video_reader, sample=sample)
+                        else:
+                            labels = model.predict(video_reader)
 
-                if filename_maker is not None:
-                    _export_arrays(labels, sample.filepath, filename_maker)
+                    if filename_maker is not None:
+                        _export_arrays(labels, sample.filepath, filename_maker)
 
-                sample.add_labels(
-                    labels,
-                    label_field=label_field,
-                    confidence_thresh=confidence_thresh,
-                )
-                sample.save()
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                    sample.add_labels(
+                        labels,
+                        label_field=label_field,
+                        confidence_thresh=confidence_thresh,
+                    )
+                    ctx.save(sample)
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
 
 def _export_arrays(label, input_path, filename_maker):
@@ -713,6 +730,7 @@ def compute_embeddings(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    embeddings_key=None,
     **kwargs,
 ):
     """Computes embeddings for the samples in the collection using the given
@@ -734,7 +752,11 @@ def compute_embeddings(
     embeddings, i.e., :meth:`Model.has_embeddings` must return ``True``.
 
     If an ``embeddings_field`` is provided, the embeddings are saved to the
-    samples; otherwise, the embeddings are returned in-memory.
+    samples. If an ``embeddings_key`` is provided, the embeddings are saved to
+    the dataset's memory-mapped embeddings side-store, from which they can be
+    efficiently loaded via
+    :meth:`fiftyone.core.collections.SampleCollection.load_embeddings`.
+    Otherwise, the embeddings are returned in-memory.
 
     Args:
         samples: a :class:`fiftyone.core.collections.SampleCollection`
@@ -749,13 +771,18 @@ def compute_embeddings(
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample. Only
             applicable to :class:`Model` instances
+        embeddings_key (None): a key under which to store the embeddings in
+            the dataset's embeddings side-store. Only applicable when
+            computing sample-level embeddings. Samples for which embeddings
+            could not be computed are stored as ``nan`` rows
         **kwargs: optional model-specific keyword arguments passed through
             to the underlying inference implementation
 
     Returns:
         one of the following:
 
-        -   ``None``, if an ``embeddings_field`` is provided
+        -   ``None``, if an ``embeddings_field`` or ``embeddings_key`` is
+            provided
         -   a ``num_samples x num_dim`` array of embeddings, when computing
             embeddings for image/video collections with image/video models,
             respectively, and no ``embeddings_field`` is provided. If
@@ -770,6 +797,33 @@ def compute_embeddings(
             contain arrays of embeddings for all frames 1, 2, ... until the
             error occurred, or ``None`` if no embeddings were computed at all
     """
+    if embeddings_key is not None:
+        if embeddings_field is not None:
+            raise ValueError(
+                "Only one of `embeddings_field` and `embeddings_key` may be "
+                "provided"
+            )
+
+        if (
+            samples.media_type == fom.VIDEO
+            and getattr(model, "media_type", None) == "image"
+        ):
+            raise ValueError(
+                "Frame embeddings cannot be stored via `embeddings_key`; use "
+                "`embeddings_field` instead"
+            )
+
+        embeddings = compute_embeddings(
+            samples,
+            model,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            skip_failures=skip_failures,
+            **kwargs,
+        )
+        foem.save_embeddings(samples, embeddings_key, embeddings)
+        return None
+
     if _is_flash_model(model):
         return fouf.compute_flash_embeddings(
             samples,
@@ -895,24 +949,25 @@ def _compute_image_embeddings_single(
     errors = False
 
     with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            embedding = None
+        with samples.save_context() as ctx:
+            for sample in pb(samples):
+                embedding = None
 
-            try:
-                img = foui.read(sample.filepath)
-                embedding = model.embed(img)[0]
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                try:
+                    img = foui.read(sample.filepath)
+                    embedding = model.embed(img)[0]
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                errors = True
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    errors = True
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is not None:
-                sample[embeddings_field] = embedding
-                sample.save()
-            else:
-                embeddings.append(embedding)
+                if embeddings_field is not None:
+                    sample[embeddings_field] = embedding
+                    ctx.save(sample)
+                else:
+                    embeddings.append(embedding)
 
     if embeddings_field is not None:
         return None
@@ -933,32 +988,39 @@ def _compute_image_embeddings_batch(
     errors = False
 
     with fou.ProgressBar(samples) as pb:
-        for sample_batch in samples_loader:
-            embeddings_batch = [None] * len(sample_batch)
-
-            try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
-                embeddings_batch = list(model.embed_all(imgs))  # list of 1D
-            except Exception as e:
-                if not skip_failures:
-                    raise e
-
-                errors = True
-                logger.warning(
-                    "Batch: %s - %s\nError: %s\n",
-                    sample_batch[0].id,
-                    sample_batch[-1].id,
-                    e,
-                )
+        with samples.save_context() as ctx:
+            for sample_batch in samples_loader:
+                embeddings_batch = [None] * len(sample_batch)
+
+                try:
+                    imgs = [
+                        foui.read(sample.filepath) for sample in sample_batch
+                    ]
+                    embeddings_batch = list(
+                        model.embed_all(imgs)
+                    )  # list of 1D
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
+
+                    errors = True
+                    logger.warning(
+                        "Batch: %s - %s\nError: %s\n",
+                        sample_batch[0].id,
+                        sample_batch[-1].id,
+                        e,
+                    )
 
-            if embeddings_field is not None:
-                for sample, embedding in zip(sample_batch, embeddings_batch):
-                    sample[embeddings_field] = embedding
-                    sample.save()
-            else:
-                embeddings.extend(embeddings_batch)
+                if embeddings_field is not None:
+                    for sample, embedding in zip(
+                        sample_batch, embeddings_batch
+                    ):
+                        sample[embeddings_field] = embedding
+                        ctx.save(sample)
+                else:
+                    embeddings.extend(embeddings_batch)
 
-            pb.update(len(sample_batch))
+                pb.update(len(sample_batch))
 
     if embeddings_field is not None:
         return None
@@ -982,34 +1044,39 @@ def _compute_image_embeddings_data_loader(
     errors = False
 
     with fou.ProgressBar(samples) as pb:
-        for sample_batch, imgs in zip(samples_loader, data_loader):
-            embeddings_batch = [None] * len(sample_batch)
-
-            try:
-                if isinstance(imgs, Exception):
-                    raise imgs
-
-                embeddings_batch = list(model.embed_all(imgs))  # list of 1D
-            except Exception as e:
-                if not skip_failures:
-                    raise e
-
-                errors = True
-                logger.warning(
-                    "Batch: %s - %s\nError: %s\n",
-                    sample_batch[0].id,
-                    sample_batch[-1].id,
-                    e,
-                )
+        with samples.save_context() as ctx:
+            for sample_batch, imgs in zip(samples_loader, data_loader):
+                embeddings_batch = [None] * len(sample_batch)
+
+                try:
+                    if isinstance(imgs, Exception):
+                        raise imgs
+
+                    embeddings_batch = list(
+                        model.embed_all(imgs)
+                    )  # list of 1D
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
+
+                    errors = True
+                    logger.warning(
+                        "Batch: %s - %s\nError: %s\n",
+                        sample_batch[0].id,
+                        sample_batch[-1].id,
+                        e,
+                    )
 
-            if embeddings_field is not None:
-                for sample, embedding in zip(sample_batch, embeddings_batch):
-                    sample[embeddings_field] = embedding
-                    sample.save()
-            else:
-                embeddings.extend(embeddings_batch)
+                if embeddings_field is not None:
+                    for sample, embedding in zip(
+                        sample_batch, embeddings_batch
+                    ):
+                        sample[embeddings_field] = embedding
+                        ctx.save(sample)
+                else:
+                    embeddings.extend(embeddings_batch)
 
-            pb.update(len(sample_batch))
+                pb.update(len(sample_batch))
 
     if embeddings_field is not None:
         return None
@@ -1030,48 +1097,49 @@ def _compute_frame_embeddings_single(
     embeddings_dict = {}
 
     with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
-            embeddings = []
-
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
+        with samples.save_context() as ctx:
+            for idx, sample in enumerate(samples):
+                embeddings = []
 
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    for img in video_reader:
-                        embedding = model.embed(img)[0]
-
-                        if embeddings_field is not None:
-                            sample.add_labels(
-                                {video_reader.frame_number: embedding},
-                                label_field=embeddings_field,
-                            )
-                            sample.save()
-                        else:
-                            embeddings.append(embedding)
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
+
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        for img in video_reader:
+                            embedding = model.embed(img)[0]
+
+                            if embeddings_field is not None:
+                                sample.add_labels(
+                                    {video_reader.frame_number: embedding},
+                                    label_field=embeddings_field,
+                                )
+                                ctx.save(sample)
+                            else:
+                                embeddings.append(embedding)
 
-                        pb.update()
+                            pb.update()
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is None:
-                if embeddings:
-                    embeddings = np.stack(embeddings)
-                else:
-                    embeddings = None
+                if embeddings_field is None:
+                    if embeddings:
+                        embeddings = np.stack(embeddings)
+                    else:
+                        embeddings = None
 
-                embeddings_dict[sample.id] = embeddings
+                    embeddings_dict[sample.id] = embeddings
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
+                # Explicitly set in case actual # frames differed from expected #
+                pb.set_iteration(frame_counts[idx])
 
     if embeddings_field is not None:
         return None
@@ -1089,53 +1157,56 @@ def _compute_frame_embeddings_batch(
     embeddings_dict = {}
 
     with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
-            embeddings = []
-
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
-
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    for fns, imgs in _iter_batches(video_reader, batch_size):
-                        embeddings_batch = list(model.embed_all(imgs))
+        with samples.save_context() as ctx:
+            for idx, sample in enumerate(samples):
+                embeddings = []
 
-                        if embeddings_field is not None:
-                            sample.add_labels(
-                                {
-                                    fn: embedding
-                                    for fn, embedding in zip(
-                                        fns, embeddings_batch
-                                    )
-                                },
-                                label_field=embeddings_field,
-                            )
-                            sample.save()
-                        else:
-                            embeddings.extend(embeddings_batch)
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
+
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        for fns, imgs in _iter_batches(
+                            video_reader, batch_size
+                        ):
+                            embeddings_batch = list(model.embed_all(imgs))
+
+                            if embeddings_field is not None:
+                                sample.add_labels(
+                                    {
+                                        fn: embedding
+                                        for fn, embedding in zip(
+                                            fns, embeddings_batch
+                                        )
+                                    },
+                                    label_field=embeddings_field,
+                                )
+                                ctx.save(sample)
+                            else:
+                                embeddings.extend(embeddings_batch)
 
-                        pb.update(len(imgs))
+                            pb.update(len(imgs))
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is None:
-                if embeddings:
-                    embeddings = np.stack(embeddings)
-                else:
-                    embeddings = None
+                if embeddings_field is None:
+                    if embeddings:
+                        embeddings = np.stack(embeddings)
+                    else:
+                        embeddings = None
 
-                embeddings_dict[sample.id] = embeddings
+                    embeddings_dict[sample.id] = embeddings
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
+                # Explicitly set in case actual # frames differed from expected #
+                pb.set_iteration(frame_counts[idx])
 
     if embeddings_field is not None:
         return None
@@ -1151,30 +1222,31 @@ def _compute_video_embeddings(samples, model, embeddings_field, skip_failures):
     errors = False
 
     with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
+        with samples.save_context() as ctx:
+            for sample in pb(samples):
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
 
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    embedding = model.embed(video_reader)[0]
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        embedding = model.embed(video_reader)[0]
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                errors = True
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    errors = True
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is not None:
-                sample[embeddings_field] = embedding
-                sample.save()
-            else:
-                embeddings.append(embedding)
+                if embeddings_field is not None:
+                    sample[embeddings_field] = embedding
+                    ctx.save(sample)
+                else:
+                    embeddings.append(embedding)
 
     if embeddings_field is not None:
         return None
@@ -1196,6 +1268,7 @@ def compute_patch_embeddings(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    embeddings_key=None,
 ):
     """Computes embeddings for the image patches defined by ``patches_field``
     of the samples in the collection using the given :class:`Model`.
@@ -1211,7 +1284,11 @@ def compute_patch_embeddings(
     must return ``True``.
 
     If an ``embeddings_field`` is provided, the embeddings are saved to the
-    samples; otherwise, the embeddings are returned in-memory.
+    samples. If an ``embeddings_key`` is provided, the embeddings are saved to
+    the dataset's memory-mapped embeddings side-store, from which they can be
+    efficiently loaded via
+    :meth:`fiftyone.core.collections.SampleCollection.load_embeddings`.
+    Otherwise, the embeddings are returned in-memory.
 
     Args:
         samples: a :class:`fiftyone.core.collections.SampleCollection`
@@ -1246,11 +1323,16 @@ def compute_patch_embeddings(
             Only applicable for Torch models
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample
+        embeddings_key (None): a key under which to store the embeddings in
+            the dataset's embeddings side-store. Only applicable to image
+            collections. Patches for which embeddings could not be computed
+            are omitted
 
     Returns:
         one of the following:
 
-        -   ``None``, if an ``embeddings_field`` is provided
+        -   ``None``, if an ``embeddings_field`` or ``embeddings_key`` is
+            provided
         -   a dict mapping sample IDs to ``num_patches x num_dim`` arrays of
             patch embeddings, when computing patch embeddings for image
             collections and no ``embeddings_field`` is provided. If
@@ -1264,6 +1346,35 @@ def compute_patch_embeddings(
             ``True`` and any errors are detected, this nested dict will contain
             missing or ``None`` values to indicate uncomputable embeddings
     """
+    if embeddings_key is not None:
+        if embeddings_field is not None:
+            raise ValueError(
+                "Only one of `embeddings_field` and `embeddings_key` may be "
+                "provided"
+            )
+
+        if samples.media_type != fom.IMAGE:
+            raise ValueError(
+                "Patch embeddings can only be stored via `embeddings_key` for "
+                "image collections"
+            )
+
+        embeddings = compute_patch_embeddings(
+            samples,
+            model,
+            patches_field,
+            force_square=force_square,
+            alpha=alpha,
+            handle_missing=handle_missing,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            skip_failures=skip_failures,
+        )
+        foem.save_embeddings(
+            samples, embeddings_key, embeddings, label_field=patches_field
+        )
+        return None
+
     if not isinstance(model, Model):
         raise ValueError(
             "Model must be a %s instance; found %s" % (Model, type(model))
@@ -1407,46 +1518,47 @@ def _embed_patches(
         embeddings_dict = {}
 
     with fou.ProgressBar() as pb:
-        for sample in pb(samples):
-            embeddings = None
+        with samples.save_context() as ctx:
+            for sample in pb(samples):
+                embeddings = None
 
-            try:
-                patches = foup.parse_patches(
-                    sample, patches_field, handle_missing=handle_missing
-                )
+                try:
+                    patches = foup.parse_patches(
+                        sample, patches_field, handle_missing=handle_missing
+                    )
 
-                if patches is not None:
-                    img = foui.read(sample.filepath)
+                    if patches is not None:
+                        img = foui.read(sample.filepath)
 
-                    if batch_size is None:
-                        embeddings = _embed_patches_single(
-                            model, img, patches, force_square, alpha
-                        )
-                    else:
-                        embeddings = _embed_patches_batch(
-                            model,
-                            img,
-                            patches,
-                            force_square,
-                            alpha,
-                            batch_size,
-                        )
+                        if batch_size is None:
+                            embeddings = _embed_patches_single(
+                                model, img, patches, force_square, alpha
+                            )
+                        else:
+                            embeddings = _embed_patches_batch(
+                                model,
+                                img,
+                                patches,
+                                force_square,
+                                alpha,
+                                batch_size,
+                            )
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is not None:
-                if embeddings is not None:
-                    labels = label_parser(sample)
-                    for label, embedding in zip(labels, embeddings):
-                        label[embeddings_field] = embedding
+                if embeddings_field is not None:
+                    if embeddings is not None:
+                        labels = label_parser(sample)
+                        for label, embedding in zip(labels, embeddings):
+                            label[embeddings_field] = embedding
 
-                    sample.save()
-            else:
-                embeddings_dict[sample.id] = embeddings
+                        ctx.save(sample)
+                else:
+                    embeddings_dict[sample.id] = embeddings
 
     if embeddings_field is not None:
         return None
@@ -1514,36 +1626,39 @@ def _embed_patches_data_loader(
         embeddings_dict = {}
 
     with fou.ProgressBar(samples) as pb:
-        for sample, patches in pb(zip(samples, data_loader)):
-            embeddings = None
+        with samples.save_context() as ctx:
+            for sample, patches in pb(zip(samples, data_loader)):
+                embeddings = None
 
-            try:
-                if isinstance(patches, Exception):
-                    raise patches
+                try:
+                    if isinstance(patches, Exception):
+                        raise patches
 
-                if patches is not None:
-                    embeddings = []
-                    for patches_batch in fou.iter_slices(patches, batch_size):
-                        embeddings_batch = model.embed_all(patches_batch)
-                        embeddings.append(embeddings_batch)
+                    if patches is not None:
+                        embeddings = []
+                        for patches_batch in fou.iter_slices(
+                            patches, batch_size
+                        ):
+                            embeddings_batch = model.embed_all(patches_batch)
+                            embeddings.append(embeddings_batch)
 
-                    embeddings = np.concatenate(embeddings)
+                        embeddings = np.concatenate(embeddings)
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is not None:
-                if embeddings is not None:
-                    labels = label_parser(sample)
-                    for label, embedding in zip(labels, embeddings):
-                        label[embeddings_field] = embedding
+                if embeddings_field is not None:
+                    if embeddings is not None:
+                        labels = label_parser(sample)
+                        for label, embedding in zip(labels, embeddings):
+                            label[embeddings_field] = embedding
 
-                    sample.save()
-            else:
-                embeddings_dict[sample.id] = embeddings
+                        ctx.save(sample)
+                else:
+                    embeddings_dict[sample.id] = embeddings
 
     if embeddings_field is not None:
         return None
@@ -1573,63 +1688,74 @@ def _embed_frame_patches(
         embeddings_dict = {}
 
     with fou.ProgressBar(total=total_frame_count) as pb:
-        for idx, sample in enumerate(samples):
-            if is_clips:
-                frames = etaf.FrameRange(*sample.support)
-            else:
-                frames = None
-
-            frame_embeddings_dict = {}
+        with samples.save_context() as ctx:
+            for idx, sample in enumerate(samples):
+                if is_clips:
+                    frames = etaf.FrameRange(*sample.support)
+                else:
+                    frames = None
+
+                frame_embeddings_dict = {}
+
+                try:
+                    with etav.FFmpegVideoReader(
+                        sample.filepath, frames=frames
+                    ) as video_reader:
+                        for img in video_reader:
+                            frame_number = video_reader.frame_number
+                            frame = sample.frames[frame_number]
+
+                            patches = foup.parse_patches(
+                                frame,
+                                patches_field,
+                                handle_missing=handle_missing,
+                            )
 
-            try:
-                with etav.FFmpegVideoReader(
-                    sample.filepath, frames=frames
-                ) as video_reader:
-                    for img in video_reader:
-                        frame_number = video_reader.frame_number
-                        frame = sample.frames[frame_number]
-
-                        patches = foup.parse_patches(
-                            frame, patches_field, handle_missing=handle_missing
-                        )
+                            if patches is not None:
+                                if batch_size is None:
+                                    embeddings = _embed_patches_single(
+                                        model,
+                                        img,
+                                        patches,
+                                        force_square,
+                                        alpha,
+                                    )
+                                else:
+                                    embeddings = _embed_patches_batch(
+                                        model,
+                                        img,
+                                        patches,
+                                        force_square,
+                                        alpha,
+                                        batch_size,
+                                    )
 
-                        if patches is not None:
-                            if batch_size is None:
-                                embeddings = _embed_patches_single(
-                                    model, img, patches, force_square, alpha
-                                )
+                            if embeddings_field is not None:
+                                labels = label_parser(frame)
+                                for label, embedding in zip(
+                                    labels, embeddings
+                                ):
+                                    label[embeddings_field] = embedding
                             else:
-                                embeddings = _embed_patches_batch(
-                                    model,
-                                    img,
-                                    patches,
-                                    force_square,
-                                    alpha,
-                                    batch_size,
-                                )
-
-                        if embeddings_field is not None:
-                            labels = label_parser(frame)
-                            for label, embedding in zip(labels, embeddings):
-                                label[embeddings_field] = embedding
-                        else:
-                            frame_embeddings_dict[frame_number] = embeddings
+                                frame_embeddings_dict[
+                                    frame_number
+                                ] = embeddings
 
-                        pb.update()
+                            pb.update()
 
-            except Exception as e:
-                if not skip_failures:
-                    raise e
+                except Exception as e:
+                    if not skip_failures:
+                        raise e
 
-                logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                    logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
-            if embeddings_field is not None:
-                sample.save()
-            else:
-                embeddings_dict[sample.id] = frame_embeddings_dict
+                if embeddings_field is not None:
+                    ctx.save(sample)
+                else:
+                    embeddings_dict[sample.id] = frame_embeddings_dict
 
-            # Explicitly set in case actual # frames differed from expected #
-            pb.set_iteration(frame_counts[idx])
+                # Explicitly set in case actual # frames differed from expected #
+                pb.set_iteration(frame_counts[idx])
 
     if embeddings_field is not None:
         return None
@@ -41,6 +41,8 @@ from .database import (
     export_collection,
     import_document,
     import_collection,
+    is_sharded_collection,
+    insert_collection_shards,
     insert_documents,
     bulk_write,
 )
@@ -6,10 +6,17 @@ Database utilities.
 |
 """
 import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
+import itertools
+import json
 import logging
+import multiprocessing
 from multiprocessing.pool import ThreadPool
 import os
+import threading
 
 import asyncio
 from bson import json_util, ObjectId
@@ -38,6 +45,7 @@ foa = fou.lazy_import("fiftyone.core.annotation")
 fob = fou.lazy_import("fiftyone.core.brain")
 fod = fou.lazy_import("fiftyone.core.dataset")
 foe = fou.lazy_import("fiftyone.core.evaluation")
+fom = fou.lazy_import("fiftyone.migrations")
 
 
 logger = logging.getLogger(__name__)
@@ -46,6 +54,12 @@ _client = None
 _async_client = None
 _connection_kwargs = {}
 _db_service = None
+_deferred_config = None
+_deferred_lock = threading.RLock()
+_deferred_thread = None
+
+_SHARDS_MANIFEST = "manifest.json"
+_SHARD_PATT = "{idx:06d}.ndjson"
 
 
 #
@@ -162,15 +176,20 @@ def cleanup_multiple_config_docs():
             doc.delete()
 
 
-def establish_db_conn(config):
+def establish_db_conn(config, lazy=False):
     """Establishes the database connection.
 
     If ``fiftyone.config.database_uri`` is defined, then we connect to that
     URI. Otherwise, a :class:`fiftyone.core.service.DatabaseService` is
     created.
 
+    If ``lazy`` is True, the connection is established, and any necessary
+    database migrations are run, when the database is first accessed.
+
     Args:
         config: a :class:`fiftyone.core.config.FiftyOneConfig`
+        lazy (False): whether to defer establishing the connection until the
+            database is first accessed
 
     Raises:
         ConnectionError: if a connection to ``mongod`` could not be established
@@ -185,6 +204,11 @@ def establish_db_conn(config):
     global _client
     global _db_service
     global _connection_kwargs
+    global _deferred_config
+
+    if lazy:
+        _deferred_config = config
+        return
 
     established_port = os.environ.get("FIFTYONE_PRIVATE_DATABASE_PORT", None)
     if established_port is not None:
@@ -230,8 +254,39 @@ def establish_db_conn(config):
         )
 
 
+def _establish_deferred_db_conn():
+    global _deferred_config
+    global _deferred_thread
+
+    # Database access while the deferred connection is being established,
+    # e.g., by the migration below, uses the connection in progress
+    if _deferred_thread == threading.get_ident():
+        return
+
+    with _deferred_lock:
+        if _deferred_config is None:
+            return
+
+        _deferred_thread = threading.get_ident()
+
+        try:
+            establish_db_conn(_deferred_config)
+
+            if os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
+                fom.migrate_database_if_necessary()
+
+            # Only cleared on success, so that other threads wait for the
+            # connection and a failed attempt is retried on the next access
+            _deferred_config = None
+        finally:
+            _deferred_thread = None
+
+
 def _connect():
     global _client
+    if _deferred_config is not None:
+        _establish_deferred_db_conn()
+
     if _client is None:
         global _connection_kwargs
 
@@ -243,6 +298,9 @@ def _connect():
 
 def _async_connect():
     global _async_client
+    if _deferred_config is not None:
+        _establish_deferred_db_conn()
+
     if _async_client is None:
         global _connection_kwargs
         _async_client = mtr.AsyncIOMotorClient(
@@ -624,14 +682,23 @@ def export_collection(
     key="documents",
     patt="{idx:06d}-{id}.json",
     num_docs=None,
+    shard_size=None,
 ):
     """Exports the collection to disk in JSON format.
 
+    When a ``shard_size`` is provided, the documents are written to
+    ``json_dir_or_path`` as a sequence of newline-delimited JSON shards of the
+    given size along with a ``manifest.json`` that records the number of
+    documents, first/last IDs, and SHA-256 checksum of each shard. Each shard
+    is recorded in the manifest as soon as it is written, so, if an existing
+    manifest is found, any completed shards whose contents match ``docs`` are
+    not rewritten.
+
     Args:
         docs: an iterable containing the documents to export
         json_dir_or_path: the path to write a single JSON file containing the
             entire collection, or a directory in which to write per-document
-            JSON files
+            JSON files or shards
         key ("documents"): the field name under which to store the documents
             when ``json_path`` is a single JSON file
         patt ("{idx:06d}-{id}.json"): a filename pattern to use when
@@ -640,11 +707,15 @@ def export_collection(
             to the document's ID
         num_docs (None): the total number of documents. If omitted, this must
             be computable via ``len(docs)``
+        shard_size (None): an optional number of documents to write to each
+            shard in ``json_dir_or_path``
     """
     if num_docs is None:
         num_docs = len(docs)
 
-    if json_dir_or_path.endswith(".json"):
+    if shard_size is not None:
+        _export_collection_shards(docs, json_dir_or_path, shard_size, num_docs)
+    elif json_dir_or_path.endswith(".json"):
         _export_collection_single(docs, json_dir_or_path, key, num_docs)
     else:
         _export_collection_multi(docs, json_dir_or_path, patt, num_docs)
@@ -674,6 +745,104 @@ def _export_collection_multi(docs, json_dir, patt, num_docs):
             export_document(doc, json_path)
 
 
+def _export_collection_shards(docs, shards_dir, shard_size, num_docs):
+    etau.ensure_dir(shards_dir)
+
+    manifest = _read_shards_manifest(shards_dir)
+    if manifest is not None and manifest["shard_size"] == shard_size:
+        shards = manifest["shards"]
+    else:
+        shards = []
+
+    num_shards = 0
+    with fou.ProgressBar(total=num_docs, iters_str="docs") as pb:
+        batches = fou.iter_batches(docs, shard_size)
+        for idx, batch in enumerate(batches):
+            num_shards += 1
+            pb.update(count=len(batch))
+
+            data = _serialize_shard(batch)
+            sha256 = hashlib.sha256(data).hexdigest()
+            if idx < len(shards) and _is_completed_shard(
+                shards_dir, shards[idx], sha256
+            ):
+                continue
+
+            shard = _write_shard(batch, data, sha256, shards_dir, idx)
+            if idx < len(shards):
+                shards[idx] = shard
+            else:
+                shards.append(shard)
+
+            _write_shards_manifest(shards_dir, shard_size, shards, False)
+
+    # Discard any trailing shards from a previous export
+    del shards[num_shards:]
+    _write_shards_manifest(shards_dir, shard_size, shards, True)
+
+    filenames = set(shard["filename"] for shard in shards)
+    filenames.add(_SHARDS_MANIFEST)
+    for filename in etau.list_files(shards_dir):
+        if filename not in filenames:
+            etau.delete_file(os.path.join(shards_dir, filename))
+
+
+def _is_completed_shard(shards_dir, shard, sha256):
+    return shard["sha256"] == sha256 and os.path.isfile(
+        os.path.join(shards_dir, shard["filename"])
+    )
+
+
+def _serialize_shard(docs):
+    return "".join(json_util.dumps(doc) + "\n" for doc in docs).encode()
+
+
+def _write_shard(docs, data, sha256, shards_dir, idx):
+    filename = _SHARD_PATT.format(idx=idx + 1)
+
+    # Write to a temporary path first so that shards are never left partially
+    # written if the export is interrupted
+    shard_path = os.path.join(shards_dir, filename)
+    tmp_path = shard_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+
+    os.replace(tmp_path, shard_path)
+
+    return {
+        "filename": filename,
+        "num_docs": len(docs),
+        "first_id": str(docs[0]["_id"]),
+        "last_id": str(docs[-1]["_id"]),
+        "sha256": sha256,
+    }
+
+
+def _read_shards_manifest(shards_dir):
+    manifest_path = os.path.join(shards_dir, _SHARDS_MANIFEST)
+    if not os.path.isfile(manifest_path):
+        return None
+
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+
+def _write_shards_manifest(shards_dir, shard_size, shards, complete):
+    manifest = {
+        "shard_size": shard_size,
+        "num_docs": sum(shard["num_docs"] for shard in shards),
+        "complete": complete,
+        "shards": shards,
+    }
+
+    manifest_path = os.path.join(shards_dir, _SHARDS_MANIFEST)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=4)
+
+    os.replace(tmp_path, manifest_path)
+
+
 def import_document(json_path):
     """Imports a document from JSON on disk.
 
@@ -692,7 +861,7 @@ def import_collection(json_dir_or_path, key="documents"):
 
     Args:
         json_dir_or_path: the path to a JSON file on disk, or a directory
-            containing per-document JSON files
+            containing per-document JSON files or shards
         key ("documents"): the field name under which the documents are stored
             when ``json_path`` is a single JSON file
 
@@ -705,9 +874,118 @@ def import_collection(json_dir_or_path, key="documents"):
     if json_dir_or_path.endswith(".json"):
         return _import_collection_single(json_dir_or_path, key)
 
+    if is_sharded_collection(json_dir_or_path):
+        return _import_collection_shards(json_dir_or_path)
+
     return _import_collection_multi(json_dir_or_path)
 
 
+def is_sharded_collection(json_dir_or_path):
+    """Determines whether the given path contains a collection that was
+    exported in shards via :func:`export_collection`.
+
+    Args:
+        json_dir_or_path: the path to a JSON file on disk or a directory
+
+    Returns:
+        True/False
+    """
+    return os.path.isfile(os.path.join(json_dir_or_path, _SHARDS_MANIFEST))
+
+
+def insert_collection_shards(
+    shards_dir,
+    coll,
+    parse_fcn=None,
+    ordered=False,
+    resume=False,
+    num_workers=None,
+    progress=False,
+):
+    """Inserts the documents in a collection that was exported in shards via
+    :func:`export_collection` into a collection.
+
+    Shards are read, verified against the checksums in their manifest, and
+    parsed by a pool of worker threads. When ``ordered=True``, the shards are
+    inserted in order as they become available, otherwise each worker
+    inserts its shards concurrently.
+
+    When ``resume=True``, any documents that already exist in ``coll``, e.g.,
+    from a previous interrupted import, are skipped.
+
+    Args:
+        shards_dir: the directory containing the shards
+        coll: a pymongo collection
+        parse_fcn (None): an optional function to apply to each document
+            before it is inserted
+        ordered (False): whether the documents must be inserted in order
+        resume (False): whether to skip documents that already exist in
+            ``coll``
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used
+        progress (False): whether to render a progress bar tracking the
+            insertion
+
+    Returns:
+        a list of IDs of the documents in the shards
+    """
+    manifest = _read_shards_manifest(shards_dir)
+    if not manifest["complete"]:
+        raise ValueError("The collection in '%s' is incomplete" % shards_dir)
+
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    def _load_shard(shard):
+        docs = _read_shard(shards_dir, shard)
+        ids = [d["_id"] for d in docs]
+
+        if resume:
+            existing_ids = set(
+                d["_id"]
+                for d in coll.find({"_id": {"$in": ids}}, {"_id": True})
+            )
+            if existing_ids:
+                docs = [d for d in docs if d["_id"] not in existing_ids]
+
+        if parse_fcn is not None:
+            docs = list(map(parse_fcn, docs))
+
+        if not ordered:
+            insert_documents(docs, coll)
+            docs = None
+
+        return ids, docs
+
+    ids = []
+    with fou.ProgressBar(
+        total=manifest["num_docs"],
+        iters_str="docs",
+        quiet=not (progress and fo.config.show_progress_bars),
+    ) as pb:
+
+        def _finish_shard(future):
+            _ids, docs = future.result()
+            if docs is not None:
+                insert_documents(docs, coll, ordered=True)
+
+            ids.extend(_ids)
+            pb.update(count=len(_ids))
+
+        # Only a bounded number of shards are loaded at a time
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = deque()
+            for shard in manifest["shards"]:
+                futures.append(executor.submit(_load_shard, shard))
+                if len(futures) > num_workers:
+                    _finish_shard(futures.popleft())
+
+            while futures:
+                _finish_shard(futures.popleft())
+
+    return ids
+
+
 def _import_collection_single(json_path, key):
     with open(json_path, "r") as f:
         docs = json_util.loads(f.read()).get(key, [])
@@ -728,6 +1006,29 @@ def _import_collection_multi(json_dir):
     return docs, len(json_paths)
 
 
+def _import_collection_shards(shards_dir):
+    manifest = _read_shards_manifest(shards_dir)
+    if not manifest["complete"]:
+        raise ValueError("The collection in '%s' is incomplete" % shards_dir)
+
+    docs = itertools.chain.from_iterable(
+        _read_shard(shards_dir, shard) for shard in manifest["shards"]
+    )
+
+    return docs, manifest["num_docs"]
+
+
+def _read_shard(shards_dir, shard):
+    shard_path = os.path.join(shards_dir, shard["filename"])
+    with open(shard_path, "rb") as f:
+        data = f.read()
+
+    if hashlib.sha256(data).hexdigest() != shard["sha256"]:
+        raise ValueError("Checksum mismatch for shard '%s'" % shard_path)
+
+    return [json_util.loads(line) for line in data.splitlines() if line]
+
+
 def insert_documents(docs, coll, ordered=False, progress=False, num_docs=None):
     """Inserts documents into a collection.
 
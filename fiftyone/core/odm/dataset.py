@@ -62,6 +62,7 @@ class SampleFieldDocument(EmbeddedDocument):
     db_field = StringField(null=True)
     description = StringField(null=True)
     info = DictField(null=True)
+    encoding = StringField(null=True)
 
     def to_field(self):
         """Creates the :class:`fiftyone.core.fields.Field` specified by this
@@ -84,6 +85,10 @@ class SampleFieldDocument(EmbeddedDocument):
         if self.fields is not None:
             fields = [field_doc.to_field() for field_doc in list(self.fields)]
 
+        kwargs = {}
+        if self.encoding is not None:
+            kwargs["encoding"] = self.encoding
+
         return create_field(
             self.name,
             ftype,
@@ -93,6 +98,7 @@ class SampleFieldDocument(EmbeddedDocument):
             db_field=self.db_field,
             description=self.description,
             info=self.info,
+            **kwargs,
         )
 
     @classmethod
@@ -120,6 +126,7 @@ class SampleFieldDocument(EmbeddedDocument):
             db_field=field.db_field,
             description=field.description,
             info=field.info,
+            encoding=getattr(field, "encoding", None),
         )
 
     @staticmethod
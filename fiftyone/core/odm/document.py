@@ -5,10 +5,12 @@ Base classes for documents that back dataset contents.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from contextlib import contextmanager
 from copy import deepcopy
 import json
+import weakref
 
-from bson import json_util, ObjectId
+from bson import json_util, ObjectId, SON
 import mongoengine
 from pymongo import InsertOne, UpdateOne
 
@@ -18,6 +20,8 @@ import fiftyone.core.utils as fou
 
 from .utils import serialize_value, deserialize_value
 
+food = fou.lazy_import("fiftyone.core.odm.database")
+
 
 class SerializableDocument(object):
     """Mixin for documents that can be serialized in BSON or JSON format."""
@@ -574,10 +578,77 @@ class Document(BaseDocument, mongoengine.Document):
 
     meta = {"abstract": True}
 
+    # Whether to defer deserializing top-level fields until they are accessed
+    _lazy_fields = False
+
     @classmethod
     def _doc_name(cls):
         return "Document"
 
+    @classmethod
+    def _get_db(cls):
+        # Establish the database connection, if it was deferred
+        food.get_db_client()
+
+        # pylint: disable=no-member
+        return super()._get_db()
+
+    @classmethod
+    def _from_son(cls, son, *args, **kwargs):
+        if not cls._lazy_fields:
+            # pylint: disable=no-member
+            return super()._from_son(son, *args, **kwargs)
+
+        #
+        # Embedded documents, lists, dicts, and binary data are kept in their
+        # raw BSON form until they are first accessed, so that loading a
+        # document doesn't pay for deserializing fields that are never used
+        #
+
+        _son = {}
+        raw = {}
+        for key, value in son.items():
+            # pylint: disable=no-member
+            field_name = cls._reverse_db_field_map.get(key, key)
+            field = cls._fields.get(field_name, None)
+            if field is not None and isinstance(value, (dict, list, bytes)):
+                raw[field_name] = (field, value)
+            else:
+                _son[key] = value
+
+        # pylint: disable=no-member
+        doc = super()._from_son(_son, *args, **kwargs)
+
+        if raw:
+            doc._data = _LazyData(doc, doc._data, raw)
+
+        return doc
+
+    def to_mongo(self, use_db_field=True, fields=None):
+        d = super().to_mongo(use_db_field=use_db_field, fields=fields)
+
+        data = self._data
+        if not isinstance(data, _LazyData) or not data._deferred:
+            return d
+
+        # Insert the raw values of fields that haven't been accessed, in order
+        root_fields = {f.split(".")[0] for f in fields or []}
+        son = SON()
+
+        # pylint: disable=no-member
+        for field_name in self._fields_ordered:
+            field = self._fields[field_name]
+            key = field.db_field if use_db_field else field_name
+            if field_name in data._raw:
+                if not root_fields or field_name in root_fields:
+                    son[key] = data._raw[field_name][1]
+            elif key in d:
+                son[key] = d.pop(key)
+
+        son.update(d)
+
+        return son
+
     def reload(self, *fields, **kwargs):
         """Reloads the document from the database.
 
@@ -634,6 +705,35 @@ class Document(BaseDocument, mongoengine.Document):
         validate=True,
         clean=True,
         **kwargs,
+    ):
+        data = self._data
+        if isinstance(data, _LazyData):
+            # Fields that have never been accessed cannot have been modified,
+            # so they are saved in their raw form
+            with data.deferred():
+                return self._save_doc(
+                    deferred=deferred,
+                    upsert=upsert,
+                    validate=validate,
+                    clean=clean,
+                    **kwargs,
+                )
+
+        return self._save_doc(
+            deferred=deferred,
+            upsert=upsert,
+            validate=validate,
+            clean=clean,
+            **kwargs,
+        )
+
+    def _save_doc(
+        self,
+        deferred=False,
+        upsert=False,
+        validate=True,
+        clean=True,
+        **kwargs,
     ):
         # pylint: disable=no-member
         if self._meta.get("abstract"):
@@ -729,6 +829,108 @@ class Document(BaseDocument, mongoengine.Document):
         return [op]
 
 
+class _LazyData(dict):
+    """The ``_data`` dict of a :class:`Document` whose values for the given
+    fields are deserialized from their raw BSON form on first access.
+
+    Args:
+        doc: the :class:`Document`
+        data: the dict of deserialized field values
+        raw: a dict mapping field names to ``(field, value)`` tuples of fields
+            whose raw values have not yet been deserialized
+    """
+
+    def __init__(self, doc, data, raw):
+        super().__init__(data)
+        for field_name in raw.keys():
+            super().__setitem__(field_name, None)
+
+        self._doc = weakref.ref(doc)
+        self._raw = raw
+        self._deferred = False
+
+    @contextmanager
+    def deferred(self):
+        """Context manager within which accessing a field that has not been
+        deserialized returns ``None`` rather than deserializing it.
+        """
+        deferred = self._deferred
+        self._deferred = True
+        try:
+            yield
+        finally:
+            self._deferred = deferred
+
+    def __getitem__(self, key):
+        if key in self._raw and not self._deferred:
+            self._load(key)
+
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        if key in self._raw and not self._deferred:
+            self._load(key)
+
+        return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        self._raw.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._raw.pop(key, None)
+        super().__delitem__(key)
+
+    def pop(self, key, *args):
+        if key in self._raw:
+            self._load(key)
+
+        return super().pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        if key in self._raw:
+            self._load(key)
+
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def values(self):
+        self._load_all()
+        return super().values()
+
+    def items(self):
+        self._load_all()
+        return super().items()
+
+    def copy(self):
+        self._load_all()
+        return dict(super().items())
+
+    def _load_all(self):
+        for key in list(self._raw.keys()):
+            self._load(key)
+
+    def _load(self, key):
+        field, value = self._raw.pop(key)
+        value = field.to_python(value)
+
+        # Link embedded documents to their parent, as mongoengine does when
+        # field values are set
+        doc = self._doc()
+        if doc is not None:
+            if isinstance(value, mongoengine.EmbeddedDocument):
+                value._instance = weakref.proxy(doc)
+            elif isinstance(value, (list, tuple)):
+                for v in value:
+                    if isinstance(v, mongoengine.EmbeddedDocument):
+                        v._instance = weakref.proxy(doc)
+
+        super().__setitem__(key, value)
+
+
 def _merge_lists(dst, src, overwrite=False):
     dst.extend(v for v in src if v not in dst)
 
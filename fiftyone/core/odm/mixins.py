@@ -58,6 +58,8 @@ class DatasetMixin(object):
     # Subtypes must declare this
     _dataset = None
 
+    _lazy_fields = True
+
     def __setattr__(self, name, value):
         if name in self._fields and value is not None:
             self._fields[name].validate(value)
@@ -1609,16 +1611,34 @@ class NoDatasetMixin(object):
                 "%s has no field '%s'" % (self._doc_name(), field_name)
             )
 
-    def to_dict(self, extended=False):
+    def to_dict(self, extended=False, fields=None):
+        """Serializes this document to a BSON/JSON dictionary.
+
+        Args:
+            extended (False): whether to serialize extended JSON constructs
+                such as ObjectIDs, Binary, etc. into JSON format
+            fields (None): an optional dict mapping field names to
+                :class:`fiftyone.core.fields.Field` instances whose
+                ``to_mongo()`` methods should be used to serialize the
+                corresponding values
+
+        Returns:
+            a dict
+        """
         d = {}
         for k, v in self._data.items():
+            field = fields.get(k, None) if fields else None
+
             # Store ObjectIds in private fields in the DB
             if k == "id":
                 k = "_id"
             elif isinstance(v, ObjectId) and not k.startswith("_"):
                 k = "_" + k
 
-            d[k] = serialize_value(v, extended=extended)
+            if field is not None and v is not None:
+                d[k] = field.to_mongo(v)
+            else:
+                d[k] = serialize_value(v, extended=extended)
 
         return d
 
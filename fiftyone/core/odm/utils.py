@@ -310,6 +310,10 @@ def get_field_kwargs(field):
         "info": field.info,
     }
 
+    if isinstance(field, (fof.VectorField, fof.ArrayField)):
+        if field.encoding is not None:
+            kwargs["encoding"] = field.encoding
+
     if isinstance(field, (fof.ListField, fof.DictField)):
         field = field.field
         if field is not None:
@@ -408,6 +412,10 @@ def _get_field_kwargs(value, field, dynamic):
         "info": field.info,
     }
 
+    if isinstance(field, (fof.VectorField, fof.ArrayField)):
+        if field.encoding is not None:
+            kwargs["encoding"] = field.encoding
+
     if isinstance(field, (fof.ListField, fof.DictField)):
         field = field.field
         if field is not None:
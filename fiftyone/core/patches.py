@@ -330,9 +330,12 @@ class _PatchesView(fov.DatasetView):
         # Regenerate the patches dataset
         #
         # This assumes that calling `load_view()` when the current patches
-        # dataset has been deleted will cause a new one to be generated
+        # dataset has been deleted will cause a new one to be generated.
+        # Cached (persistent) datasets are instead incrementally updated
         #
-        self._patches_dataset.delete()
+        if not self._patches_dataset.persistent:
+            self._patches_dataset.delete()
+
         _view = self._patches_stage.load_view(self._source_collection)
         self._patches_dataset = _view._patches_dataset
 
@@ -556,6 +556,9 @@ class Sample(_SampleMixin, Document, metaclass=SampleSingleton):
 
         sample_ops = super()._save(deferred=deferred)
 
+        if not deferred:
+            self._dataset._mark_modified()
+
         return sample_ops, frame_ops
 
     @classmethod
@@ -745,6 +748,9 @@ class SampleView(_SampleMixin, DocumentView):
 
         sample_ops = super()._save(deferred=deferred)
 
+        if not deferred:
+            self._dataset._mark_modified()
+
         return sample_ops, frame_ops
 
 
@@ -7445,8 +7445,23 @@ class ToPatches(ViewStage):
         else:
             name = None
 
-        if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
+        kwargs = dict(self._config or {})
+        cache = kwargs.pop("cache", False)
+
+        if cache:
+            make_dataset = lambda sc: fop.make_patches_dataset(
+                sc, self._field, **kwargs
+            )
+            patches_dataset = fod._load_cached_dataset(
+                sample_collection,
+                [etau.get_class_name(self), state],
+                make_dataset,
+                link_field=_get_patches_link_field(sample_collection),
+            )
+
+            state["name"] = patches_dataset.name
+            self._state = state
+        elif state != last_state or not fod.dataset_exists(name):
             patches_dataset = fop.make_patches_dataset(
                 sample_collection, self._field, **kwargs
             )
@@ -7589,8 +7604,23 @@ class ToEvaluationPatches(ViewStage):
         else:
             name = None
 
-        if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
+        kwargs = dict(self._config or {})
+        cache = kwargs.pop("cache", False)
+
+        if cache:
+            make_dataset = lambda sc: fop.make_evaluation_patches_dataset(
+                sc, self._eval_key, **kwargs
+            )
+            eval_patches_dataset = fod._load_cached_dataset(
+                sample_collection,
+                [etau.get_class_name(self), state],
+                make_dataset,
+                link_field=_get_patches_link_field(sample_collection),
+            )
+
+            state["name"] = eval_patches_dataset.name
+            self._state = state
+        elif state != last_state or not fod.dataset_exists(name):
             eval_patches_dataset = fop.make_evaluation_patches_dataset(
                 sample_collection, self._eval_key, **kwargs
             )
@@ -7746,8 +7776,23 @@ class ToClips(ViewStage):
         else:
             name = None
 
-        if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
+        kwargs = dict(self._config or {})
+        cache = kwargs.pop("cache", False)
+
+        if cache:
+            make_dataset = lambda sc: focl.make_clips_dataset(
+                sc, self._field_or_expr, **kwargs
+            )
+            clips_dataset = fod._load_cached_dataset(
+                sample_collection,
+                [etau.get_class_name(self), state],
+                make_dataset,
+                link_field=_get_video_link_field(sample_collection),
+            )
+
+            state["name"] = clips_dataset.name
+            self._state = state
+        elif state != last_state or not fod.dataset_exists(name):
             clips_dataset = focl.make_clips_dataset(
                 sample_collection, self._field_or_expr, **kwargs
             )
@@ -7880,8 +7925,23 @@ class ToTrajectories(ViewStage):
         else:
             name = None
 
-        if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
+        kwargs = dict(self._config or {})
+        cache = kwargs.pop("cache", False)
+
+        if cache:
+            make_dataset = lambda sc: focl.make_clips_dataset(
+                sc, self._field, trajectories=True, **kwargs
+            )
+            clips_dataset = fod._load_cached_dataset(
+                sample_collection,
+                [etau.get_class_name(self), state],
+                make_dataset,
+                link_field=_get_video_link_field(sample_collection),
+            )
+
+            state["name"] = clips_dataset.name
+            self._state = state
+        elif state != last_state or not fod.dataset_exists(name):
             clips_dataset = focl.make_clips_dataset(
                 sample_collection, self._field, trajectories=True, **kwargs
             )
@@ -8064,8 +8124,21 @@ class ToFrames(ViewStage):
         else:
             name = None
 
-        if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
+        kwargs = dict(self._config or {})
+        cache = kwargs.pop("cache", False)
+
+        if cache:
+            make_dataset = lambda sc: fovi.make_frames_dataset(sc, **kwargs)
+            frames_dataset = fod._load_cached_dataset(
+                sample_collection,
+                [etau.get_class_name(self), state],
+                make_dataset,
+                link_field=_get_video_link_field(sample_collection),
+            )
+
+            state["name"] = frames_dataset.name
+            self._state = state
+        elif state != last_state or not fod.dataset_exists(name):
             frames_dataset = fovi.make_frames_dataset(
                 sample_collection, **kwargs
             )
@@ -8101,6 +8174,23 @@ class ToFrames(ViewStage):
         ]
 
 
+def _get_patches_link_field(sample_collection):
+    # The field of generated patches that contains their source sample's ID
+    if sample_collection._is_frames:
+        return "_frame_id"
+
+    return "_sample_id"
+
+
+def _get_video_link_field(sample_collection):
+    # Clips and frames generated from clips reference the source video rather
+    # than the source clip, so they cannot be updated incrementally
+    if sample_collection._dataset._is_clips:
+        return None
+
+    return "_sample_id"
+
+
 def _parse_sample_ids(arg):
     if etau.is_str(arg):
         return [arg], False
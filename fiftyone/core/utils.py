@@ -953,13 +953,26 @@ class ProgressBar(etau.ProgressBar):
         super().__init__(*args, **kwargs)
 
 
+_WARM_START_BATCH_SIZES = {}
+
+
 class DynamicBatcher(object):
     """Class for iterating over the elements of an iterable with a dynamic
-    batch size to achieve a desired latency.
+    batch size to achieve a desired latency or content size.
+
+    By default, the batch sizes emitted when iterating over this object are
+    dynamically scaled such that the latency between ``next()`` calls is as
+    close as possible to a specified target latency.
+
+    Alternatively, if a ``target_size_bytes`` is provided, batches are scaled
+    such that their serialized size is as close as possible to the target
+    size. In this mode, the caller must report the serialized size of each
+    batch via :meth:`record_size`. If no size is reported for a batch, the
+    next batch size is computed based on latency.
 
-    The batch sizes emitted when iterating over this object are dynamically
-    scaled such that the latency between ``next()`` calls is as close as
-    possible to a specified target latency.
+    If a ``warm_start_key`` is provided, the most recent batch size learned
+    for the key is remembered and used as the initial batch size of future
+    batchers with the same key.
 
     This class is often used in conjunction with a :class:`ProgressBar` to keep
     the user appraised on the status of a long-running task.
@@ -988,6 +1001,11 @@ class DynamicBatcher(object):
             for batch in batcher:
                 print("batch size: %d" % len(batch))
 
+        batcher = fou.DynamicBatcher(elements, target_size_bytes=2**20)
+
+        for batch in batcher:
+            batcher.record_size(sum(len(str(e)) for e in batch))
+
     Args:
         iterable: an iterable
         target_latency (0.2): the target latency between ``next()``
@@ -1005,6 +1023,11 @@ class DynamicBatcher(object):
         total (None): the length of ``iterable``. Only applicable when
             ``progress=True``. If not provided, it is computed via
             ``len(iterable)``, if possible
+        target_size_bytes (None): an optional target serialized size, in
+            bytes, for each batch. If provided, batches are sized based on the
+            sizes reported via :meth:`record_size` rather than latency
+        warm_start_key (None): an optional key, e.g., a collection name, under
+            which to remember the learned batch size across batchers
     """
 
     def __init__(
@@ -1018,12 +1041,19 @@ class DynamicBatcher(object):
         return_views=False,
         progress=False,
         total=None,
+        target_size_bytes=None,
+        warm_start_key=None,
     ):
         import fiftyone.core.collections as foc
 
         if not isinstance(iterable, foc.SampleCollection):
             return_views = False
 
+        if warm_start_key is not None:
+            init_batch_size = _WARM_START_BATCH_SIZES.get(
+                warm_start_key, init_batch_size
+            )
+
         self.iterable = iterable
         self.target_latency = target_latency
         self.init_batch_size = init_batch_size
@@ -1033,10 +1063,13 @@ class DynamicBatcher(object):
         self.return_views = return_views
         self.progress = progress
         self.total = total
+        self.target_size_bytes = target_size_bytes
+        self.warm_start_key = warm_start_key
 
         self._iter = None
         self._last_time = None
         self._last_batch_size = None
+        self._last_size_bytes = None
         self._pb = None
         self._in_context = False
         self._last_offset = None
@@ -1115,6 +1148,16 @@ class DynamicBatcher(object):
 
         return batch
 
+    def record_size(self, num_bytes):
+        """Records the serialized size of the most recently emitted batch.
+
+        Only applicable when a ``target_size_bytes`` was provided.
+
+        Args:
+            num_bytes: the size of the batch, in bytes
+        """
+        self._last_size_bytes = num_bytes
+
     def _compute_batch_size(self):
         current_time = timeit.default_timer()
 
@@ -1122,10 +1165,15 @@ class DynamicBatcher(object):
             batch_size = self.init_batch_size
         else:
             # Compute optimal batch size
-            try:
-                beta = self.target_latency / (current_time - self._last_time)
-            except ZeroDivisionError:
-                beta = 1e6
+            if self.target_size_bytes is not None and self._last_size_bytes:
+                beta = self.target_size_bytes / self._last_size_bytes
+            else:
+                try:
+                    beta = self.target_latency / (
+                        current_time - self._last_time
+                    )
+                except ZeroDivisionError:
+                    beta = 1e6
 
             if self.max_batch_beta is not None:
                 if beta >= 1:
@@ -1141,7 +1189,11 @@ class DynamicBatcher(object):
             if self.max_batch_size is not None:
                 batch_size = min(batch_size, self.max_batch_size)
 
+            if self.warm_start_key is not None:
+                _WARM_START_BATCH_SIZES[self.warm_start_key] = batch_size
+
         self._last_batch_size = batch_size
+        self._last_size_bytes = None
         self._last_time = current_time
 
         return batch_size
@@ -1402,20 +1454,60 @@ def compute_filehash(filepath, method=None, chunk_size=None):
     return hasher.hexdigest()
 
 
-def serialize_numpy_array(array, ascii=False):
+# Supported encodings for serialized numpy arrays
+NUMPY_ARRAY_ENCODINGS = ("zlib", "none", "raw", "lz4")
+
+_NPY_MAGIC = b"\x93NUMPY"
+_RAW_ARRAY_MAGIC = b"\x93FOARR"
+_RAW_ARRAY_CODECS = {"raw": 0, "lz4": 1}
+_RAW_ARRAY_ALIGNMENT = 16
+
+
+def serialize_numpy_array(array, ascii=False, encoding=None):
     """Serializes a numpy array.
 
+    The following encodings are supported:
+
+    -   ``"zlib"`` (default): zlib-compressed bytes generated by
+        ``numpy.save``
+    -   ``"none"``: uncompressed bytes generated by ``numpy.save``
+    -   ``"raw"``: the array's raw little-endian buffer, prefixed by a small
+        dtype/shape header. Arrays with this encoding are deserialized without
+        copying the underlying data
+    -   ``"lz4"``: like ``"raw"`` but the buffer is lz4-compressed. Requires
+        the ``lz4`` package
+
+    All encodings can be loaded via :func:`deserialize_numpy_array`, which
+    automatically detects the encoding that was used.
+
     Args:
         array: a numpy array-like
         ascii (False): whether to return a base64-encoded ASCII string instead
             of raw bytes
+        encoding (None): the encoding to use. Supported values are
+            ``fiftyone.core.utils.NUMPY_ARRAY_ENCODINGS``. The default is
+            ``"zlib"``
 
     Returns:
         the serialized bytes
     """
-    with io.BytesIO() as f:
-        np.save(f, np.asarray(array), allow_pickle=False)
-        bytes_str = zlib.compress(f.getvalue())
+    if encoding is None:
+        encoding = "zlib"
+
+    if encoding in _RAW_ARRAY_CODECS:
+        bytes_str = _serialize_raw_array(np.asarray(array), encoding)
+    elif encoding in ("zlib", "none"):
+        with io.BytesIO() as f:
+            np.save(f, np.asarray(array), allow_pickle=False)
+            bytes_str = f.getvalue()
+
+        if encoding == "zlib":
+            bytes_str = zlib.compress(bytes_str)
+    else:
+        raise ValueError(
+            "Unsupported encoding '%s'; supported values are %s"
+            % (encoding, NUMPY_ARRAY_ENCODINGS)
+        )
 
     if ascii:
         bytes_str = b64encode(bytes_str).decode("ascii")
@@ -1427,6 +1519,10 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     """Loads a serialized numpy array generated by
     :func:`serialize_numpy_array`.
 
+    The encoding of the array is automatically detected. Arrays that were
+    serialized with ``encoding="raw"`` are returned as read-only views into
+    ``numpy_bytes``.
+
     Args:
         numpy_bytes: the serialized numpy array bytes
         ascii (False): whether the bytes were generated with the
@@ -1438,10 +1534,81 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     if ascii:
         numpy_bytes = b64decode(numpy_bytes.encode("ascii"))
 
-    with io.BytesIO(zlib.decompress(numpy_bytes)) as f:
+    if numpy_bytes[: len(_RAW_ARRAY_MAGIC)] == _RAW_ARRAY_MAGIC:
+        return _deserialize_raw_array(numpy_bytes)
+
+    if numpy_bytes[: len(_NPY_MAGIC)] != _NPY_MAGIC:
+        numpy_bytes = zlib.decompress(numpy_bytes)
+
+    with io.BytesIO(numpy_bytes) as f:
         return np.load(f)
 
 
+def _serialize_raw_array(array, encoding):
+    dtype = array.dtype
+    if dtype.hasobject or dtype.names is not None:
+        raise ValueError(
+            "Arrays with dtype %s cannot be serialized with encoding '%s'"
+            % (dtype, encoding)
+        )
+
+    if dtype.byteorder == ">" or (
+        dtype.byteorder == "=" and sys.byteorder == "big"
+    ):
+        array = array.astype(dtype.newbyteorder("<"))
+
+    descr = array.dtype.str.encode("ascii")
+
+    header = (
+        _RAW_ARRAY_MAGIC
+        + struct.pack(
+            "<BBB", _RAW_ARRAY_CODECS[encoding], array.ndim, len(descr)
+        )
+        + descr
+        + struct.pack("<%dQ" % array.ndim, *array.shape)
+    )
+
+    # Pad header so that the buffer is aligned for all numeric dtypes
+    header += b"\x00" * (-len(header) % _RAW_ARRAY_ALIGNMENT)
+
+    buffer = array.tobytes()
+    if encoding == "lz4":
+        buffer = _get_lz4().compress(buffer)
+
+    return header + buffer
+
+
+def _deserialize_raw_array(numpy_bytes):
+    offset = len(_RAW_ARRAY_MAGIC)
+    codec, ndim, descr_len = struct.unpack_from("<BBB", numpy_bytes, offset)
+    offset += 3
+
+    descr = bytes(numpy_bytes[offset : offset + descr_len]).decode("ascii")
+    offset += descr_len
+
+    shape = struct.unpack_from("<%dQ" % ndim, numpy_bytes, offset)
+    offset += 8 * ndim
+    offset += -offset % _RAW_ARRAY_ALIGNMENT
+
+    dtype = np.dtype(descr)
+
+    if codec == _RAW_ARRAY_CODECS["lz4"]:
+        numpy_bytes = _get_lz4().decompress(numpy_bytes[offset:])
+        offset = 0
+
+    count = int(np.prod(shape, dtype=np.int64))
+    array = np.frombuffer(numpy_bytes, dtype=dtype, count=count, offset=offset)
+    return array.reshape(shape)
+
+
+def _get_lz4():
+    ensure_package("lz4")
+
+    import lz4.frame
+
+    return lz4.frame
+
+
 def iter_batches(iterable, batch_size):
     """Iterates over the given iterable in batches.
 
@@ -290,9 +290,12 @@ class FramesView(fov.DatasetView):
         # Regenerate the frames dataset
         #
         # This assumes that calling `load_view()` when the current patches
-        # dataset has been deleted will cause a new one to be generated
+        # dataset has been deleted will cause a new one to be generated.
+        # Cached (persistent) datasets are instead incrementally updated
         #
-        self._frames_dataset.delete()
+        if not self._frames_dataset.persistent:
+            self._frames_dataset.delete()
+
         _view = self._frames_stage.load_view(self._source_collection)
         self._frames_dataset = _view._frames_dataset
 
@@ -57,6 +57,9 @@ class DatasetView(foc.SampleCollection):
             view
     """
 
+    # Populated by enable_cache()
+    _view_cache = None
+
     def __init__(
         self,
         dataset,
@@ -1258,6 +1261,83 @@ class DatasetView(foc.SampleCollection):
             view=self,
         )
 
+    def enable_cache(self):
+        """Enables caching of this view's compiled pipeline and sample count.
+
+        When caching is enabled, the aggregation pipeline that defines the view
+        and the result of :meth:`count` (and thus ``len(view)``) are memoized
+        on this view instance until the underlying dataset is modified through
+        FiftyOne, at which point they are automatically recomputed.
+
+        This is useful when a complex view is repeatedly iterated or counted,
+        for example in a training loop.
+
+        .. note::
+
+            Caching is opt-in and applies only to this view instance. Views
+            derived from it, e.g. via :meth:`match`, are not cached unless you
+            also call this method on them.
+
+        .. warning::
+
+            Modifications to the underlying database that are not made through
+            FiftyOne, e.g. by another process, are not detected. Call
+            :meth:`clear_cache` or :meth:`reload` in such cases.
+        """
+        if self._view_cache is None:
+            self._view_cache = {}
+
+    def disable_cache(self):
+        """Disables caching for this view, if it was enabled via
+        :meth:`enable_cache`, and clears any cached values.
+        """
+        self._view_cache = None
+
+    def clear_cache(self):
+        """Clears any values cached by this view. See :meth:`enable_cache`."""
+        if self._view_cache is not None:
+            self._view_cache.clear()
+
+    def count(self, field_or_expr=None, expr=None, safe=False):
+        """Counts the number of field values in the view.
+
+        See :meth:`fiftyone.core.collections.SampleCollection.count` for
+        details. If :meth:`enable_cache` has been called, the number of
+        samples in the view is cached.
+
+        Args:
+            field_or_expr (None): a field name, ``embedded.field.name``,
+                :class:`fiftyone.core.expressions.ViewExpression`, or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                defining the field or expression to aggregate. If neither
+                ``field_or_expr`` or ``expr`` is provided, the samples
+                themselves are counted
+            expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                to apply to ``field_or_expr`` (which must be a field) before
+                aggregating
+            safe (False): whether to ignore nan/inf values when dealing with
+                floating point values
+
+        Returns:
+            the count
+        """
+        if (
+            self._view_cache is None
+            or field_or_expr is not None
+            or expr is not None
+        ):
+            return super().count(
+                field_or_expr=field_or_expr, expr=expr, safe=safe
+            )
+
+        key = self._get_cache_key()
+        if self._view_cache.get("count_key") != key:
+            self._view_cache["count"] = super().count(safe=safe)
+            self._view_cache["count_key"] = key
+
+        return self._view_cache["count"]
+
     def reload(self):
         """Reloads the view.
 
@@ -1266,6 +1346,7 @@ class DatasetView(foc.SampleCollection):
         be updated by calling this method.
         """
         self._dataset.reload()
+        self.clear_cache()
 
         _view = self._base_view
         for stage in self._stages:
@@ -1401,21 +1482,31 @@ class DatasetView(foc.SampleCollection):
 
         return pipeline
 
-    def _pipeline(
-        self,
-        pipeline=None,
-        media_type=None,
-        attach_frames=False,
-        detach_frames=False,
-        frames_only=False,
-        support=None,
-        group_slice=None,
-        group_slices=None,
-        detach_groups=False,
-        groups_only=False,
-        manual_group_select=False,
-        post_pipeline=None,
-    ):
+    def _get_cache_key(self):
+        if self._dataset.media_type == fom.GROUP:
+            group_slice = self.__group_slice or self._dataset.group_slice
+        else:
+            group_slice = None
+
+        return (
+            self._dataset._modification_count,
+            self._root_dataset._modification_count,
+            group_slice,
+        )
+
+    def _get_stage_pipelines(self):
+        if self._view_cache is None:
+            return self._compile_stages()
+
+        key = self._get_cache_key()
+        if self._view_cache.get("stages_key") != key:
+            self._view_cache["stages"] = self._compile_stages()
+            self._view_cache["stages_key"] = key
+
+        # Callers may modify the pipelines, so we return a copy
+        return deepcopy(self._view_cache["stages"])
+
+    def _compile_stages(self):
         _pipelines = []
         _view = self._base_view
 
@@ -1428,6 +1519,7 @@ class DatasetView(foc.SampleCollection):
         _contains_groups = self._dataset.media_type == fom.GROUP
         _group_slices = set()
         _attach_groups_idx = None
+        _manual_group_select = False
 
         idx = 0
         for stage in self._stages:
@@ -1452,7 +1544,7 @@ class DatasetView(foc.SampleCollection):
                 if idx == 0:
                     _media_type = stage.get_media_type(_view)
                     if _media_type not in (None, fom.GROUP):
-                        manual_group_select = True
+                        _manual_group_select = True
 
                 # Determine if stage needs group slices attached
                 _stage_group_slices = stage._needs_group_slices(_view)
@@ -1488,6 +1580,46 @@ class DatasetView(foc.SampleCollection):
             _view = _view._add_view_stage(stage, validate=False)
             idx += 1
 
+        return (
+            _pipelines,
+            _found_select_group_slice,
+            _attach_frames_idx,
+            _attach_frames_idx0,
+            _attach_frames_idx1,
+            _group_slices,
+            _attach_groups_idx,
+            _manual_group_select,
+        )
+
+    def _pipeline(
+        self,
+        pipeline=None,
+        media_type=None,
+        attach_frames=False,
+        detach_frames=False,
+        frames_only=False,
+        support=None,
+        group_slice=None,
+        group_slices=None,
+        detach_groups=False,
+        groups_only=False,
+        manual_group_select=False,
+        post_pipeline=None,
+    ):
+        (
+            _pipelines,
+            _found_select_group_slice,
+            _attach_frames_idx,
+            _attach_frames_idx0,
+            _attach_frames_idx1,
+            _group_slices,
+            _attach_groups_idx,
+            _manual_group_select,
+        ) = self._get_stage_pipelines()
+
+        if _manual_group_select:
+            manual_group_select = True
+
         if _attach_frames_idx is None and (attach_frames or frames_only):
             _attach_frames_idx = len(_pipelines)
 
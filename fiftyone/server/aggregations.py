@@ -18,7 +18,7 @@ import fiftyone.core.media as fom
 from fiftyone.core.utils import datetime_to_timestamp
 import fiftyone.core.view as fov
 
-from fiftyone.server.constants import LIST_LIMIT
+from fiftyone.server.constants import LIST_LIMIT, SLIDER_QUANTILES
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 from fiftyone.server.inputs import SelectedLabel
 from fiftyone.server.scalars import BSON, BSONArray
@@ -36,6 +36,7 @@ class AggregationForm:
     index: t.Optional[int]
     mixed: bool
     paths: t.List[str]
+    quantiles: bool = False
     sample_ids: t.List[gql.ID]
     slice: t.Optional[str]
     slices: t.Optional[t.List[str]]
@@ -65,6 +66,7 @@ class DataAggregation(Aggregation):
 class IntAggregation(Aggregation):
     max: t.Optional[float]
     min: t.Optional[float]
+    quantiles: t.Optional[t.List[float]] = None
 
 
 @gql.type
@@ -74,6 +76,7 @@ class FloatAggregation(Aggregation):
     min: t.Optional[float]
     nan: int
     ninf: int
+    quantiles: t.Optional[t.List[float]] = None
 
 
 @gql.type
@@ -150,7 +153,10 @@ async def aggregate_resolver(
         view = view.select_group_slices(_force_mixed=True)
 
     aggregations, deserializers = zip(
-        *[_resolve_path_aggregation(path, view) for path in form.paths]
+        *[
+            _resolve_path_aggregation(path, view, quantiles=form.quantiles)
+            for path in form.paths
+        ]
     )
     counts = [len(a) for a in aggregations]
     flattened = [item for sublist in aggregations for item in sublist]
@@ -198,7 +204,7 @@ RESULT_MAPPING = {
 
 
 def _resolve_path_aggregation(
-    path: str, view: foc.SampleCollection
+    path: str, view: foc.SampleCollection, quantiles: bool = False
 ) -> AggregateResult:
     aggregations: t.List[foa.Aggregation] = [
         foa.Count(path if path and path != "" else None)
@@ -217,9 +223,14 @@ def _resolve_path_aggregation(
     if meets_type(field, fof.BooleanField):
         aggregations.append(foa.CountValues(path))
 
-    elif meets_type(field, (fof.DateField, fof.DateTimeField, fof.IntField)):
+    elif meets_type(field, (fof.DateField, fof.DateTimeField)):
         aggregations.append(foa.Bounds(path))
 
+    elif meets_type(field, fof.IntField):
+        aggregations.append(foa.Bounds(path))
+        if quantiles:
+            aggregations.append(foa.ApproxQuantiles(path, SLIDER_QUANTILES))
+
     elif meets_type(field, fof.FloatField):
         aggregations.append(
             foa.Bounds(
@@ -228,6 +239,10 @@ def _resolve_path_aggregation(
                 _count_nonfinites=True,
             )
         )
+        if quantiles:
+            aggregations.append(
+                foa.ApproxQuantiles(path, SLIDER_QUANTILES, safe=True)
+            )
 
     elif meets_type(field, (fof.ObjectIdField, fof.StringField)):
         aggregations.append(foa.CountValues(path, _first=LIST_LIMIT))
@@ -256,6 +271,8 @@ def _resolve_path_aggregation(
                         if meets_type(mx, (datetime, date))
                         else mx
                     )
+            elif isinstance(aggregation, foa.ApproxQuantiles):
+                data["quantiles"] = result
             elif isinstance(aggregation, foa.Count):
                 data["count"] = result
             elif isinstance(aggregation, foa.CountValues):
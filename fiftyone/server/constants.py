@@ -7,3 +7,4 @@ FiftyOne Server constants
 """
 
 LIST_LIMIT = 200
+SLIDER_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
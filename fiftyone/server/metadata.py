@@ -15,13 +15,17 @@ from functools import reduce
 
 import asyncio
 import aiofiles
+import aiofiles.os
+import cachetools
 import strawberry as gql
 
 import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.video as etav
+import fiftyone as fo
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
 from fiftyone.core.collections import SampleCollection
 from fiftyone.utils.utils3d import OrthographicProjectionMetadata
 
@@ -36,6 +40,12 @@ _ADDITIONAL_MEDIA_FIELDS = {
 }
 _FFPROBE_BINARY_PATH = shutil.which("ffprobe")
 
+# Process-wide cache of media dimensions keyed by ``(filepath, mtime)``
+_media_metadata_cache = None
+
+# References to pending metadata writebacks, to prevent garbage collection
+_writeback_tasks = set()
+
 
 @gql.enum
 class MediaType(Enum):
@@ -102,9 +112,9 @@ async def get_metadata(
 
     if filepath not in metadata_cache:
         try:
-            # Retrieve media metadata from disk
-            metadata_cache[filepath] = await read_metadata(
-                filepath_source, is_video
+            # Retrieve media metadata from the process-wide cache or disk
+            metadata_cache[filepath] = await _get_media_metadata(
+                collection, sample, filepath_source, media_type
             )
         except Exception as exc:
             # Immediately fail so the user knows they should install FFmpeg
@@ -121,6 +131,14 @@ async def get_metadata(
     return dict(urls=urls, **metadata_cache[filepath])
 
 
+def clear_metadata_cache():
+    """Clears the process-wide cache of media metadata that the server
+    maintains for samples whose ``metadata`` field is not populated.
+    """
+    if _media_metadata_cache is not None:
+        _media_metadata_cache.clear()
+
+
 async def read_metadata(filepath, is_video):
     """Calculates the metadata for the given local media path.
 
@@ -131,16 +149,84 @@ async def read_metadata(filepath, is_video):
     Returns:
         dict
     """
+    width, height, frame_rate = await _read_dimensions(filepath, is_video)
+    return _make_metadata(width, height, frame_rate, is_video)
+
+
+async def _get_media_metadata(collection, sample, filepath, media_type):
+    global _media_metadata_cache
+
+    if _media_metadata_cache is None:
+        _media_metadata_cache = cachetools.LRUCache(
+            maxsize=fo.config.app_metadata_cache_size
+        )
+
+    is_video = media_type == fom.VIDEO
+
+    # Keying on modification time ensures that edited media is re-read
+    stat = await aiofiles.os.stat(filepath)
+    key = (filepath, stat.st_mtime)
+
+    dims = _media_metadata_cache.get(key, None)
+    if dims is None:
+        dims = await _read_dimensions(filepath, is_video)
+        _media_metadata_cache[key] = dims
+
+        if fo.config.app_metadata_writeback and filepath == sample.get(
+            "filepath", None
+        ):
+            _writeback_metadata(collection, sample, media_type, *dims)
+
+    return _make_metadata(*dims, is_video)
+
+
+async def _read_dimensions(filepath, is_video):
     if is_video:
         info = await get_stream_info(filepath)
-        return dict(
-            aspect_ratio=info.frame_size[0] / info.frame_size[1],
-            frame_rate=info.frame_rate,
-        )
+        width, height = info.frame_size
+        return width, height, info.frame_rate
 
     async with aiofiles.open(filepath, "rb") as f:
         width, height = await get_image_dimensions(f)
-        return dict(aspect_ratio=width / height)
+        return width, height, None
+
+
+def _make_metadata(width, height, frame_rate, is_video):
+    if is_video:
+        return dict(aspect_ratio=width / height, frame_rate=frame_rate)
+
+    return dict(aspect_ratio=width / height)
+
+
+def _writeback_metadata(collection, sample, media_type, width, height, rate):
+    if media_type == fom.VIDEO:
+        cls = "VideoMetadata"
+        values = dict(frame_width=width, frame_height=height, frame_rate=rate)
+    elif media_type == fom.IMAGE:
+        cls = "ImageMetadata"
+        values = dict(width=width, height=height)
+    else:
+        return
+
+    metadata = sample.get("metadata", None)
+    if metadata:
+        update = {"metadata." + k: v for k, v in values.items()}
+    else:
+        update = {"metadata": dict(_cls=cls, **values)}
+
+    coll_name = collection._dataset._sample_collection_name
+    coll = foo.get_async_db_conn()[coll_name]
+
+    task = asyncio.create_task(_write_metadata(coll, sample["_id"], update))
+    _writeback_tasks.add(task)
+    task.add_done_callback(_writeback_tasks.discard)
+
+
+async def _write_metadata(coll, _id, update):
+    try:
+        await coll.update_one({"_id": _id}, {"$set": update})
+    except Exception as e:
+        logger.debug("Failed to write metadata for sample '%s': %s", _id, e)
 
 
 class Reader(object):
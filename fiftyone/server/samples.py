@@ -6,13 +6,19 @@ FiftyOne Server samples pagination
 |
 """
 import asyncio
+import base64
+from copy import copy
+from bson import json_util
+import cachetools
 import strawberry as gql
 import typing as t
 
 
 from fiftyone.core.collections import SampleCollection
+import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.stages as fosg
 from fiftyone.core.utils import run_sync_task
 
 from fiftyone.server.filters import SampleFilter
@@ -63,6 +69,46 @@ MEDIA_TYPES = {
     fom.VIDEO: VideoSample,
 }
 
+# Stages that may follow a sort without changing the order of the samples
+_ORDER_PRESERVING_STAGES = (
+    fosg.Exclude,
+    fosg.ExcludeBy,
+    fosg.ExcludeFields,
+    fosg.ExcludeFrames,
+    fosg.ExcludeLabels,
+    fosg.Exists,
+    fosg.FilterField,
+    fosg.FilterKeypoints,
+    fosg.FilterLabels,
+    fosg.LimitLabels,
+    fosg.MapLabels,
+    fosg.Match,
+    fosg.MatchFrames,
+    fosg.MatchLabels,
+    fosg.MatchTags,
+    fosg.Select,
+    fosg.SelectBy,
+    fosg.SelectFields,
+    fosg.SelectFrames,
+    fosg.SelectLabels,
+    fosg.SetField,
+)
+
+_KEYSET_FIELD_TYPES = (
+    fof.BooleanField,
+    fof.DateField,
+    fof.DateTimeField,
+    fof.FloatField,
+    fof.IntField,
+    fof.ObjectIdField,
+    fof.StringField,
+)
+
+# Sort keys of the last sample of recently served pages, keyed by the page's
+# base pipeline and offset, so that requests for subsequent pages via numeric
+# cursors can also use keyset pagination
+_keyset_cache = cachetools.TTLCache(maxsize=1000, ttl=900)
+
 
 async def paginate_samples(
     dataset: str,
@@ -96,13 +142,9 @@ async def paginate_samples(
     # full datasets.
     full_lookup = has_frames and (filters or stages)
     support = [1, 1] if not full_lookup else None
-    if after is None:
-        after = "-1"
-
-    if int(after) > -1:
-        view = view.skip(int(after) + 1)
+    offset, keys = _parse_cursor(after)
 
-    pipeline = view._pipeline(
+    pipeline_kwargs = dict(
         attach_frames=has_frames,
         detach_frames=False,
         manual_group_select=sample_filter
@@ -111,6 +153,20 @@ async def paginate_samples(
         support=support,
     )
 
+    keyset = _get_keyset(view)
+    if keyset is not None:
+        cache_key = json_util.dumps(view._pipeline(**pipeline_kwargs))
+        if keys is None and offset > -1:
+            keys = _keyset_cache.get((cache_key, offset), None)
+
+        view = _make_keyset_view(view, keyset, keys)
+    else:
+        keys = None
+
+    if offset > -1 and keys is None:
+        view = view.skip(offset + 1)
+
+    pipeline = view._pipeline(**pipeline_kwargs)
     # Only return the first frame of each video sample for the grid thumbnail
     if has_frames:
         pipeline.append({"$addFields": {"frames": {"$slice": ["$frames", 1]}}})
@@ -141,21 +197,151 @@ async def paginate_samples(
         edges.append(
             Edge(
                 node=node,
-                cursor=str(idx + int(after) + 1),
+                cursor=str(idx + offset + 1),
             )
         )
 
+    end_cursor = None
+    if samples:
+        end_offset = offset + len(samples)
+        end_keys = None
+        if keyset is not None:
+            end_keys = _get_keys(samples[-1], keyset)
+            if end_keys is not None:
+                _keyset_cache[(cache_key, end_offset)] = end_keys
+
+        end_cursor = _make_cursor(end_offset, end_keys)
+
     return Connection(
         page_info=PageInfo(
             has_previous_page=False,
             has_next_page=more,
             start_cursor=edges[0].cursor if edges else None,
-            end_cursor=edges[-1].cursor if len(edges) > 1 else None,
+            end_cursor=end_cursor,
         ),
         edges=edges,
     )
 
 
+def _parse_cursor(after):
+    # Numeric cursors are the offset of the last seen sample
+    if after is None:
+        return -1, None
+
+    try:
+        return int(after), None
+    except ValueError:
+        pass
+
+    d = json_util.loads(base64.urlsafe_b64decode(after.encode()).decode())
+    return d["offset"], d.get("keys", None)
+
+
+def _make_cursor(offset, keys):
+    d = {"offset": offset}
+    if keys is not None:
+        d["keys"] = keys
+
+    return base64.urlsafe_b64encode(json_util.dumps(d).encode()).decode()
+
+
+def _get_keyset(view):
+    # Returns the ``(stage_index, path, order)`` of the sort that determines
+    # the order of the view, if it can be used for keyset pagination
+    stages = getattr(view, "_stages", [])
+
+    for idx in range(len(stages) - 1, -1, -1):
+        stage = stages[idx]
+        if isinstance(stage, fosg.SortBy):
+            break
+
+        if not isinstance(stage, _ORDER_PRESERVING_STAGES):
+            return None
+
+        if getattr(stage, "ordered", False):
+            return None
+    else:
+        return None
+
+    path = stage._get_mongo_field_or_expr()
+    if not isinstance(path, str):
+        return None
+
+    if view._is_frame_field(path) or view._is_group_field(path):
+        return None
+
+    field = view._dataset.get_field(path)
+    if not isinstance(field, _KEYSET_FIELD_TYPES):
+        return None
+
+    _, _, list_fields, _, _ = view._dataset._parse_field_name(path)
+    if list_fields:
+        return None
+
+    path, _, _ = view._handle_id_fields(path)
+
+    # Stages that edit field values must not edit the sort field
+    for _stage in stages[idx + 1 :]:
+        if isinstance(_stage, (fosg.MapLabels, fosg.SetField)):
+            field = _stage.field
+            if path == field or path.startswith(field + "."):
+                return None
+
+    order = -1 if stage.reverse else 1
+
+    return idx, path, order
+
+
+def _make_keyset_view(view, keyset, keys):
+    # Replaces the view's sort with an equivalent one that is tie-broken by
+    # ``_id``, preceded by a range ``$match`` that resumes after ``keys``
+    idx, path, order = keyset
+
+    pipeline = []
+
+    if keys is not None:
+        value, _id = keys
+        op = "$gt" if order > 0 else "$lt"
+        if path == "_id":
+            query = {"_id": {op: _id}}
+        else:
+            query = {
+                "$or": [
+                    {path: {op: value}},
+                    {path: value, "_id": {op: _id}},
+                ]
+            }
+
+            # Null/missing values sort last in descending order. Keys are
+            # never null, see _get_keys()
+            if order < 0:
+                query["$or"].append({path: None})
+
+        pipeline.append({"$match": query})
+
+    sort = {path: order}
+    sort["_id"] = order
+    pipeline.append({"$sort": sort})
+
+    _view = copy(view)
+    _view._stages[idx] = fosg.Mongo(pipeline)
+
+    return _view
+
+
+def _get_keys(sample, keyset):
+    _, path, _ = keyset
+
+    value = fosm._deep_get(sample, path)
+
+    # Sort values that are missing from the output, e.g., due to filtering,
+    # cannot be used as keys
+    if value is None:
+        return None
+
+    return [value, sample["_id"]]
+
+
 async def _create_sample_item(
     dataset: SampleCollection,
     sample: t.Dict,
@@ -10,11 +10,13 @@ from collections import defaultdict
 import csv
 from datetime import datetime
 from itertools import groupby
+import json
 import logging
 import multiprocessing
 import multiprocessing.dummy
 import os
 import random
+import re
 import shutil
 import warnings
 
@@ -338,6 +340,10 @@ class COCODetectionDatasetImporter(
             number of samples loaded may be less than this maximum value if the
             dataset does not contain sufficient samples matching your
             requirements. By default, all matching samples are loaded
+        streaming (False): whether to parse the labels JSON incrementally and
+            lazily load the annotations for each sample from disk as the
+            samples are imported, rather than loading all annotations into
+            memory up front. This is recommended for very large labels files
     """
 
     def __init__(
@@ -358,6 +364,7 @@ class COCODetectionDatasetImporter(
         shuffle=False,
         seed=None,
         max_samples=None,
+        streaming=False,
     ):
         if dataset_dir is None and data_path is None and labels_path is None:
             raise ValueError(
@@ -406,6 +413,7 @@ class COCODetectionDatasetImporter(
         self.only_matching = only_matching
         self.use_polylines = use_polylines
         self.tolerance = tolerance
+        self.streaming = streaming
 
         self._label_types = _label_types
         self._info = None
@@ -547,13 +555,18 @@ class COCODetectionDatasetImporter(
         image_paths_map = self._load_data_map(self.data_path, recursive=True)
 
         if self.labels_path is not None and os.path.isfile(self.labels_path):
+            if self.streaming:
+                _load_annotations = _load_coco_detection_annotations_streaming
+            else:
+                _load_annotations = load_coco_detection_annotations
+
             (
                 info,
                 classes,
                 supercategory_map,
                 images,
                 annotations,
-            ) = load_coco_detection_annotations(
+            ) = _load_annotations(
                 self.labels_path, extra_attrs=self.extra_attrs
             )
 
@@ -609,6 +622,10 @@ class COCODetectionDatasetImporter(
     def get_dataset_info(self):
         return self._info
 
+    def close(self, *args):
+        if isinstance(self._annotations, _COCOAnnotationsIndex):
+            self._annotations.close()
+
 
 class COCODetectionDatasetExporter(
     foud.LabeledImageDatasetExporter, foud.ExportPathsMixin
@@ -1398,6 +1415,308 @@ def _parse_coco_detection_annotations(d, extra_attrs=True):
     return info, classes, supercategory_map, images, annotations
 
 
+def _load_coco_detection_annotations_streaming(json_path, extra_attrs=True):
+    # Everything but the annotations is loaded into memory as usual, while the
+    # annotations are indexed by their location in the file and loaded lazily
+    d = {}
+    annotations = None
+    with open(json_path, "rb") as f:
+        parser = _JSONStreamParser(f)
+        for key in parser.iter_keys():
+            if key == "annotations":
+                annotations = _COCOAnnotationsIndex.build(
+                    json_path, parser.iter_array(), extra_attrs=extra_attrs
+                )
+            elif key == "images":
+                d[key] = [i for i, _, _ in parser.iter_array()]
+            else:
+                d[key] = parser.read_value()
+
+    (
+        info,
+        classes,
+        supercategory_map,
+        images,
+        _,
+    ) = _parse_coco_detection_annotations(d, extra_attrs=extra_attrs)
+
+    return info, classes, supercategory_map, images, annotations
+
+
+class _COCOAnnotationsIndex(object):
+    """Read-only dict-like mapping of image IDs to lists of
+    :class:`COCOObject` instances that lazily loads the annotations for each
+    image from the byte ranges in which they are stored in a JSON file.
+    """
+
+    def __init__(
+        self,
+        json_path,
+        image_ids_map,
+        splits,
+        category_ids,
+        offsets,
+        lengths,
+        extra_attrs=True,
+    ):
+        self.json_path = json_path
+        self.extra_attrs = extra_attrs
+
+        self._image_ids_map = image_ids_map
+        self._splits = splits
+        self._category_ids = category_ids
+        self._offsets = offsets
+        self._lengths = lengths
+        self._file = None
+
+    @classmethod
+    def build(cls, json_path, annotations, extra_attrs=True):
+        """Builds an index from a stream of annotations.
+
+        Args:
+            json_path: the path to the JSON file
+            annotations: an iterable of ``(anno_dict, start, end)`` tuples
+                containing annotation dicts and the byte ranges in which they
+                are stored in the JSON file
+            extra_attrs (True): whether to load extra annotation attributes
+
+        Returns:
+            a :class:`_COCOAnnotationsIndex`
+        """
+        image_ids_map = {}
+        keys = []
+        category_ids = []
+        offsets = []
+        lengths = []
+        for anno, start, end in annotations:
+            key = image_ids_map.setdefault(
+                anno["image_id"], len(image_ids_map)
+            )
+            keys.append(key)
+            category_ids.append(anno.get("category_id", -1))
+            offsets.append(start)
+            lengths.append(end - start)
+
+        keys = np.array(keys, dtype=np.int64)
+        inds = np.argsort(keys, kind="stable")
+        counts = np.bincount(keys, minlength=len(image_ids_map))
+        splits = np.concatenate([[0], np.cumsum(counts)])
+
+        return cls(
+            json_path,
+            image_ids_map,
+            splits,
+            np.array(category_ids, dtype=np.int64)[inds],
+            np.array(offsets, dtype=np.int64)[inds],
+            np.array(lengths, dtype=np.int64)[inds],
+            extra_attrs=extra_attrs,
+        )
+
+    def __len__(self):
+        return len(self._image_ids_map)
+
+    def __contains__(self, image_id):
+        return image_id in self._image_ids_map
+
+    def get(self, image_id, default=None):
+        """Loads the :class:`COCOObject` instances for the given image.
+
+        Args:
+            image_id: the image ID
+            default (None): the value to return if the image has no
+                annotations
+
+        Returns:
+            a list of :class:`COCOObject` instances, or ``default``
+        """
+        key = self._image_ids_map.get(image_id, None)
+        if key is None:
+            return default
+
+        if self._file is None:
+            self._file = open(self.json_path, "rb")
+
+        i, j = self._splits[key], self._splits[key + 1]
+        offsets = self._offsets[i:j]
+        lengths = self._lengths[i:j]
+
+        # Read all annotations in one shot if they are stored contiguously
+        start = offsets.min()
+        end = (offsets + lengths).max()
+        if end - start <= 2 * lengths.sum() + 4096:
+            self._file.seek(start)
+            buf = self._file.read(end - start)
+            raws = [
+                buf[(o - start) : (o - start + l)]
+                for o, l in zip(offsets, lengths)
+            ]
+        else:
+            raws = []
+            for o, l in zip(offsets, lengths):
+                self._file.seek(o)
+                raws.append(self._file.read(l))
+
+        return [
+            COCOObject.from_anno_dict(
+                json.loads(raw), extra_attrs=self.extra_attrs
+            )
+            for raw in raws
+        ]
+
+    def get_category_ids(self, image_id):
+        """Returns the category IDs of the annotations for the given image.
+
+        Args:
+            image_id: the image ID
+
+        Returns:
+            a set of category IDs
+        """
+        key = self._image_ids_map.get(image_id, None)
+        if key is None:
+            return set()
+
+        i, j = self._splits[key], self._splits[key + 1]
+        return set(self._category_ids[i:j].tolist())
+
+    def close(self):
+        """Closes the underlying JSON file, if necessary."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamParser(object):
+    """Incremental parser for reading large JSON objects from binary files
+    without loading them into memory.
+
+    The parser decodes the file as latin-1, which maps bytes one-to-one to
+    characters, so that the byte offsets of parsed values can be tracked.
+    Values containing non-ASCII characters are re-parsed as UTF-8.
+
+    Args:
+        f: a file opened in binary mode
+        chunk_size (1048576): the number of bytes to read at a time
+    """
+
+    def __init__(self, f, chunk_size=1048576):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._buf_offset = 0
+        self._pos = 0
+        self._eof = False
+
+    def iter_keys(self):
+        """Iterates over the keys of the JSON object at the current position.
+
+        The caller must consume the value of each key via :meth:`read_value`
+        or :meth:`iter_array` before requesting the next key.
+
+        Returns:
+            a generator that emits keys
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key, _, _ = self._read()
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def iter_array(self):
+        """Iterates over the elements of the JSON array at the current
+        position.
+
+        Returns:
+            a generator that emits ``(value, start, end)`` tuples containing
+            the elements of the array and the byte ranges in which they are
+            stored
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._read()
+            if self._expect(",]") == "]":
+                return
+
+    def read_value(self):
+        """Reads the JSON value at the current position.
+
+        Returns:
+            the value
+        """
+        return self._read()[0]
+
+    def _read(self):
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                if end < len(self._buf) or self._eof:
+                    break
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+            # Grow the buffer geometrically so that large values are parsed in
+            # amortized linear time
+            self._fill(max(len(self._buf) - self._pos, self._chunk_size))
+
+        raw = self._buf[self._pos : end]
+        if not raw.isascii():
+            value = json.loads(raw.encode("latin-1"))
+
+        start = self._buf_offset + self._pos
+        self._pos = end
+
+        return value, start, self._buf_offset + end
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._fill(self._chunk_size):
+                raise ValueError("Unexpected end of JSON file")
+
+    def _expect(self, chars):
+        c = self._peek()
+        if c not in chars:
+            raise ValueError(
+                "Expected one of '%s' at byte %d but found '%s'"
+                % (chars, self._buf_offset + self._pos, c)
+            )
+
+        self._pos += 1
+        return c
+
+    def _fill(self, size):
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buf_offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk.decode("latin-1")
+        self._pos = 0
+
+        return True
+
+
 def parse_coco_categories(categories):
     """Parses the COCO categories list.
 
@@ -1901,11 +2220,15 @@ def _get_images_with_classes(
     all_ids = []
     any_ids = []
     for image_id in image_ids:
-        coco_objects = annotations.get(image_id, None)
-        if not coco_objects:
+        if isinstance(annotations, _COCOAnnotationsIndex):
+            oids = annotations.get_category_ids(image_id)
+        else:
+            coco_objects = annotations.get(image_id, None) or []
+            oids = set(o.category_id for o in coco_objects)
+
+        if not oids:
             continue
 
-        oids = set(o.category_id for o in coco_objects)
         if class_ids.issubset(oids):
             all_ids.append(image_id)
         elif class_ids & oids:
@@ -58,6 +58,7 @@ def export_samples(
     label_field=None,
     frame_labels_field=None,
     num_samples=None,
+    num_workers=None,
     **kwargs,
 ):
     """Exports the given samples to disk.
@@ -194,6 +195,10 @@ def export_samples(
             ``dataset_exporter`` is a :class:`LabeledVideoDatasetExporter`
         num_samples (None): the number of samples in ``samples``. If omitted,
             this is computed (if possible) via ``len(samples)``
+        num_workers (None): an optional number of worker threads to use to
+            copy or symlink media files in parallel. Labels are always written
+            in the main thread in sample order. By default, media is exported
+            in the main thread
         **kwargs: optional keyword arguments to pass to the dataset exporter's
             constructor. If you are exporting image patches, this can also
             contain keyword arguments for
@@ -360,6 +365,7 @@ def export_samples(
         dataset_exporter,
         num_samples=num_samples,
         sample_collection=sample_collection,
+        num_workers=num_workers,
     )
 
 
@@ -369,6 +375,7 @@ def write_dataset(
     dataset_exporter,
     num_samples=None,
     sample_collection=None,
+    num_workers=None,
 ):
     """Writes the samples to disk as a dataset in the specified format.
 
@@ -386,6 +393,10 @@ def write_dataset(
             :class:`fiftyone.core.collections.SampleCollection`, this parameter
             defaults to ``samples``. This parameter is optional and is only
             passed to :meth:`DatasetExporter.log_collection`
+        num_workers (None): an optional number of worker threads to use to
+            export media files. Only applicable to exporters that export media
+            via a :class:`MediaExporter`. By default, media is exported in the
+            main thread
     """
     if num_samples is None:
         try:
@@ -402,6 +413,7 @@ def write_dataset(
             samples,
             num_samples=num_samples,
             sample_collection=sample_collection,
+            num_workers=num_workers,
         )
     elif isinstance(dataset_exporter, GroupDatasetExporter):
         _write_group_dataset(
@@ -409,6 +421,7 @@ def write_dataset(
             samples,
             num_samples=num_samples,
             sample_collection=sample_collection,
+            num_workers=num_workers,
         )
     elif isinstance(
         dataset_exporter,
@@ -420,6 +433,7 @@ def write_dataset(
             sample_parser,
             num_samples=num_samples,
             sample_collection=sample_collection,
+            num_workers=num_workers,
         )
     elif isinstance(
         dataset_exporter,
@@ -431,6 +445,7 @@ def write_dataset(
             sample_parser,
             num_samples=num_samples,
             sample_collection=sample_collection,
+            num_workers=num_workers,
         )
     elif isinstance(dataset_exporter, UnlabeledMediaDatasetExporter):
         _write_unlabeled_dataset(
@@ -439,6 +454,7 @@ def write_dataset(
             sample_parser,
             num_samples=num_samples,
             sample_collection=sample_collection,
+            num_workers=num_workers,
         )
     else:
         raise ValueError(
@@ -792,6 +808,14 @@ def _classification_to_detections(label):
     )
 
 
+def _configure_media_exporter(dataset_exporter, num_workers):
+    # By convention, exporters store their MediaExporter in `_media_exporter`,
+    # which is created when the exporter is setup
+    media_exporter = getattr(dataset_exporter, "_media_exporter", None)
+    if num_workers is not None and isinstance(media_exporter, MediaExporter):
+        media_exporter.num_workers = num_workers
+
+
 def _write_batch_dataset(dataset_exporter, samples):
     if not isinstance(samples, foc.SampleCollection):
         raise ValueError(
@@ -808,9 +832,12 @@ def _write_generic_sample_dataset(
     samples,
     num_samples=None,
     sample_collection=None,
+    num_workers=None,
 ):
     with fou.ProgressBar(total=num_samples) as pb:
         with dataset_exporter:
+            _configure_media_exporter(dataset_exporter, num_workers)
+
             if sample_collection is not None:
                 dataset_exporter.log_collection(sample_collection)
 
@@ -829,6 +856,7 @@ def _write_group_dataset(
     samples,
     num_samples=None,
     sample_collection=None,
+    num_workers=None,
 ):
     if not isinstance(samples, foc.SampleCollection):
         raise ValueError(
@@ -844,6 +872,8 @@ def _write_group_dataset(
 
     with fou.ProgressBar(total=num_samples) as pb:
         with dataset_exporter:
+            _configure_media_exporter(dataset_exporter, num_workers)
+
             if sample_collection is not None:
                 dataset_exporter.log_collection(sample_collection)
 
@@ -857,11 +887,14 @@ def _write_image_dataset(
     sample_parser,
     num_samples=None,
     sample_collection=None,
+    num_workers=None,
 ):
     labeled_images = isinstance(dataset_exporter, LabeledImageDatasetExporter)
 
     with fou.ProgressBar(total=num_samples) as pb:
         with dataset_exporter:
+            _configure_media_exporter(dataset_exporter, num_workers)
+
             if sample_collection is not None:
                 dataset_exporter.log_collection(sample_collection)
 
@@ -910,11 +943,14 @@ def _write_video_dataset(
     sample_parser,
     num_samples=None,
     sample_collection=None,
+    num_workers=None,
 ):
     labeled_videos = isinstance(dataset_exporter, LabeledVideoDatasetExporter)
 
     with fou.ProgressBar(total=num_samples) as pb:
         with dataset_exporter:
+            _configure_media_exporter(dataset_exporter, num_workers)
+
             if sample_collection is not None:
                 dataset_exporter.log_collection(sample_collection)
 
@@ -958,9 +994,12 @@ def _write_unlabeled_dataset(
     sample_parser,
     num_samples=None,
     sample_collection=None,
+    num_workers=None,
 ):
     with fou.ProgressBar(total=num_samples) as pb:
         with dataset_exporter:
+            _configure_media_exporter(dataset_exporter, num_workers)
+
             if sample_collection is not None:
                 dataset_exporter.log_collection(sample_collection)
 
@@ -1089,6 +1128,13 @@ class MediaExporter(object):
             output paths
         ignore_exts (False): whether to omit file extensions when generating
             UUIDs for files
+        num_workers (None): an optional number of worker threads to use to
+            copy or symlink media files. When provided, output paths are still
+            generated immediately by :meth:`export`, but the media files
+            themselves are transferred in batches in a thread pool, and all
+            transfers are completed by the time :meth:`flush` or
+            :meth:`close` returns. By default, media is exported in the main
+            thread
     """
 
     def __init__(
@@ -1099,6 +1145,7 @@ class MediaExporter(object):
         supported_modes=None,
         default_ext=None,
         ignore_exts=False,
+        num_workers=None,
     ):
         if supported_modes is None:
             supported_modes = (True, False, "move", "symlink", "manifest")
@@ -1121,10 +1168,12 @@ class MediaExporter(object):
         self.supported_modes = supported_modes
         self.default_ext = default_ext
         self.ignore_exts = ignore_exts
+        self.num_workers = num_workers
 
         self._filename_maker = None
         self._manifest = None
         self._manifest_path = None
+        self._tasks = []
 
     def _write_media(self, media, outpath):
         raise NotImplementedError("subclass must implement _write_media()")
@@ -1203,12 +1252,16 @@ class MediaExporter(object):
                 outpath = self._filename_maker.get_output_path(media_path)
                 uuid = self._get_uuid(outpath)
 
-            if self.export_mode == True:
-                etau.copy_file(media_path, outpath)
+            if self.export_mode in (True, "symlink"):
+                task = (self.export_mode, media_path, outpath)
+                if self.num_workers is not None and self.num_workers > 1:
+                    self._tasks.append(task)
+                    if len(self._tasks) >= _MEDIA_EXPORT_BATCH_SIZE:
+                        self.flush()
+                else:
+                    _do_export_media(task)
             elif self.export_mode == "move":
                 etau.move_file(media_path, outpath)
-            elif self.export_mode == "symlink":
-                etau.symlink_file(media_path, outpath)
             elif self.export_mode == "manifest":
                 self._manifest[uuid] = media_path
         else:
@@ -1230,12 +1283,50 @@ class MediaExporter(object):
 
         return outpath, uuid
 
+    def flush(self):
+        """Completes the transfer of any media files that have been queued by
+        :meth:`export`.
+        """
+        tasks = self._tasks
+        self._tasks = []
+        if tasks:
+            fos.run(_do_export_media, tasks, num_workers=self.num_workers)
+
     def close(self):
         """Performs any necessary actions to complete the export."""
+        self.flush()
+
         if self.export_mode == "manifest":
             etas.write_json(self._manifest, self._manifest_path)
 
 
+_MEDIA_EXPORT_BATCH_SIZE = 1000
+
+
+def _do_export_media(task):
+    export_mode, inpath, outpath = task
+
+    if export_mode == "symlink":
+        etau.symlink_file(inpath, outpath)
+    elif not _is_existing_copy(inpath, outpath):
+        etau.copy_file(inpath, outpath)
+
+
+def _is_existing_copy(inpath, outpath):
+    # Media that was already copied by a previous export has the same size as
+    # the input and was last modified after it
+    try:
+        outstat = os.stat(outpath)
+    except OSError:
+        return False
+
+    instat = os.stat(inpath)
+    return (
+        outstat.st_size == instat.st_size
+        and outstat.st_mtime >= instat.st_mtime
+    )
+
+
 class ImageExporter(MediaExporter):
     """Utility class for :class:`DatasetExporter` instances that export images.
 
@@ -1968,6 +2059,13 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             sample/frame files
         ordered (True): whether to preserve the order of the exported
             collections
+        shard_size (None): an optional number of samples/frames to write to
+            each file when exporting metadata into directories of
+            newline-delimited JSON shards with checksummed manifests. Sharded
+            exports that are interrupted can be resumed by exporting again
+            into the same directory, and sharded imports can be resumed via
+            the ``resume`` parameter of
+            :class:`fiftyone.utils.data.importers.FiftyOneDatasetImporter`
     """
 
     def __init__(
@@ -1979,6 +2077,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         export_runs=True,
         use_dirs=False,
         ordered=True,
+        shard_size=None,
     ):
         if export_media is None:
             export_media = True
@@ -1994,6 +2093,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self.export_runs = export_runs
         self.use_dirs = use_dirs
         self.ordered = ordered
+        self.shard_size = shard_size
 
         self._data_dir = None
         self._fields_dir = None
@@ -2015,7 +2115,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self._eval_dir = os.path.join(self.export_dir, "evaluations")
         self._metadata_path = os.path.join(self.export_dir, "metadata.json")
 
-        if self.use_dirs:
+        if self.use_dirs or self.shard_size is not None:
             self._samples_path = os.path.join(self.export_dir, "samples")
             self._frames_path = os.path.join(self.export_dir, "frames")
         else:
@@ -2081,6 +2181,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             key="samples",
             patt=patt,
             num_docs=num_samples,
+            shard_size=self.shard_size,
         )
 
         if sample_collection._contains_videos(any_slice=True):
@@ -2107,6 +2208,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
                 key="frames",
                 patt=patt,
                 num_docs=num_frames,
+                shard_size=self.shard_size,
             )
 
         dataset = sample_collection._dataset
@@ -140,11 +140,14 @@ def import_samples(
         else:
             samples = map(parse_sample, iter(dataset_importer))
 
-        sample_ids = dataset.add_samples(
+        # The imported samples are not used after they are added, so there's
+        # no need to attach them to the dataset
+        sample_ids = dataset._add_samples(
             samples,
             expand_schema=expand_schema,
             dynamic=dynamic,
             num_samples=num_samples,
+            attach_samples=False,
         )
 
         if add_info and dataset_importer.has_dataset_info:
@@ -1676,6 +1679,13 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         import_runs (True): whether to include annotation/brain/evaluation
             runs in the import. Only applicable when importing full datasets
         ordered (True): whether to preserve document order when importing
+        resume (False): whether to resume a previous interrupted import of a
+            sharded export into the same dataset by skipping any samples/frames
+            that already exist. Only applicable to exports written with a
+            ``shard_size``
+        num_workers (None): the number of worker threads to use when reading
+            sharded exports. By default, ``multiprocessing.cpu_count()`` is
+            used
         shuffle (False): whether to randomly shuffle the order in which the
             samples are imported
         seed (None): a random seed to use when shuffling
@@ -1690,6 +1700,8 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         import_saved_views=True,
         import_runs=True,
         ordered=True,
+        resume=False,
+        num_workers=None,
         shuffle=False,
         seed=None,
         max_samples=None,
@@ -1705,6 +1717,8 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         self.import_saved_views = import_saved_views
         self.import_runs = import_runs
         self.ordered = ordered
+        self.resume = resume
+        self.num_workers = num_workers
 
         self._data_dir = None
         self._fields_dir = None
@@ -1772,6 +1786,12 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         name = dataset.name
         empty_import = not bool(dataset)
 
+        # Resumed imports need to finish importing saved views/runs
+        import_extras = empty_import or self.resume
+
+        # Sharded exports are inserted directly unless we need to subsample
+        use_shards = not self.shuffle and self.max_samples is None
+
         #
         # Import DatasetDocument
         #
@@ -1826,14 +1846,6 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         #
 
         logger.info("Importing samples...")
-        samples, num_samples = foo.import_collection(
-            self._samples_path, key="samples"
-        )
-
-        samples = self._preprocess_list(samples)
-
-        if self.max_samples is not None:
-            num_samples = self.max_samples
 
         if self.rel_dir is not None:
             # Prepend `rel_dir` to all relative paths
@@ -1858,13 +1870,33 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
             sd["_dataset_id"] = dataset_id
             return sd
 
-        sample_ids = foo.insert_documents(
-            map(_parse_sample, samples),
-            dataset._sample_collection,
-            ordered=self.ordered,
-            progress=True,
-            num_docs=num_samples,
-        )
+        if use_shards and foo.is_sharded_collection(self._samples_path):
+            sample_ids = foo.insert_collection_shards(
+                self._samples_path,
+                dataset._sample_collection,
+                parse_fcn=_parse_sample,
+                ordered=self.ordered,
+                resume=self.resume,
+                num_workers=self.num_workers,
+                progress=True,
+            )
+        else:
+            samples, num_samples = foo.import_collection(
+                self._samples_path, key="samples"
+            )
+
+            samples = self._preprocess_list(samples)
+
+            if self.max_samples is not None:
+                num_samples = self.max_samples
+
+            sample_ids = foo.insert_documents(
+                map(_parse_sample, samples),
+                dataset._sample_collection,
+                ordered=self.ordered,
+                progress=True,
+                num_docs=num_samples,
+            )
 
         #
         # Import frames
@@ -1872,34 +1904,48 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
 
         if self._has_frames:
             logger.info("Importing frames...")
-            frames, num_frames = foo.import_collection(
-                self._frames_path, key="frames"
-            )
-
-            # @todo optimize by only loading these docs in the first place
-            if self.max_samples is not None:
-                _sample_ids = set(sample_ids)
-                frames = [f for f in frames if f["_sample_id"] in _sample_ids]
-                num_frames = len(frames)
 
             def _parse_frame(fd):
                 fd["_dataset_id"] = dataset_id
                 return fd
 
-            foo.insert_documents(
-                map(_parse_frame, frames),
-                dataset._frame_collection,
-                ordered=self.ordered,
-                progress=True,
-                num_docs=num_frames,
-            )
+            if use_shards and foo.is_sharded_collection(self._frames_path):
+                foo.insert_collection_shards(
+                    self._frames_path,
+                    dataset._frame_collection,
+                    parse_fcn=_parse_frame,
+                    ordered=self.ordered,
+                    resume=self.resume,
+                    num_workers=self.num_workers,
+                    progress=True,
+                )
+            else:
+                frames, num_frames = foo.import_collection(
+                    self._frames_path, key="frames"
+                )
+
+                # @todo optimize by only loading these docs in the first place
+                if self.max_samples is not None:
+                    _sample_ids = set(sample_ids)
+                    frames = [
+                        f for f in frames if f["_sample_id"] in _sample_ids
+                    ]
+                    num_frames = len(frames)
+
+                foo.insert_documents(
+                    map(_parse_frame, frames),
+                    dataset._frame_collection,
+                    ordered=self.ordered,
+                    progress=True,
+                    num_docs=num_frames,
+                )
 
         #
         # Import saved views
         #
 
         if (
-            empty_import
+            import_extras
             and self.import_saved_views
             and self.max_samples is None
         ):
@@ -1909,7 +1955,7 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         # Import runs
         #
 
-        if empty_import and self.import_runs and self.max_samples is None:
+        if import_extras and self.import_runs and self.max_samples is None:
             _import_runs(
                 dataset,
                 annotations,
@@ -1961,6 +2007,10 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
     @staticmethod
     def _get_num_samples(dataset_dir):
         # Used only by dataset zoo
+        samples_path = os.path.join(dataset_dir, "samples")
+        if foo.is_sharded_collection(samples_path):
+            return foo.import_collection(samples_path)[1]
+
         samples_path = os.path.join(dataset_dir, "samples.json")
         samples = etas.read_json(samples_path).get("samples", [])
         return len(samples)
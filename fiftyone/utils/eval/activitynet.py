@@ -12,7 +12,7 @@ import numpy as np
 
 import eta.core.utils as etau
 
-import fiftyone.core.plots as fop
+import fiftyone.core.utils as fou
 import fiftyone.utils.iou as foui
 
 from .detection import (
@@ -21,6 +21,8 @@ from .detection import (
     DetectionResults,
 )
 
+fop = fou.lazy_import("fiftyone.core.plots")
+
 
 logger = logging.getLogger(__name__)
 
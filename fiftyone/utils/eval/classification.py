@@ -9,18 +9,19 @@ import itertools
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import fiftyone.core.evaluation as foe
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
-import fiftyone.core.plots as fop
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
 from .base import BaseEvaluationResults
 
+skm = fou.lazy_import("sklearn.metrics")
+fop = fou.lazy_import("fiftyone.core.plots")
+
 
 def evaluate_classifications(
     samples,
@@ -12,7 +12,7 @@ import numpy as np
 
 import eta.core.utils as etau
 
-import fiftyone.core.plots as fop
+import fiftyone.core.utils as fou
 import fiftyone.utils.iou as foui
 
 from .detection import (
@@ -21,6 +21,8 @@ from .detection import (
     DetectionResults,
 )
 
+fop = fou.lazy_import("fiftyone.core.plots")
+
 
 logger = logging.getLogger(__name__)
 
@@ -499,8 +501,8 @@ def _coco_evaluation_setup(
             label = obj.label if classwise else "all"
             cats[label]["preds"].append(obj)
 
-    # Compute IoUs within each category
-    pred_ious = {}
+    preds_batch = []
+    gts_batch = []
     for objects in cats.values():
         gts = objects["gts"]
         preds = objects["preds"]
@@ -516,9 +518,14 @@ def _coco_evaluation_setup(
         # Sort ground truth so crowds are last
         gts = sorted(gts, key=iscrowd)
 
-        # Compute ``num_preds x num_gts`` IoUs
-        ious = foui.compute_ious(preds, gts, **iou_kwargs)
+        preds_batch.append(preds)
+        gts_batch.append(gts)
 
+    # Compute ``num_preds x num_gts`` IoUs within each category
+    ious_batch = foui.compute_batch_ious(preds_batch, gts_batch, **iou_kwargs)
+
+    pred_ious = {}
+    for preds, gts, ious in zip(preds_batch, gts_batch, ious_batch):
         gt_ids = [g.id for g in gts]
         for pred, gt_ious in zip(preds, ious):
             pred_ious[pred.id] = list(zip(gt_ids, gt_ious))
@@ -5,14 +5,17 @@ Detection evaluation.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import defaultdict
 import itertools
 import logging
 
 import numpy as np
+from pymongo import UpdateOne
 
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
@@ -35,6 +38,7 @@ def evaluate_detections(
     use_boxes=False,
     classwise=True,
     dynamic=True,
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -127,6 +131,9 @@ def evaluate_detections(
             label (True) or allow matches between classes (False)
         dynamic (True): whether to declare the dynamic object-level attributes
             that are populated on the dataset's schema
+        num_workers (None): an optional number of worker processes to use to
+            perform the per-sample matching. By default, matching is performed
+            serially in the main process
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
@@ -166,45 +173,28 @@ def evaluate_detections(
 
     processing_frames = samples._is_frame_field(pred_field)
 
-    if eval_key is not None:
-        tp_field = "%s_tp" % eval_key
-        fp_field = "%s_fp" % eval_key
-        fn_field = "%s_fn" % eval_key
-
     if config.requires_additional_fields:
         _samples = samples
     else:
         _samples = samples.select_fields([gt_field, pred_field])
 
-    matches = []
     logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            docs = sample.frames.values()
-        else:
-            docs = [sample]
-
-        sample_tp = 0
-        sample_fp = 0
-        sample_fn = 0
-        for doc in docs:
-            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
-            matches.extend(doc_matches)
-            tp, fp, fn = _tally_matches(doc_matches)
-            sample_tp += tp
-            sample_fp += fp
-            sample_fn += fn
-
-            if processing_frames and eval_key is not None:
-                doc[tp_field] = tp
-                doc[fp_field] = fp
-                doc[fn_field] = fn
-
-        if eval_key is not None:
-            sample[tp_field] = sample_tp
-            sample[fp_field] = sample_fp
-            sample[fn_field] = sample_fn
-            sample.save()
+    if num_workers is None or num_workers <= 1:
+        matches = _evaluate_samples(
+            _samples, eval_method, eval_key, processing_frames
+        )
+    elif not _can_evaluate_multi(_samples, eval_method):
+        logger.warning(
+            "Multi-process evaluation is not supported for this collection; "
+            "falling back to serial evaluation"
+        )
+        matches = _evaluate_samples(
+            _samples, eval_method, eval_key, processing_frames
+        )
+    else:
+        matches = _evaluate_samples_multi(
+            _samples, eval_method, eval_key, processing_frames, num_workers
+        )
 
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
@@ -600,6 +590,187 @@ def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
+def _evaluate_samples(samples, eval_method, eval_key, processing_frames):
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+
+    matches = []
+    for sample in samples.iter_samples(progress=True, autosave=True):
+        if processing_frames:
+            docs = sample.frames.values()
+        else:
+            docs = [sample]
+
+        sample_tp = 0
+        sample_fp = 0
+        sample_fn = 0
+        for doc in docs:
+            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+            matches.extend(doc_matches)
+            tp, fp, fn = _tally_matches(doc_matches)
+            sample_tp += tp
+            sample_fp += fp
+            sample_fn += fn
+
+            if processing_frames and eval_key is not None:
+                doc[tp_field] = tp
+                doc[fp_field] = fp
+                doc[fn_field] = fn
+
+        if eval_key is not None:
+            sample[tp_field] = sample_tp
+            sample[fp_field] = sample_fp
+            sample[fn_field] = sample_fn
+
+    return matches
+
+
+# Number of samples per task sent to each worker process
+_WORKER_BATCH_SIZE = 100
+
+_worker_eval_method = None
+_worker_eval_key = None
+_worker_fields = None
+
+
+def _can_evaluate_multi(samples, eval_method):
+    # Generated views must sync their edits back to their source collections,
+    # which requires loading the actual samples
+    if samples._dataset._is_generated:
+        return False
+
+    return (
+        "." not in eval_method.gt_field and "." not in eval_method.pred_field
+    )
+
+
+def _evaluate_samples_multi(
+    samples, eval_method, eval_key, processing_frames, num_workers
+):
+    dataset = samples._dataset
+    sample_coll = dataset._sample_collection
+    frame_coll = dataset._frame_collection if processing_frames else None
+
+    # Only the label fields being evaluated are modified
+    fields = [eval_method.gt_field, eval_method.pred_field]
+
+    docs = samples._aggregate(attach_frames=processing_frames)
+    batches = fou.iter_batches(docs, _WORKER_BATCH_SIZE)
+    tasks = ((batch, processing_frames) for batch in batches)
+
+    matches = []
+    with fou.ProgressBar(total=len(samples)) as pb:
+        with fou.get_multiprocessing_context().Pool(
+            processes=num_workers,
+            initializer=_init_worker,
+            initargs=(eval_method, eval_key, fields),
+        ) as pool:
+            # Results are consumed in order so that the merged matches are
+            # identical to those of serial evaluation
+            for batch_matches, sample_ops, frame_ops, num in pool.imap(
+                _evaluate_batch, tasks
+            ):
+                matches.extend(batch_matches)
+
+                if sample_ops:
+                    foo.bulk_write(sample_ops, sample_coll, ordered=False)
+
+                if frame_ops:
+                    foo.bulk_write(frame_ops, frame_coll, ordered=False)
+
+                pb.update(num)
+
+    return matches
+
+
+def _init_worker(eval_method, eval_key, fields):
+    global _worker_eval_method
+    global _worker_eval_key
+    global _worker_fields
+
+    _worker_eval_method = eval_method
+    _worker_eval_key = eval_key
+    _worker_fields = fields
+
+
+def _evaluate_batch(args):
+    sample_docs, processing_frames = args
+
+    eval_method = _worker_eval_method
+    eval_key = _worker_eval_key
+
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+
+    matches = []
+    sample_ops = []
+    frame_ops = []
+    for sample_doc in sample_docs:
+        if processing_frames:
+            docs = [_parse_doc(d) for d in sample_doc.get("frames", [])]
+        else:
+            docs = [_parse_doc(sample_doc)]
+
+        sample_tp = 0
+        sample_fp = 0
+        sample_fn = 0
+        for doc in docs:
+            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+            matches.extend(doc_matches)
+            tp, fp, fn = _tally_matches(doc_matches)
+            sample_tp += tp
+            sample_fp += fp
+            sample_fn += fn
+
+            if processing_frames and eval_key is not None:
+                update = _get_label_updates(doc)
+                update.update({tp_field: tp, fp_field: fp, fn_field: fn})
+                frame_ops.append(
+                    UpdateOne({"_id": doc["_id"]}, {"$set": update})
+                )
+
+        if eval_key is not None:
+            if processing_frames:
+                update = {}
+            else:
+                update = _get_label_updates(docs[0])
+
+            update.update(
+                {tp_field: sample_tp, fp_field: sample_fp, fn_field: sample_fn}
+            )
+            sample_ops.append(
+                UpdateOne({"_id": sample_doc["_id"]}, {"$set": update})
+            )
+
+    return matches, sample_ops, frame_ops, len(sample_docs)
+
+
+def _parse_doc(d):
+    # Missing fields are treated as None, as they would be on actual samples
+    doc = defaultdict(lambda: None)
+    for field, value in d.items():
+        if isinstance(value, dict) and "_cls" in value:
+            value = foo.DynamicEmbeddedDocument._from_son(value)
+
+        doc[field] = value
+
+    return doc
+
+
+def _get_label_updates(doc):
+    update = {}
+    for field in _worker_fields:
+        label = doc[field]
+        if label is not None:
+            update[field] = label.to_mongo()
+
+    return update
+
+
 def _tally_matches(matches):
     tp = 0
     fp = 0
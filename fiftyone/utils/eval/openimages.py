@@ -10,7 +10,7 @@ from copy import deepcopy
 
 import numpy as np
 
-import fiftyone.core.plots as fop
+import fiftyone.core.utils as fou
 import fiftyone.utils.iou as foui
 
 from .detection import (
@@ -19,6 +19,8 @@ from .detection import (
     DetectionResults,
 )
 
+fop = fou.lazy_import("fiftyone.core.plots")
+
 
 class OpenImagesEvaluationConfig(DetectionEvaluationConfig):
     """Open Images-style evaluation config.
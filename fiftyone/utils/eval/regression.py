@@ -10,7 +10,6 @@ import itertools
 import numbers
 
 import numpy as np
-import sklearn.metrics as skm
 from tabulate import tabulate
 
 import eta.core.utils as etau
@@ -18,10 +17,12 @@ import eta.core.utils as etau
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
-import fiftyone.core.plots as fop
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
+skm = fou.lazy_import("sklearn.metrics")
+fop = fou.lazy_import("fiftyone.core.plots")
+
 
 logger = logging.getLogger(__name__)
 
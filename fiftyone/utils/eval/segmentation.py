@@ -6,10 +6,10 @@ Segmentation evaluation.
 |
 """
 import logging
+import multiprocessing
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import eta.core.image as etai
 
@@ -32,6 +32,7 @@ def evaluate_segmentations(
     eval_key=None,
     mask_targets=None,
     method="simple",
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the specified semantic segmentation masks in the given
@@ -80,6 +81,9 @@ def evaluate_segmentations(
             labels. If not provided, the observed values are used as labels
         method ("simple"): a string specifying the evaluation method to use.
             Supported values are ``("simple")``
+        num_workers (None): the number of worker processes to use to load and
+            evaluate masks. By default, ``multiprocessing.cpu_count()`` is
+            used
         **kwargs: optional keyword arguments for the constructor of the
             :class:`SegmentationEvaluationConfig` being used
 
@@ -98,7 +102,10 @@ def evaluate_segmentations(
     eval_method.register_samples(samples, eval_key)
 
     results = eval_method.evaluate_samples(
-        samples, eval_key=eval_key, mask_targets=mask_targets
+        samples,
+        eval_key=eval_key,
+        mask_targets=mask_targets,
+        num_workers=num_workers,
     )
     eval_method.save_run_results(samples, eval_key, results)
 
@@ -167,7 +174,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
             if processing_frames:
                 dataset.add_frame_field(dice_field, fof.FloatField)
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         """Evaluates the predicted segmentation masks in the given samples with
         respect to the specified ground truth masks.
 
@@ -178,6 +187,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
                 contain a subset of the possible classes if you wish to
                 evaluate a subset of the semantic classes. By default, the
                 observed pixel values are used as labels
+            num_workers (None): the number of worker processes to use to load
+                and evaluate masks. By default,
+                ``multiprocessing.cpu_count()`` is used
 
         Returns:
             a :class:`SegmentationResults` instance
@@ -301,7 +313,9 @@ class SimpleEvaluation(SegmentationEvaluation):
         config: a :class:`SimpleEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         pred_field = self.config.pred_field
         gt_field = self.config.gt_field
 
@@ -313,81 +327,100 @@ class SimpleEvaluation(SegmentationEvaluation):
 
             values, classes = zip(*sorted(mask_targets.items()))
         else:
-            logger.info("Computing possible mask values...")
-            values, classes = _get_mask_values(samples, pred_field, gt_field)
+            values, classes = None, None
+
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
 
         _samples = samples.select_fields([gt_field, pred_field])
         pred_field, processing_frames = samples._handle_frame_field(pred_field)
         gt_field, _ = samples._handle_frame_field(gt_field)
 
-        nc = len(values)
-        confusion_matrix = np.zeros((nc, nc), dtype=int)
-
-        bandwidth = self.config.bandwidth
         average = self.config.average
         compute_dice = self.config.compute_dice
 
-        if eval_key is not None:
-            acc_field = "%s_accuracy" % eval_key
-            pre_field = "%s_precision" % eval_key
-            rec_field = "%s_recall" % eval_key
-            if compute_dice:
-                dice_field = "%s_dice" % eval_key
+        tasks = _iter_tasks(
+            _samples,
+            pred_field,
+            gt_field,
+            processing_frames,
+            values,
+            self.config.bandwidth,
+        )
 
+        # When no `mask_targets` are provided, the observed mask values are
+        # collected while computing confusion matrices, so each sample's
+        # matrices are stored until all mask values are known
         logger.info("Evaluating segmentations...")
-        for sample in _samples.iter_samples(progress=True):
-            if processing_frames:
-                images = sample.frames.values()
+        sample_results = []
+        observed_values = set()
+        is_rgb = False
+        for sample_id, image_results in _evaluate_tasks(
+            tasks, num_workers, len(_samples)
+        ):
+            for image_result in image_results:
+                if image_result is not None and values is None:
+                    observed_values.update(image_result[0])
+                    is_rgb |= image_result[2]
+
+            sample_results.append((sample_id, image_results))
+
+        if values is None:
+            values = sorted(observed_values)
+            if is_rgb:
+                classes = [_int_to_hex(v) for v in values]
             else:
-                images = [sample]
+                classes = [str(v) for v in values]
 
+        nc = len(values)
+        confusion_matrix = np.zeros((nc, nc), dtype=int)
+
+        sample_metrics = {}
+        frame_metrics = {}
+        for sample_id, image_results in sample_results:
             sample_conf_mat = np.zeros((nc, nc), dtype=int)
-            for image in images:
-                gt_seg = image[gt_field]
-                if gt_seg is None or not gt_seg.has_mask:
-                    msg = "Skipping sample with missing ground truth mask"
-                    warnings.warn(msg)
+            _frame_metrics = []
+            for image_result in image_results:
+                if image_result is None or image_result[1] is None:
+                    _frame_metrics.append((None, None, None, None))
                     continue
 
-                pred_seg = image[pred_field]
-                if pred_seg is None or not pred_seg.has_mask:
-                    msg = "Skipping sample with missing prediction mask"
-                    warnings.warn(msg)
-                    continue
+                image_vals, image_conf_mat, _ = image_result
+                if image_vals is not None:
+                    image_conf_mat = _to_dense_confusion_matrix(
+                        image_conf_mat, image_vals, values
+                    )
 
-                image_conf_mat = _compute_pixel_confusion_matrix(
-                    pred_seg.get_mask(),
-                    gt_seg.get_mask(),
-                    values,
-                    bandwidth=bandwidth,
-                )
                 sample_conf_mat += image_conf_mat
 
                 # Record frame stats, if requested
                 if processing_frames and eval_key is not None:
-                    facc, fpre, frec = _compute_accuracy_precision_recall(
-                        image_conf_mat, values, average
+                    _frame_metrics.append(
+                        _compute_metrics(
+                            image_conf_mat, values, average, compute_dice
+                        )
                     )
-                    image[acc_field] = facc
-                    image[pre_field] = fpre
-                    image[rec_field] = frec
-                    if compute_dice:
-                        image[dice_field] = _compute_dice_score(image_conf_mat)
 
             confusion_matrix += sample_conf_mat
 
             # Record sample stats, if requested
             if eval_key is not None:
-                sacc, spre, srec = _compute_accuracy_precision_recall(
-                    sample_conf_mat, values, average
+                sample_metrics[sample_id] = _compute_metrics(
+                    sample_conf_mat, values, average, compute_dice
                 )
-                sample[acc_field] = sacc
-                sample[pre_field] = spre
-                sample[rec_field] = srec
-                if compute_dice:
-                    sample[dice_field] = _compute_dice_score(confusion_matrix)
+                if processing_frames:
+                    frame_metrics[sample_id] = _frame_metrics
 
-                sample.save()
+        if eval_key is not None:
+            _write_metrics(samples, eval_key, sample_metrics, compute_dice)
+            if processing_frames:
+                _write_metrics(
+                    samples,
+                    eval_key,
+                    frame_metrics,
+                    compute_dice,
+                    frames=True,
+                )
 
         if nc > 0:
             missing = classes[0] if values[0] in (0, "#000000") else None
@@ -497,9 +530,107 @@ def _parse_config(pred_field, gt_field, method, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
-def _compute_pixel_confusion_matrix(
-    pred_mask, gt_mask, values, bandwidth=None
+def _iter_tasks(
+    samples, pred_field, gt_field, processing_frames, values, bandwidth
 ):
+    for sample in samples.iter_samples():
+        if processing_frames:
+            images = sample.frames.values()
+        else:
+            images = [sample]
+
+        masks = []
+        for image in images:
+            gt_mask = _get_mask_arg(image[gt_field])
+            pred_mask = _get_mask_arg(image[pred_field])
+
+            if gt_mask is None:
+                msg = "Skipping sample with missing ground truth mask"
+                warnings.warn(msg)
+            elif pred_mask is None:
+                msg = "Skipping sample with missing prediction mask"
+                warnings.warn(msg)
+
+            # Observed mask values must be collected from all masks
+            if values is not None and (gt_mask is None or pred_mask is None):
+                gt_mask, pred_mask = None, None
+
+            masks.append((gt_mask, pred_mask))
+
+        yield sample.id, masks, values, bandwidth
+
+
+def _get_mask_arg(seg):
+    if seg is None:
+        return None
+
+    # Masks on disk are loaded by the workers
+    if seg.mask is not None:
+        return seg.mask
+
+    return seg.mask_path
+
+
+def _evaluate_tasks(tasks, num_workers, num_samples):
+    with fou.ProgressBar(total=num_samples) as pb:
+        if num_workers <= 1:
+            for task in tasks:
+                yield _evaluate_masks(task)
+                pb.update()
+
+            return
+
+        ctx = fou.get_multiprocessing_context()
+        with ctx.Pool(processes=num_workers) as pool:
+            # Tasks are submitted in batches to bound the number of in-memory
+            # masks
+            for batch in fou.iter_batches(tasks, 16 * num_workers):
+                for result in pool.imap_unordered(_evaluate_masks, batch):
+                    yield result
+                    pb.update()
+
+
+def _evaluate_masks(args):
+    sample_id, masks, values, bandwidth = args
+
+    results = []
+    for gt_mask, pred_mask in masks:
+        gt_mask = _load_mask(gt_mask)
+        pred_mask = _load_mask(pred_mask)
+
+        if gt_mask is None and pred_mask is None:
+            results.append(None)
+        elif values is not None:
+            conf_mat = _compute_pixel_confusion_matrix(
+                pred_mask, gt_mask, values, bandwidth=bandwidth
+            )
+            results.append((None, conf_mat, False))
+        elif gt_mask is None or pred_mask is None:
+            mask = gt_mask if gt_mask is not None else pred_mask
+            is_rgb = mask.ndim == 3
+            if is_rgb:
+                mask = _rgb_array_to_int(mask)
+
+            mask_values = _unique_inverse(mask.ravel())[0]
+            results.append((mask_values.tolist(), None, is_rgb))
+        else:
+            is_rgb = gt_mask.ndim == 3 or pred_mask.ndim == 3
+            mask_values, conf_mat = _compute_sparse_confusion_matrix(
+                pred_mask, gt_mask, bandwidth=bandwidth
+            )
+            results.append((mask_values.tolist(), conf_mat, is_rgb))
+
+    return sample_id, results
+
+
+def _load_mask(mask):
+    if mask is None or isinstance(mask, np.ndarray):
+        return mask
+
+    return fol.Segmentation(mask_path=mask).get_mask()
+
+
+def _prepare_masks(pred_mask, gt_mask, bandwidth=None):
     if pred_mask.ndim == 3:
         pred_mask = _rgb_array_to_int(pred_mask)
 
@@ -520,15 +651,100 @@ def _compute_pixel_confusion_matrix(
             pred_mask, gt_mask, bandwidth
         )
 
-    try:
-        return skm.confusion_matrix(
-            gt_mask.ravel(), pred_mask.ravel(), labels=values
+    return pred_mask.ravel(), gt_mask.ravel()
+
+
+def _compute_pixel_confusion_matrix(
+    pred_mask, gt_mask, values, bandwidth=None
+):
+    mask_values, conf_mat = _compute_sparse_confusion_matrix(
+        pred_mask, gt_mask, bandwidth=bandwidth
+    )
+
+    # Pixels whose GT or predicted value is not in `values` are ignored
+    return _to_dense_confusion_matrix(conf_mat, mask_values, values)
+
+
+def _compute_sparse_confusion_matrix(pred_mask, gt_mask, bandwidth=None):
+    pred_mask, gt_mask = _prepare_masks(
+        pred_mask, gt_mask, bandwidth=bandwidth
+    )
+
+    values, inds = _unique_inverse(np.concatenate([gt_mask, pred_mask]))
+    num_classes = len(values)
+    num_pixels = gt_mask.size
+
+    codes = inds[:num_pixels] * num_classes + inds[num_pixels:]
+    conf_mat = np.bincount(codes, minlength=num_classes**2)
+    return values, conf_mat.reshape(num_classes, num_classes)
+
+
+def _to_dense_confusion_matrix(conf_mat, mask_values, values):
+    nc = len(values)
+    dense_conf_mat = np.zeros((nc, nc), dtype=int)
+    if nc == 0:
+        return dense_conf_mat
+
+    values = np.asarray(values)
+    inds = np.searchsorted(values, mask_values)
+    np.minimum(inds, nc - 1, out=inds)
+    found = values[inds] == mask_values
+
+    inds = inds[found]
+    dense_conf_mat[np.ix_(inds, inds)] = conf_mat[np.ix_(found, found)]
+    return dense_conf_mat
+
+
+def _unique_inverse(mask):
+    # Small unsigned masks (e.g., PNGs) can be indexed via a lookup table,
+    # which is much faster than sorting
+    if mask.dtype.kind == "u" and mask.dtype.itemsize <= 2 and mask.size:
+        counts = np.bincount(mask)
+        values = np.flatnonzero(counts)
+        lut = np.zeros(len(counts), dtype=np.intp)
+        lut[values] = np.arange(len(values))
+        return values, lut[mask]
+
+    return np.unique(mask, return_inverse=True)
+
+
+def _compute_metrics(confusion_matrix, values, average, compute_dice):
+    if not values:
+        return None, None, None, None
+
+    acc, pre, rec = _compute_accuracy_precision_recall(
+        confusion_matrix, values, average
+    )
+    if compute_dice and confusion_matrix.any():
+        dice = _compute_dice_score(confusion_matrix)
+    else:
+        dice = None
+
+    return acc, pre, rec, dice
+
+
+def _write_metrics(samples, eval_key, metrics, compute_dice, frames=False):
+    if not metrics:
+        return
+
+    fields = ["accuracy", "precision", "recall"]
+    if compute_dice:
+        fields.append("dice")
+
+    prefix = samples._FRAMES_PREFIX if frames else ""
+
+    for idx, field in enumerate(fields):
+        if frames:
+            values = {
+                _id: [m[idx] for m in _metrics]
+                for _id, _metrics in metrics.items()
+            }
+        else:
+            values = {_id: m[idx] for _id, m in metrics.items()}
+
+        samples.set_values(
+            prefix + "%s_%s" % (eval_key, field), values, key_field="id"
         )
-    except ValueError:
-        # Assume that no `values` appear in `gt_mask`, which causes
-        # `skm.confusion_matrix` to raise an error
-        num_classes = len(values)
-        return np.zeros((num_classes, num_classes), dtype=int)
 
 
 def _compute_dice_score(confusion_matrix):
@@ -6,6 +6,7 @@ Intersection over union (IoU) utilities.
 |
 """
 import contextlib
+import itertools
 import logging
 
 import numpy as np
@@ -18,7 +19,7 @@ import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
-from .utils3d import compute_cuboid_iou as _compute_cuboid_iou
+from .utils3d import compute_cuboid_ious as _compute_cuboid_ious
 
 sg = fou.lazy_import("shapely.geometry")
 so = fou.lazy_import("shapely.ops")
@@ -84,8 +85,7 @@ def compute_ious(
     if not preds or not gts:
         return np.zeros((len(preds), len(gts)))
 
-    if etau.is_str(iscrowd):
-        iscrowd = lambda l: bool(l.get_attribute_value(iscrowd, False))
+    iscrowd = _parse_iscrowd(iscrowd)
 
     if isinstance(preds[0], fol.Polyline):
         if use_boxes:
@@ -137,6 +137,150 @@ def compute_segment_ious(preds, gts):
     return _compute_segment_ious(preds, gts)
 
 
+def compute_bbox_ious(
+    pred_boxes, gt_boxes, gt_crowds=None, pred_labels=None, gt_labels=None
+):
+    """Computes the pairwise IoUs between the given arrays of bounding boxes.
+
+    Boxes must be provided in ``[top-left-x, top-left-y, width, height]``
+    format.
+
+    Arrays of boxes may optionally have leading batch dimensions, in which case
+    the IoUs for each batch element are computed independently. Boxes whose
+    width or height are zero, e.g., those used to pad batches to a common
+    size, have zero IoU with all other boxes.
+
+    Args:
+        pred_boxes: a ``... x num_preds x 4`` array of predicted boxes
+        gt_boxes: a ``... x num_gts x 4`` array of ground truth boxes
+        gt_crowds (None): an optional ``... x num_gts`` boolean array
+            indicating whether each ground truth box is a crowd. If provided,
+            the area of the predicted box is used as the "union" area for IoU
+            calculations involving crowd boxes
+        pred_labels (None): an optional ``... x num_preds`` array of predicted
+            labels. If both ``pred_labels`` and ``gt_labels`` are provided,
+            boxes with different labels are considered non-overlapping
+        gt_labels (None): an optional ``... x num_gts`` array of ground truth
+            labels
+
+    Returns:
+        a ``... x num_preds x num_gts`` array of IoUs
+    """
+    pred_boxes = np.asarray(pred_boxes, dtype=float)
+    gt_boxes = np.asarray(gt_boxes, dtype=float)
+
+    px, py, pw, ph = [
+        a[..., :, np.newaxis] for a in np.moveaxis(pred_boxes, -1, 0)
+    ]
+    gx, gy, gw, gh = [
+        a[..., np.newaxis, :] for a in np.moveaxis(gt_boxes, -1, 0)
+    ]
+
+    # Width and height of intersections
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+    inter = np.maximum(w, 0) * np.maximum(h, 0)
+
+    pred_area = pw * ph
+    union = pred_area + gw * gh - inter
+
+    if gt_crowds is not None:
+        gt_crowds = np.asarray(gt_crowds, dtype=bool)[..., np.newaxis, :]
+        union = np.where(gt_crowds, pred_area, union)
+
+    ious = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+    np.minimum(ious, 1, out=ious)
+
+    if pred_labels is not None and gt_labels is not None:
+        pred_labels = np.asarray(pred_labels, dtype=object)
+        gt_labels = np.asarray(gt_labels, dtype=object)
+        ious[
+            pred_labels[..., :, np.newaxis] != gt_labels[..., np.newaxis, :]
+        ] = 0
+
+    return ious
+
+
+def compute_batch_ious(preds_batch, gts_batch, **kwargs):
+    """Computes the pairwise IoUs between the predicted and ground truth
+    objects for each element of a batch.
+
+    When the objects are 2D bounding boxes, the IoUs for all batch elements
+    are computed in a single vectorized operation. Otherwise, this method is
+    equivalent to calling :func:`compute_ious` on each batch element.
+
+    Args:
+        preds_batch: a list of lists of predicted
+            :class:`fiftyone.core.labels.Detection`,
+            :class:`fiftyone.core.labels.Polyline`, or
+            :class:`fiftyone.core.labels.Keypoints` instances
+        gts_batch: a list of lists of ground truth
+            :class:`fiftyone.core.labels.Detection`,
+            :class:`fiftyone.core.labels.Polyline`, or
+            :class:`fiftyone.core.labels.Keypoints` instances
+        **kwargs: optional keyword arguments for :func:`compute_ious`
+
+    Returns:
+        a list of ``num_preds x num_gts`` arrays of IoUs
+    """
+    if not _is_2d_bbox_batch(preds_batch, gts_batch, **kwargs):
+        return [
+            compute_ious(preds, gts, **kwargs)
+            for preds, gts in zip(preds_batch, gts_batch)
+        ]
+
+    iscrowd = _parse_iscrowd(kwargs.get("iscrowd", None))
+    classwise = kwargs.get("classwise", False)
+
+    batch_size = len(preds_batch)
+    max_preds = max(len(preds) for preds in preds_batch)
+    max_gts = max(len(gts) for gts in gts_batch)
+    is_polylines = _is_polylines_batch(preds_batch)
+
+    pred_boxes = np.zeros((batch_size, max_preds, 4))
+    gt_boxes = np.zeros((batch_size, max_gts, 4))
+    gt_crowds = np.zeros((batch_size, max_gts), dtype=bool)
+    pred_labels = np.full((batch_size, max_preds), None, dtype=object)
+    gt_labels = np.full((batch_size, max_gts), None, dtype=object)
+
+    for idx, (preds, gts) in enumerate(zip(preds_batch, gts_batch)):
+        if is_polylines:
+            preds = _polylines_to_detections(preds)
+            gts = _polylines_to_detections(gts)
+
+        pred_boxes[idx, : len(preds)] = _get_bbox_array(preds)
+        gt_boxes[idx, : len(gts)] = _get_bbox_array(gts)
+
+        if iscrowd is not None:
+            gt_crowds[idx, : len(gts)] = [iscrowd(gt) for gt in gts]
+
+        if classwise:
+            pred_labels[idx, : len(preds)] = [p.label for p in preds]
+            gt_labels[idx, : len(gts)] = [g.label for g in gts]
+
+    if not classwise:
+        pred_labels = None
+        gt_labels = None
+
+    ious = compute_bbox_ious(
+        pred_boxes,
+        gt_boxes,
+        gt_crowds=gt_crowds,
+        pred_labels=pred_labels,
+        gt_labels=gt_labels,
+    )
+
+    results = []
+    for idx, (preds, gts) in enumerate(zip(preds_batch, gts_batch)):
+        _ious = ious[idx, : len(preds), : len(gts)]
+        if preds is gts:
+            np.fill_diagonal(_ious, 1)
+
+        results.append(_ious)
+
+    return results
+
+
 def compute_max_ious(
     sample_collection,
     label_field,
@@ -429,33 +573,6 @@ def _get_bbox_dim(detection):
     return 2
 
 
-def _compute_bbox_iou(gt, pred, gt_crowd=False):
-    gx, gy, gw, gh = gt.bounding_box
-    gt_area = gh * gw
-
-    px, py, pw, ph = pred.bounding_box
-    pred_area = ph * pw
-
-    # Width of intersection
-    w = min(px + pw, gx + gw) - max(px, gx)
-    if w <= 0:
-        return 0
-
-    # Height of intersection
-    h = min(py + ph, gy + gh) - max(py, gy)
-    if h <= 0:
-        return 0
-
-    inter = h * w
-
-    if gt_crowd:
-        union = pred_area
-    else:
-        union = pred_area + gt_area - inter
-
-    return min(etan.safe_divide(inter, union), 1)
-
-
 def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
     is_symmetric = preds is gts
 
@@ -472,28 +589,74 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
         else:
             gts = _polylines_to_detections(gts)
 
+    if classwise:
+        pred_labels = [pred.label for pred in preds]
+        gt_labels = [gt.label for gt in gts]
+    else:
+        pred_labels = None
+        gt_labels = None
+
     if _get_bbox_dim(gts[0]) == 3:
-        bbox_iou_fcn = _compute_cuboid_iou
+        ious = _compute_cuboid_ious(
+            preds,
+            gts,
+            gt_crowds=gt_crowds,
+            pred_labels=pred_labels,
+            gt_labels=gt_labels,
+        )
     else:
-        bbox_iou_fcn = _compute_bbox_iou
+        ious = compute_bbox_ious(
+            _get_bbox_array(preds),
+            _get_bbox_array(gts),
+            gt_crowds=gt_crowds,
+            pred_labels=pred_labels,
+            gt_labels=gt_labels,
+        )
 
-    ious = np.zeros((len(preds), len(gts)))
+    if is_symmetric:
+        np.fill_diagonal(ious, 1)
 
-    for j, (gt, gt_crowd) in enumerate(zip(gts, gt_crowds)):
+    return ious
 
-        for i, pred in enumerate(preds):
-            if is_symmetric and i < j:
-                iou = ious[j, i]
-            elif is_symmetric and i == j:
-                iou = 1
-            elif classwise and pred.label != gt.label:
-                continue
-            else:
-                iou = bbox_iou_fcn(gt, pred, gt_crowd=gt_crowd)
 
-            ious[i, j] = iou
+def _get_bbox_array(detections):
+    return np.array([d.bounding_box for d in detections], dtype=float).reshape(
+        -1, 4
+    )
 
-    return ious
+
+def _parse_iscrowd(iscrowd):
+    if etau.is_str(iscrowd):
+        attr = iscrowd
+        return lambda l: bool(l.get_attribute_value(attr, False))
+
+    return iscrowd
+
+
+def _is_polylines_batch(labels_batch):
+    for labels in labels_batch:
+        if labels:
+            return isinstance(labels[0], fol.Polyline)
+
+    return False
+
+
+def _is_2d_bbox_batch(
+    preds_batch, gts_batch, use_masks=False, use_boxes=False, **kwargs
+):
+    if use_masks or not preds_batch:
+        return False
+
+    labels = list(itertools.chain(*preds_batch, *gts_batch))
+    if not labels:
+        return False
+
+    if isinstance(labels[0], fol.Polyline):
+        return use_boxes and all(isinstance(l, fol.Polyline) for l in labels)
+
+    return all(
+        isinstance(l, fol.Detection) and _get_bbox_dim(l) == 2 for l in labels
+    )
 
 
 def _compute_polyline_ious(
@@ -7,9 +7,11 @@ FiftyOne quickstart.
 """
 import fiftyone as fo
 import fiftyone.core.context as focx
-import fiftyone.core.session as fos
+import fiftyone.core.utils as fou
 import fiftyone.zoo.datasets as fozd
 
+fos = fou.lazy_import("fiftyone.core.session")
+
 
 def quickstart(
     video=False, port=None, address=None, remote=False, desktop=None
@@ -7,6 +7,7 @@
 """
 import itertools
 import logging
+import multiprocessing
 import warnings
 
 import numpy as np
@@ -91,6 +92,7 @@ _FRONT_FACE_ID = 4
 _TOP_FACE_ID = 2
 
 _PLANE_THICKNESS_EPSILON = 0.000001
+_ROTATION_AXIS_EPSILON = 1e-10
 _POINT_IN_FRONT_OF_PLANE = 1
 _POINT_ON_PLANE = 0
 _POINT_BEHIND_PLANE = -1
@@ -136,6 +138,218 @@ def compute_cuboid_iou(gt, pred, gt_crowd=False):
     return min(etan.safe_divide(inter, union), 1)
 
 
+def compute_cuboid_ious(
+    preds, gts, gt_crowds=None, pred_labels=None, gt_labels=None
+):
+    """Computes the pairwise IoUs between the given predicted and ground truth
+    cuboids.
+
+    Pairs whose axis-aligned bounds do not overlap are pruned without further
+    computation. Pairs of cuboids that are only rotated about a common
+    coordinate axis, e.g., cuboids with yaw-only rotations, are computed in a
+    vectorized fashion as the product of their rotated overlap area in the
+    plane orthogonal to that axis and their overlap along the axis. Any
+    remaining pairs are computed via :func:`compute_cuboid_iou`.
+
+    Args:
+        preds: a list of predicted :class:`fiftyone.core.labels.Detection`
+            instances
+        gts: a list of ground truth :class:`fiftyone.core.labels.Detection`
+            instances
+        gt_crowds (None): an optional list of booleans indicating whether each
+            ground truth cuboid is a crowd
+        pred_labels (None): an optional list of predicted labels. If both
+            ``pred_labels`` and ``gt_labels`` are provided, cuboids with
+            different labels are considered non-overlapping
+        gt_labels (None): an optional list of ground truth labels
+
+    Returns:
+        a ``num_preds x num_gts`` array of IoUs
+    """
+    ious = np.zeros((len(preds), len(gts)))
+    if not preds or not gts:
+        return ious
+
+    if gt_crowds is None:
+        gt_crowds = np.zeros(len(gts), dtype=bool)
+    else:
+        gt_crowds = np.asarray(gt_crowds, dtype=bool)
+
+    prots, plocs, pdims = _parse_cuboids(preds)
+    grots, glocs, gdims = _parse_cuboids(gts)
+
+    # Prune pairs whose axis-aligned bounds do not overlap
+    pmin, pmax = _get_axis_aligned_bounds(prots, plocs, pdims)
+    gmin, gmax = _get_axis_aligned_bounds(grots, glocs, gdims)
+    overlaps = np.all(
+        (pmin[:, np.newaxis] < gmax[np.newaxis])
+        & (gmin[np.newaxis] < pmax[:, np.newaxis]),
+        axis=2,
+    )
+
+    if pred_labels is not None and gt_labels is not None:
+        pred_labels = np.asarray(pred_labels, dtype=object)
+        gt_labels = np.asarray(gt_labels, dtype=object)
+        overlaps &= pred_labels[:, np.newaxis] == gt_labels[np.newaxis, :]
+
+    # Find the coordinate axes, if any, that each pair is only rotated about,
+    # preferring the z-axis
+    paxes = np.abs(np.diagonal(prots, axis1=1, axis2=2) - 1)
+    gaxes = np.abs(np.diagonal(grots, axis1=1, axis2=2) - 1)
+    shared = (paxes[:, np.newaxis] < _ROTATION_AXIS_EPSILON) & (
+        gaxes[np.newaxis] < _ROTATION_AXIS_EPSILON
+    )
+    axes = np.where(shared[..., 2], 2, np.where(shared[..., 1], 1, 0))
+
+    inds = np.nonzero(overlaps & shared.any(axis=2))
+    if inds[0].size > 0:
+        pinds, ginds = inds
+        axis = axes[inds]
+
+        parea, plo, phi = _project_cuboids(
+            prots[pinds], plocs[pinds], pdims[pinds], axis
+        )
+        garea, glo, ghi = _project_cuboids(
+            grots[ginds], glocs[ginds], gdims[ginds], axis
+        )
+
+        area = _compute_convex_intersection_areas(parea, garea)
+        height = np.maximum(np.minimum(phi, ghi) - np.maximum(plo, glo), 0)
+        inter = area * height
+
+        pvol = np.prod(pdims[pinds], axis=1)
+        union = np.where(
+            gt_crowds[ginds],
+            pvol,
+            pvol + np.prod(gdims[ginds], axis=1) - inter,
+        )
+
+        _ious = np.divide(
+            inter, union, out=np.zeros_like(inter), where=union > 0
+        )
+        ious[inds] = np.minimum(_ious, 1)
+
+    for i, j in zip(*np.nonzero(overlaps & ~shared.any(axis=2))):
+        ious[i, j] = compute_cuboid_iou(
+            gts[j], preds[i], gt_crowd=gt_crowds[j]
+        )
+
+    return ious
+
+
+def _parse_cuboids(detections):
+    rotations = []
+    for detection in detections:
+        rotation = np.asarray(detection.rotation, dtype=float)
+        if rotation.size == 3:
+            rotation = sp.transform.Rotation.from_rotvec(rotation).as_matrix()
+
+        rotations.append(rotation.reshape(3, 3))
+
+    locations = np.array([d.location for d in detections], dtype=float)
+    dimensions = np.array([d.dimensions for d in detections], dtype=float)
+
+    return np.stack(rotations), locations, dimensions
+
+
+def _get_axis_aligned_bounds(rotations, locations, dimensions):
+    extents = np.einsum("nij,nj->ni", np.abs(rotations), dimensions / 2.0)
+    return locations - extents, locations + extents
+
+
+def _project_cuboids(rotations, locations, dimensions, axis):
+    # Cyclic ordering of the plane axes keeps the projected corners CCW
+    plane = np.stack([(axis + 1) % 3, (axis + 2) % 3], axis=1)
+    inds = np.arange(len(axis))
+
+    block = rotations[
+        inds[:, np.newaxis, np.newaxis],
+        plane[:, :, np.newaxis],
+        plane[:, np.newaxis, :],
+    ]
+    half = dimensions[inds[:, np.newaxis], plane] / 2.0
+    signs = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+    corners = np.einsum(
+        "nij,nkj->nki", block, signs[np.newaxis] * half[:, np.newaxis]
+    )
+    corners += locations[inds[:, np.newaxis], plane][:, np.newaxis]
+
+    center = locations[inds, axis]
+    half_height = dimensions[inds, axis] / 2.0
+
+    return corners, center - half_height, center + half_height
+
+
+def _compute_convex_intersection_areas(polys1, polys2):
+    """Computes the areas of the intersections of batches of convex polygons
+    whose vertices are in counter-clockwise order.
+
+    The intersection of two convex polygons is the convex hull of the vertices
+    of each polygon that lie inside the other and the intersections of their
+    edges.
+    """
+    inside1 = _points_in_convex_polys(polys1, polys2)
+    inside2 = _points_in_convex_polys(polys2, polys1)
+
+    p = polys1[:, :, np.newaxis]
+    r = np.roll(polys1, -1, axis=1)[:, :, np.newaxis] - p
+    q = polys2[:, np.newaxis]
+    s = np.roll(polys2, -1, axis=1)[:, np.newaxis] - q
+
+    denom = _cross(r, s)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = _cross(q - p, s) / denom
+        u = _cross(q - p, r) / denom
+        edge_points = p + t[..., np.newaxis] * r
+
+    crosses = (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+    num = len(polys1)
+    points = np.concatenate(
+        [polys1, polys2, edge_points.reshape(num, -1, 2)], axis=1
+    )
+    valid = np.concatenate(
+        [inside1, inside2, crosses.reshape(num, -1)], axis=1
+    )
+
+    return _compute_convex_hull_areas(points, valid)
+
+
+def _points_in_convex_polys(points, polys):
+    edges = np.roll(polys, -1, axis=1) - polys
+    rel = points[:, :, np.newaxis] - polys[:, np.newaxis]
+    return np.all(
+        _cross(edges[:, np.newaxis], rel) >= -_PLANE_THICKNESS_EPSILON, axis=2
+    )
+
+
+def _compute_convex_hull_areas(points, valid):
+    # Sort the valid points by angle about their centroid and fill the
+    # remaining slots with copies of the first point, which contribute no
+    # area to the shoelace formula
+    num = valid.sum(axis=1)
+    points = np.where(valid[..., np.newaxis], points, 0.0)
+    center = points.sum(axis=1) / np.maximum(num, 1)[:, np.newaxis]
+    points = points - center[:, np.newaxis]
+
+    angles = np.where(
+        valid, np.arctan2(points[..., 1], points[..., 0]), np.inf
+    )
+    order = np.argsort(angles, axis=1)
+    points = np.take_along_axis(points, order[..., np.newaxis], axis=1)
+    valid = np.take_along_axis(valid, order, axis=1)
+    points = np.where(valid[..., np.newaxis], points, points[:, :1])
+
+    areas = 0.5 * np.abs(_cross(points, np.roll(points, -1, axis=1)).sum(1))
+    areas[num < 3] = 0.0
+
+    return areas
+
+
+def _cross(a, b):
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
 class _Box(object):
     def __init__(self, rotation, location, scale):
         rotation = np.array(rotation)
@@ -446,6 +660,7 @@ def compute_orthographic_projection_images(
     subsampling_rate=None,
     projection_normal=None,
     bounds=None,
+    num_workers=None,
 ):
     """Computes orthographic projection images for the point clouds in the
     given collection.
@@ -509,6 +724,8 @@ def compute_orthographic_projection_images(
             to generate each map. Either element of the tuple or any/all of its
             values can be None, in which case a tight crop of the point cloud
             along the missing dimension(s) are used
+        num_workers (None): the number of worker processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used
     """
     if in_group_slice is None and samples.media_type == fom.GROUP:
         in_group_slice = _get_point_cloud_slice(samples)
@@ -528,48 +745,65 @@ def compute_orthographic_projection_images(
         filepaths = point_cloud_view.values("filepath")
         groups = itertools.repeat(None)
 
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
     filename_maker = fou.UniqueFilenameMaker(
         output_dir=output_dir, rel_dir=rel_dir
     )
 
-    if out_group_slice is not None:
-        out_samples = []
-
-    all_metadata = []
-
-    with fou.ProgressBar(total=len(filepaths)) as pb:
-        for filepath, group in pb(zip(filepaths, groups)):
-            image_path = filename_maker.get_output_path(
-                filepath, output_ext=".png"
-            )
-
-            img, metadata = compute_orthographic_projection_image(
+    inputs = []
+    for filepath in filepaths:
+        image_path = filename_maker.get_output_path(
+            filepath, output_ext=".png"
+        )
+        inputs.append(
+            (
                 filepath,
+                image_path,
                 size,
-                shading_mode=shading_mode,
-                colormap=colormap,
-                subsampling_rate=subsampling_rate,
-                projection_normal=projection_normal,
-                bounds=bounds,
+                shading_mode,
+                colormap,
+                subsampling_rate,
+                projection_normal,
+                bounds,
             )
+        )
 
-            foui.write(img, image_path)
-            metadata.filepath = image_path
-
-            if out_group_slice is not None:
-                sample = Sample(filepath=image_path)
-                sample[group_field] = group.element(out_group_slice)
-                sample[metadata_field] = metadata
-                out_samples.append(sample)
+    all_metadata = []
 
-            all_metadata.append(metadata)
+    with fou.ProgressBar(inputs) as pb:
+        if num_workers <= 1:
+            for args in pb(inputs):
+                all_metadata.append(_do_projection(args))
+        else:
+            with fou.get_multiprocessing_context().Pool(
+                processes=num_workers
+            ) as pool:
+                for metadata in pb(pool.imap(_do_projection, inputs)):
+                    all_metadata.append(metadata)
 
     if out_group_slice is not None:
+        out_samples = []
+        for metadata, group in zip(all_metadata, groups):
+            sample = Sample(filepath=metadata.filepath)
+            sample[group_field] = group.element(out_group_slice)
+            sample[metadata_field] = metadata
+            out_samples.append(sample)
+
         samples.add_samples(out_samples)
 
     point_cloud_view.set_values(metadata_field, all_metadata)
 
 
+def _do_projection(args):
+    filepath, image_path = args[:2]
+    img, metadata = compute_orthographic_projection_image(filepath, *args[2:])
+    foui.write(img, image_path)
+    metadata.filepath = image_path
+    return metadata
+
+
 def compute_orthographic_projection_image(
     filepath,
     size,
@@ -642,17 +876,13 @@ def compute_orthographic_projection_image(
     points[:, 0] *= (width - 1) / (max_bound[0] - min_bound[0])
     points[:, 1] *= (height - 1) / (max_bound[1] - min_bound[1])
 
-    image = np.zeros((width, height, 3), dtype=np.uint8)
-
     if (
         len(colors) == len(points)
         and shading_mode is not None
         and shading_mode != "height"
     ):
         if shading_mode == "rgb":
-            image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = (
-                colors * 255.0
-            )
+            rgbs = colors * 255.0
         else:
             # use R channel for intensity, discard G and B channels
             min_intensity = np.min(colors[:, 0])
@@ -662,11 +892,7 @@ def compute_orthographic_projection_image(
             )
 
             # map intensity value to RGB
-            rgb_refs = _clamp_to_discrete(
-                intensities_normalized_t, list(colormap.keys())
-            )
-            rgbs = np.array([colormap[v] for v in rgb_refs])
-            image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
+            rgbs = _apply_colormap(intensities_normalized_t, colormap)
     elif shading_mode == "height":
         # color by height (z)
         max_z = np.max(points[:, 2])
@@ -674,11 +900,11 @@ def compute_orthographic_projection_image(
         z_normalized = (points[:, 2] - min_z) / (max_z - min_z)
 
         # map z value to color
-        rgb_refs = _clamp_to_discrete(z_normalized, list(colormap.keys()))
-        rgbs = np.array([colormap[v] for v in rgb_refs])
-        image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
+        rgbs = _apply_colormap(z_normalized, colormap)
     else:
-        image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = 255.0
+        rgbs = None
+
+    image = _rasterize_points(points, rgbs, width, height)
 
     # change axis orientation such that y is up
     image = np.rot90(image, k=1, axes=(0, 1))
@@ -686,6 +912,25 @@ def compute_orthographic_projection_image(
     return image, metadata
 
 
+def _rasterize_points(points, rgbs, width, height):
+    image = np.zeros((width, height, 3), dtype=np.uint8)
+    inds = np.int_(points[:, 0]) * height + np.int_(points[:, 1])
+
+    if rgbs is None:
+        image.reshape(-1, 3)[inds] = 255
+        return image
+
+    # Z-buffer: when multiple points project onto the same pixel, the point
+    # closest to the viewer (largest z) determines its color
+    order = np.lexsort((points[:, 2], inds))
+    inds = inds[order]
+    top = np.append(inds[1:] != inds[:-1], True)
+
+    image.reshape(-1, 3)[inds[top]] = rgbs[order[top]]
+
+    return image
+
+
 def _parse_point_cloud(
     filepath,
     size=None,
@@ -761,6 +1006,13 @@ def _get_point_cloud_slice(samples):
     return slice_name
 
 
+def _apply_colormap(values, colormap):
+    keys = np.sort(np.array(list(colormap.keys())))
+    rgbs = np.array([colormap[k] for k in keys])
+    idx = np.searchsorted(keys, _clamp_to_discrete(values, keys))
+    return rgbs[idx]
+
+
 def _clamp_to_discrete(arr, discrete):
     """Discretize by mapping each continuous value in ``arr`` to the closest
     value in ``discrete``.
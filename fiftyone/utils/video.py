@@ -8,6 +8,7 @@ Video utilities.
 import itertools
 import json
 import logging
+import multiprocessing
 import os
 
 import eta.core.frameutils as etaf
@@ -95,6 +96,7 @@ def reencode_videos(
     rel_dir=None,
     update_filepaths=True,
     delete_originals=False,
+    num_workers=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -148,6 +150,10 @@ def reencode_videos(
             sample collection
         delete_originals (False): whether to delete the original videos after
             re-encoding
+        num_workers (None): the number of worker processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used. Each worker runs its own
+            ``ffmpeg`` process, whose threads are limited so that the workers
+            share the available cores
         skip_failures (False): whether to gracefully continue without raising
             an error if a video cannot be re-encoded
         verbose (False): whether to log the ``ffmpeg`` commands that are
@@ -166,6 +172,7 @@ def reencode_videos(
         rel_dir=rel_dir,
         update_filepaths=update_filepaths,
         delete_originals=delete_originals,
+        num_workers=num_workers,
         skip_failures=skip_failures,
         verbose=verbose,
         **kwargs,
@@ -188,6 +195,7 @@ def transform_videos(
     rel_dir=None,
     update_filepaths=True,
     delete_originals=False,
+    num_workers=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -254,6 +262,10 @@ def transform_videos(
             sample collection
         delete_originals (False): whether to delete the original videos after
             re-encoding
+        num_workers (None): the number of worker processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used. Each worker runs its own
+            ``ffmpeg`` process, whose threads are limited so that the workers
+            share the available cores
         skip_failures (False): whether to gracefully continue without raising
             an error if a video cannot be transformed
         verbose (False): whether to log the ``ffmpeg`` commands that are
@@ -278,6 +290,7 @@ def transform_videos(
         rel_dir=rel_dir,
         update_filepaths=update_filepaths,
         delete_originals=delete_originals,
+        num_workers=num_workers,
         skip_failures=skip_failures,
         verbose=verbose,
         **kwargs,
@@ -301,6 +314,7 @@ def sample_videos(
     rel_dir=None,
     save_filepaths=False,
     delete_originals=False,
+    num_workers=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -400,6 +414,10 @@ def sample_videos(
             ``output_field`` field of each frame of the input collection
         delete_originals (False): whether to delete the original videos after
             sampling
+        num_workers (None): the number of worker processes to use. By default,
+            ``multiprocessing.cpu_count()`` is used. Each worker runs its own
+            ``ffmpeg`` process, whose threads are limited so that the workers
+            share the available cores
         skip_failures (False): whether to gracefully continue without raising
             an error if a video cannot be sampled
         verbose (False): whether to log the ``ffmpeg`` commands that are
@@ -426,6 +444,7 @@ def sample_videos(
         rel_dir=rel_dir,
         save_filepaths=save_filepaths,
         delete_originals=delete_originals,
+        num_workers=num_workers,
         skip_failures=skip_failures,
         verbose=verbose,
         **kwargs,
@@ -723,6 +742,7 @@ def _transform_videos(
     save_filepaths=False,
     update_filepaths=True,
     delete_originals=False,
+    num_workers=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -739,87 +759,148 @@ def _transform_videos(
                 fo.config.default_sequence_idx + fo.config.default_image_ext
             )
 
-    view = sample_collection.select_fields(media_field)
+    save_frames = save_filepaths and sample_frames
+
+    if frames is not None:
+        frames = list(frames)
+
+    if save_frames and (frames is None or any(f is None for f in frames)):
+        sample_collection.compute_metadata(
+            num_workers=num_workers, skip_failures=skip_failures
+        )
+        sample_ids, inpaths, frame_counts = sample_collection.values(
+            ["id", media_field, "metadata.total_frame_count"]
+        )
+    else:
+        sample_ids, inpaths = sample_collection.values(["id", media_field])
+        frame_counts = itertools.repeat(None)
 
     if frames is None:
         frames = itertools.repeat(None)
 
-    with fou.ProgressBar(total=len(view)) as pb:
-        for sample, _frames in pb(zip(view, frames)):
-            inpath = sample[media_field]
-
-            _outpath = _get_outpath(
-                inpath, output_dir=output_dir, rel_dir=rel_dir
-            )
+    transform_kwargs = dict(
+        fps=fps,
+        min_fps=min_fps,
+        max_fps=max_fps,
+        size=size,
+        min_size=min_size,
+        max_size=max_size,
+        original_frame_numbers=original_frame_numbers,
+        reencode=reencode,
+        force_reencode=force_reencode,
+        delete_original=delete_originals,
+        skip_failures=skip_failures,
+        verbose=verbose,
+        **kwargs,
+    )
 
-            if sample_frames:
-                outpath = os.path.join(
-                    os.path.splitext(_outpath)[0], frames_patt
-                )
-
-                # If sampling was not forced and the first frame exists, assume
-                # that all frames exist
-                fn = _frames[0] if _frames else 1
-                if not force_reencode and os.path.isfile(outpath % fn):
-                    continue
-            elif reencode:
-                root, ext = os.path.splitext(_outpath)
-                if ext.lower() != ".mp4":
-                    outpath = root + ".mp4"
-                else:
-                    outpath = _outpath
+    inputs = []
+    for sample_id, inpath, _frames, frame_count in zip(
+        sample_ids, inpaths, frames, frame_counts
+    ):
+        _outpath = _get_outpath(inpath, output_dir=output_dir, rel_dir=rel_dir)
+
+        if sample_frames:
+            outpath = os.path.join(os.path.splitext(_outpath)[0], frames_patt)
+
+            # If sampling was not forced and the first frame exists, assume
+            # that all frames exist
+            fn = _frames[0] if _frames else 1
+            if not force_reencode and os.path.isfile(outpath % fn):
+                continue
+        elif reencode:
+            root, ext = os.path.splitext(_outpath)
+            if ext.lower() != ".mp4":
+                outpath = root + ".mp4"
             else:
                 outpath = _outpath
+        else:
+            outpath = _outpath
 
-            _transform_video(
+        if not save_frames:
+            frame_numbers = None
+        elif _frames is None:
+            frame_numbers = range(1, (frame_count or 0) + 1)
+        else:
+            frame_numbers = _frames
+
+        inputs.append(
+            (
+                sample_id,
                 inpath,
                 outpath,
-                frames=_frames,
-                fps=fps,
-                min_fps=min_fps,
-                max_fps=max_fps,
-                size=size,
-                min_size=min_size,
-                max_size=max_size,
-                original_frame_numbers=original_frame_numbers,
-                reencode=reencode,
-                force_reencode=force_reencode,
-                delete_original=delete_originals,
-                skip_failures=skip_failures,
-                verbose=verbose,
-                **kwargs,
+                _frames,
+                frame_numbers,
+                transform_kwargs,
             )
+        )
 
-            if save_filepaths and sample_frames:
-                if _frames is None:
-                    try:
-                        if sample.metadata is None:
-                            sample.compute_metadata()
-
-                        _frames = range(
-                            1, sample.metadata.total_frame_count + 1
-                        )
-                    except BaseException as e:
-                        if not skip_failures:
-                            raise
-
-                        _frames = []
-                        logger.warning(e)
-
-                for fn in _frames:
-                    frame_path = outpath % fn
-                    if os.path.isfile(frame_path):
-                        sample.frames[fn][output_field] = frame_path
-
-                sample.save()
-
-            if (
-                update_filepaths
-                and not sample_frames
-                and (diff_field or outpath != inpath)
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    num_workers = min(num_workers, len(inputs))
+
+    if num_workers > 1:
+        # Split the available cores among the concurrent ffmpeg processes so
+        # that the machine is not oversubscribed
+        threads = max(multiprocessing.cpu_count() // num_workers, 1)
+        transform_kwargs["threads"] = threads
+
+    outpaths = {}
+    frame_paths = {}
+
+    try:
+        with fou.ProgressBar(inputs) as pb:
+            for sample_id, inpath, outpath, _frame_paths in pb(
+                _run_transforms(inputs, num_workers)
             ):
-                sample[output_field] = outpath
-                sample.save()
+                if _frame_paths:
+                    frame_paths[sample_id] = _frame_paths
+
+                if (
+                    update_filepaths
+                    and not sample_frames
+                    and (diff_field or outpath != inpath)
+                ):
+                    outpaths[sample_id] = outpath
+    finally:
+        if outpaths:
+            sample_collection.set_values(
+                output_field, outpaths, key_field="id"
+            )
+
+        if frame_paths:
+            sample_collection.set_values(
+                sample_collection._FRAMES_PREFIX + output_field,
+                frame_paths,
+                key_field="id",
+            )
+
+
+def _run_transforms(inputs, num_workers):
+    if num_workers <= 1:
+        yield from map(_do_transform, inputs)
+        return
+
+    with fou.get_multiprocessing_context().Pool(processes=num_workers) as pool:
+        yield from pool.imap_unordered(_do_transform, inputs)
+
+
+def _do_transform(args):
+    sample_id, inpath, outpath, frames, frame_numbers, kwargs = args
+
+    _transform_video(inpath, outpath, frames=frames, **kwargs)
+
+    if frame_numbers is not None:
+        frame_paths = {}
+        for fn in frame_numbers:
+            frame_path = outpath % fn
+            if os.path.isfile(frame_path):
+                frame_paths[fn] = frame_path
+    else:
+        frame_paths = None
+
+    return sample_id, inpath, outpath, frame_paths
 
 
 def _transform_video(
@@ -837,6 +918,7 @@ def _transform_video(
     reencode=False,
     force_reencode=False,
     delete_original=False,
+    threads=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -896,6 +978,9 @@ def _transform_video(
             if "out_opts" not in kwargs:
                 kwargs["out_opts"] = []
 
+        if threads is not None:
+            _limit_threads(kwargs, outpath, threads)
+
         should_reencode = (
             force_reencode
             or fps is not None
@@ -945,6 +1030,27 @@ def _transform_video(
     return did_transform
 
 
+def _limit_threads(kwargs, outpath, threads):
+    threads_opts = ["-threads", str(threads)]
+
+    # Limits decoding threads
+    global_opts = kwargs.get("global_opts", None)
+    if global_opts is None:
+        global_opts = etav.FFmpeg.DEFAULT_GLOBAL_OPTS
+
+    kwargs["global_opts"] = list(global_opts) + threads_opts
+
+    # Limits encoding threads
+    out_opts = kwargs.get("out_opts", None)
+    if out_opts is None:
+        if etav.is_supported_video_file(outpath):
+            out_opts = etav.FFmpeg.DEFAULT_VIDEO_OUT_OPTS
+        else:
+            out_opts = etav.FFmpeg.DEFAULT_IMAGES_OUT_OPTS
+
+    kwargs["out_opts"] = list(out_opts) + threads_opts
+
+
 def _parse_parameters(
     video_path,
     fps,
@@ -163,6 +163,32 @@ def test_transform_videos(tmpdir):
     assert sample.metadata.frame_width >= 512
 
 
+def test_transform_videos_parallel(tmpdir):
+    video_path = os.path.join(tmpdir, "video.avi")
+    dataset_dir = os.path.join(tmpdir, "videos")
+
+    _write_video(video_path, fps=5, size=(720, 1280), num_frames=30)
+    dataset = _make_dataset(video_path, dataset_dir, num_samples=4)
+
+    for num_workers in (1, 4):
+        output_dir = os.path.join(tmpdir, "output%d" % num_workers)
+        view = dataset.clone()
+
+        fouv.transform_videos(
+            view,
+            max_size=(256, 256),
+            output_dir=output_dir,
+            rel_dir=dataset_dir,
+            num_workers=num_workers,
+        )
+        view.compute_metadata(overwrite=True)
+
+        assert all(f.startswith(output_dir) for f in view.values("filepath"))
+        assert max(view.values("metadata.frame_height")) <= 256
+        assert max(view.values("metadata.frame_width")) <= 256
+        assert view.values("metadata.total_frame_count") == [30] * 4
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     pytest.main([__file__])
@@ -5,12 +5,44 @@ Test that fiftyone can be imported in a reasonable amount of time.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+import subprocess
+import sys
 import warnings
 import time
 
 
 # TODO: decrease these once the DB service is started on-demand?
 IMPORT_WARN_THRESHOLD = 3
+LAZY_IMPORT_WARN_THRESHOLD = 2.5
+
+# Modules that must not be loaded by `import fiftyone` when
+# `fo.config.lazy_import` is True
+LAZY_MODULES = ["fiftyone.core.plots", "fiftyone.core.session", "sklearn"]
+
+_LAZY_IMPORT_SCRIPT = """
+import sys
+import time
+
+t1 = time.perf_counter()
+import fiftyone
+import fiftyone.core.odm.database as food
+
+print(time.perf_counter() - t1)
+print(food._client is None)
+print(",".join(m for m in %s if m in sys.modules))
+""" % (
+    LAZY_MODULES,
+)
+
+
+def _warn(capsys, message):
+    warnings.warn(message)
+    # disable stdout capture temporarily
+    with capsys.disabled():
+        # message must follow this format:
+        # https://docs.github.com/en/actions/reference/workflow-commands-for-github-actions#setting-a-warning-message
+        print("\n::warning::%s\n" % message)
 
 
 def test_import_time(capsys):
@@ -20,9 +52,21 @@ def test_import_time(capsys):
     time_elapsed = time.perf_counter() - t1
     message = "`import fiftyone` took %f seconds" % time_elapsed
     if time_elapsed > IMPORT_WARN_THRESHOLD:
-        warnings.warn(message)
-        # disable stdout capture temporarily
-        with capsys.disabled():
-            # message must follow this format:
-            # https://docs.github.com/en/actions/reference/workflow-commands-for-github-actions#setting-a-warning-message
-            print("\n::warning::%s\n" % message)
+        _warn(capsys, message)
+
+
+def test_lazy_import_time(capsys):
+    # A fresh interpreter is required, since `fiftyone` may already be loaded
+    env = dict(os.environ, FIFTYONE_LAZY_IMPORT="true")
+    out = subprocess.check_output(
+        [sys.executable, "-c", _LAZY_IMPORT_SCRIPT], env=env, text=True
+    )
+    time_elapsed, no_client, loaded_modules = out.splitlines()[-3:]
+    time_elapsed = float(time_elapsed)
+
+    assert no_client == "True"
+    assert not loaded_modules
+
+    message = "lazy `import fiftyone` took %f seconds" % time_elapsed
+    if time_elapsed > LAZY_IMPORT_WARN_THRESHOLD:
+        _warn(capsys, message)
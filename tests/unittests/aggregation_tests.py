@@ -5,6 +5,7 @@ FiftyOne aggregation-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
 from datetime import date, datetime, timedelta
 import math
 
@@ -460,6 +461,82 @@ class DatasetTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             d.quantiles("numeric_field", 2)
 
+    @drop_datasets
+    def test_approx_quantiles(self):
+        d = fo.Dataset()
+        d.add_sample_field("numeric_field", fo.FloatField)
+        self.assertIsNone(d.approx_quantiles("numeric_field", 0.5))
+        self.assertListEqual(
+            d.approx_quantiles("numeric_field", [0.5]), [None]
+        )
+
+        values = np.random.default_rng(51).normal(size=1000)
+        values[:10] = 0.0
+        d.add_samples(
+            [
+                fo.Sample(filepath="image%d.jpg" % i, numeric_field=v)
+                for i, v in enumerate(values)
+            ]
+        )
+
+        q = np.linspace(0, 1, 21)
+        results1 = d.approx_quantiles("numeric_field", q)
+        results2 = d.quantiles("numeric_field", q)
+
+        self.assertAlmostEqual(results1[0], values.min())
+        self.assertAlmostEqual(results1[-1], values.max())
+        for r1, r2 in zip(results1, results2):
+            self.assertLessEqual(abs(r1 - r2), 0.01 * abs(r2) + 1e-9)
+
+        results1 = d.aggregate(
+            [
+                fo.ApproxQuantiles(2 * F("numeric_field"), 0.5),
+                fo.Quantiles(2 * F("numeric_field"), 0.5),
+            ]
+        )
+        self.assertLessEqual(
+            abs(results1[0] - results1[1]), 0.01 * abs(results1[1])
+        )
+
+        with self.assertRaises(ValueError):
+            d.approx_quantiles("numeric_field", 2)
+
+        with self.assertRaises(ValueError):
+            d.approx_quantiles("numeric_field", 0.5, relative_accuracy=1)
+
+    @drop_datasets
+    def test_approx_count_distinct(self):
+        d = fo.Dataset()
+        self.assertEqual(d.approx_count_distinct("tags"), 0)
+
+        d.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    int_field=i % 2000,
+                    tags=[str(i % 7), str(i % 3)],
+                )
+                for i in range(5000)
+            ]
+        )
+
+        self.assertEqual(d.approx_count_distinct("tags"), 7)
+
+        count = d.approx_count_distinct("int_field")
+        self.assertLessEqual(abs(count - 2000), 0.05 * 2000)
+
+        count1, count2 = d.aggregate(
+            [
+                fo.ApproxCountDistinct("filepath"),
+                fo.ApproxCountDistinct("id"),
+            ]
+        )
+        self.assertLessEqual(abs(count1 - 5000), 0.05 * 5000)
+        self.assertLessEqual(abs(count2 - 5000), 0.05 * 5000)
+
+        with self.assertRaises(ValueError):
+            d.approx_count_distinct("int_field", precision=32)
+
     @drop_datasets
     def test_std(self):
         d = fo.Dataset()
@@ -1018,6 +1095,50 @@ class DatasetTests(unittest.TestCase):
         results = dataset.values(fields)
         self.assertEqual(len(fields), len(results))
 
+    @drop_datasets
+    def test_facet_planning(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    gt=fo.Detections(
+                        detections=[
+                            fo.Detection(label=str(j), confidence=0.1 * j)
+                            for j in range(i)
+                        ]
+                    ),
+                    **{"f%d" % j: i * j for j in range(20)},
+                )
+                for i in range(5)
+            ]
+        )
+
+        aggregations = [fo.Count()]
+        for j in range(20):
+            aggregations.append(fo.Bounds("f%d" % j))
+            aggregations.append(fo.Count("f%d" % j))
+
+        aggregations.append(fo.CountValues("gt.detections.label"))
+        aggregations.append(fo.Bounds("gt.detections.confidence"))
+        aggregations.append(fo.Sum("f1", expr=F() + 1))
+
+        _, facets = dataset._build_facets(dict(enumerate(aggregations)))
+        self.assertLessEqual(len(facets), 9)
+
+        expected = [dataset.aggregate(agg) for agg in aggregations]
+
+        results = dataset.aggregate(aggregations)
+        self.assertListEqual(results, expected)
+
+        results = asyncio.run(dataset._async_aggregate(aggregations))
+        self.assertListEqual(results, expected)
+
+        view = dataset.match(F("f1") > 1)
+        results = view.aggregate(aggregations)
+        self.assertListEqual(results[:3], [3, (0, 0), 3])
+        self.assertEqual(results[-1], sum(i + 1 for i in range(2, 5)))
+
     @drop_datasets
     def test_video_frames(self):
         sample = fo.Sample(filepath="video.mp4")
@@ -24,6 +24,7 @@ import fiftyone as fo
 import fiftyone.core.fields as fof
 import fiftyone.core.odm as foo
 import fiftyone.utils.data as foud
+import fiftyone.utils.image as foui
 from fiftyone import ViewField as F
 
 from decorators import drop_datasets, skip_windows
@@ -498,6 +499,66 @@ class DatasetTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             dataset.create_index("non_existent_field")
 
+    @drop_datasets
+    def test_add_samples(self):
+        dataset = fo.Dataset()
+
+        samples = [
+            fo.Sample(filepath="image%d.jpg" % i, index=i) for i in range(1000)
+        ]
+        sample_ids = dataset.add_samples(iter(samples))
+
+        self.assertEqual(len(dataset), 1000)
+        self.assertListEqual(sample_ids, dataset.values("id"))
+        self.assertListEqual(dataset.values("index"), list(range(1000)))
+        self.assertTrue(all(s.in_dataset for s in samples))
+        self.assertListEqual([s.id for s in samples], sample_ids)
+
+        # Subsequent calls warm start from the learned batch size
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="other%d.jpg" % i, index=2000 + i)
+                for i in range(10)
+            ]
+        )
+        self.assertEqual(len(dataset), 1010)
+
+        dataset.create_index("index", unique=True)
+
+        samples = [
+            fo.Sample(filepath="new%d.jpg" % i, index=1000 + i)
+            for i in range(500)
+        ]
+        samples.append(fo.Sample(filepath="image0.jpg", index=0))
+
+        with self.assertRaises(ValueError):
+            dataset.add_samples(samples)
+
+        self.assertEqual(len(dataset), 1510)
+
+        samples = list(dataset)[:100]
+        for sample in samples:
+            sample["tags"] = ["upsert"]
+
+        samples.append(fo.Sample(filepath="upsert.jpg", tags=["upsert"]))
+        dataset._upsert_samples(samples)
+
+        self.assertEqual(len(dataset), 1511)
+        self.assertEqual(dataset.count_sample_tags(), {"upsert": 101})
+
+        # Samples need not be attached when only their IDs are required
+        samples = [
+            fo.Sample(filepath="ids%d.jpg" % i, index=3000 + i)
+            for i in range(10)
+        ]
+        sample_ids = dataset._add_samples(samples, attach_samples=False)
+
+        self.assertFalse(any(s.in_dataset for s in samples))
+        self.assertListEqual(
+            dataset.select(sample_ids, ordered=True).values("filepath"),
+            [s.filepath for s in samples],
+        )
+
     @drop_datasets
     def test_iter_samples(self):
         dataset = fo.Dataset()
@@ -529,6 +590,120 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
 
+    @drop_datasets
+    def test_save_context_default_batch_size(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(10)]
+        )
+
+        default_save_batch_size = fo.config.default_save_batch_size
+
+        try:
+            fo.config.default_save_batch_size = 3
+
+            with dataset.save_context() as context:
+                self.assertEqual(context.batch_size, 3)
+
+                for idx, sample in enumerate(dataset):
+                    sample["int"] = idx
+                    context.save(sample)
+
+            self.assertTupleEqual(dataset.bounds("int"), (0, 9))
+
+            with dataset.save_context(batch_size=0.5) as context:
+                self.assertEqual(context.batch_size, 0.5)
+        finally:
+            fo.config.default_save_batch_size = default_save_batch_size
+
+    @drop_datasets
+    def test_iter_batches(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    int=i,
+                    float=None if i == 3 else float(i),
+                    vector=np.full(4, i, dtype=np.float32),
+                    ground_truth=fo.Classification(label=str(i)),
+                )
+                for i in range(10)
+            ]
+        )
+
+        fields = ["id", "int", "float", "vector", "ground_truth.label"]
+        batches = list(dataset.iter_batches(fields, batch_size=4))
+
+        self.assertListEqual([len(b["id"]) for b in batches], [4, 4, 2])
+        self.assertEqual(batches[0]["int"].dtype, int)
+        self.assertTupleEqual(batches[0]["vector"].shape, (4, 4))
+        self.assertEqual(batches[0]["vector"].dtype, np.float32)
+        self.assertTrue(np.isnan(batches[0]["float"][3]))
+
+        arrays = dataset.to_arrays(fields)
+
+        self.assertListEqual(list(arrays["id"]), dataset.values("id"))
+        self.assertListEqual(list(arrays["int"]), list(range(10)))
+        self.assertTupleEqual(arrays["vector"].shape, (10, 4))
+        self.assertListEqual(
+            list(arrays["ground_truth.label"]),
+            [str(i) for i in range(10)],
+        )
+
+        view = dataset.match(F("int") > 5).sort_by("int", reverse=True)
+        arrays = view.to_arrays("int")
+
+        self.assertListEqual(list(arrays["int"]), [9, 8, 7, 6])
+
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(int=1)
+        sample.frames[2] = fo.Frame(int=2)
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        arrays = dataset.to_arrays(["filepath", "frames.int"])
+
+        self.assertListEqual(list(arrays["frames.int"]), [[1, 2]])
+
+    @drop_datasets
+    def test_compute_metadata(self):
+        with etau.TempDir() as tmp_dir:
+            filepaths = []
+            for i in range(5):
+                filepath = os.path.join(tmp_dir, "image%d.png" % i)
+                img = np.zeros((16, 8 + i, 3), dtype=np.uint8)
+                foui.write(img, filepath)
+                filepaths.append(filepath)
+
+            dataset = fo.Dataset()
+            dataset.add_samples(
+                [fo.Sample(filepath=f) for f in filepaths]
+                + [fo.Sample(filepath=os.path.join(tmp_dir, "missing.png"))]
+            )
+
+            dataset.compute_metadata(num_workers=1)
+
+            self.assertListEqual(
+                dataset.values("metadata.width"), [8, 9, 10, 11, 12, None]
+            )
+            self.assertEqual(len(dataset.exists("metadata", False)), 1)
+
+            dataset.set_field("metadata", None).save()
+            dataset.compute_metadata(num_workers=2, use_threads=True)
+
+            self.assertListEqual(
+                dataset.values("metadata.height"), [16] * 5 + [None]
+            )
+
+            dataset.set_field("metadata", None).save()
+            dataset.compute_metadata(num_workers=2)
+
+            self.assertListEqual(
+                dataset.values("metadata.num_channels"), [3] * 5 + [None]
+            )
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
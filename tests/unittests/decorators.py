@@ -6,6 +6,7 @@ Decorator utils for unit tests.
 |
 """
 from functools import wraps
+import inspect
 import platform
 import unittest
 
@@ -17,6 +18,15 @@ def drop_datasets(func):
     before running a test.
     """
 
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            fo.delete_non_persistent_datasets()
+            return await func(*args, **kwargs)
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         fo.delete_non_persistent_datasets()
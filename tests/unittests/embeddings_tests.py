@@ -0,0 +1,190 @@
+"""
+FiftyOne embeddings side-store unit tests.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import fiftyone as fo
+from fiftyone import ViewField as F
+import fiftyone.core.embeddings as foem
+import fiftyone.core.models as fomo
+import fiftyone.utils.image as foui
+
+from decorators import drop_datasets
+
+
+class _MeanColorModel(fomo.Model, fomo.EmbeddingsMixin):
+    def __init__(self):
+        self._embeddings = None
+
+    @property
+    def media_type(self):
+        return "image"
+
+    @property
+    def has_embeddings(self):
+        return True
+
+    @property
+    def ragged_batches(self):
+        return False
+
+    @property
+    def transforms(self):
+        return None
+
+    @property
+    def preprocess(self):
+        return False
+
+    def predict(self, img):
+        self._embeddings = img.reshape(-1, 3).mean(axis=0)[np.newaxis]
+        return None
+
+    def get_embeddings(self):
+        return self._embeddings
+
+
+class EmbeddingsTests(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._embeddings_dir = fo.config.embeddings_dir
+        fo.config.embeddings_dir = os.path.join(
+            self._temp_dir.name, "embeddings"
+        )
+
+    def tearDown(self):
+        fo.config.embeddings_dir = self._embeddings_dir
+        self._temp_dir.cleanup()
+
+    def _make_dataset(self, num_samples=4):
+        samples = []
+        for idx in range(num_samples):
+            filepath = os.path.join(self._temp_dir.name, "%d.png" % idx)
+            img = np.full((8, 8, 3), 10 * idx, dtype=np.uint8)
+            foui.write(img, filepath)
+
+            samples.append(
+                fo.Sample(
+                    filepath=filepath,
+                    index=idx,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat", bounding_box=[0, 0, 0.5, 0.5]
+                            )
+                            for _ in range(idx % 3)
+                        ]
+                    ),
+                )
+            )
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        return dataset
+
+    @drop_datasets
+    def test_save_load_embeddings(self):
+        dataset = self._make_dataset()
+        embeddings = np.random.randn(len(dataset), 5).astype(np.float32)
+
+        foem.save_embeddings(dataset, "test", embeddings)
+
+        self.assertListEqual(dataset.list_embeddings(), ["test"])
+        self.assertTrue(foem.has_embeddings(dataset, "test"))
+
+        # Full dataset is a zero-copy memory-mapped array
+        embeddings2 = dataset.load_embeddings("test")
+        self.assertIsInstance(embeddings2, np.memmap)
+        self.assertTrue(np.array_equal(embeddings2, embeddings))
+
+        # Contiguous views are zero-copy too
+        view = dataset.skip(1).limit(2)
+        embeddings2 = view.load_embeddings("test")
+        self.assertIsInstance(embeddings2, np.memmap)
+        self.assertTrue(np.array_equal(embeddings2, embeddings[1:3]))
+
+        # Embeddings are aligned with the view's order
+        view = dataset.sort_by("index", reverse=True).match(F("index") != 2)
+        embeddings2 = view.load_embeddings("test")
+        self.assertTrue(np.array_equal(embeddings2, embeddings[[3, 1, 0]]))
+
+        # Samples without embeddings raise an error
+        dataset.add_sample(fo.Sample(filepath="image.png"))
+        with self.assertRaises(ValueError):
+            dataset.load_embeddings("test")
+
+        with self.assertRaises(ValueError):
+            dataset.load_embeddings("missing")
+
+        dataset.delete_embeddings("test")
+        self.assertListEqual(dataset.list_embeddings(), [])
+
+        foem.save_embeddings(dataset, "test", [None] * len(dataset))
+        self.assertListEqual(dataset.list_embeddings(), ["test"])
+
+        # Deleting the dataset deletes its embeddings
+        dataset.delete()
+        embeddings_dir = fo.config.embeddings_dir
+        self.assertFalse(
+            os.path.isdir(embeddings_dir) and os.listdir(embeddings_dir)
+        )
+
+    @drop_datasets
+    def test_compute_embeddings(self):
+        dataset = self._make_dataset()
+        model = _MeanColorModel()
+
+        embeddings = dataset.compute_embeddings(model)
+        dataset.compute_embeddings(model, embeddings_key="mean")
+
+        embeddings2 = dataset.load_embeddings("mean")
+        self.assertTrue(np.allclose(embeddings2, embeddings))
+
+        view = dataset.take(2)
+        embeddings2 = view.load_embeddings("mean")
+        indexes = np.array(view.values("index"))
+        self.assertTrue(np.allclose(embeddings2[:, 0], 10 * indexes))
+
+        with self.assertRaises(ValueError):
+            dataset.compute_embeddings(
+                model, embeddings_field="mean", embeddings_key="mean"
+            )
+
+    @drop_datasets
+    def test_compute_patch_embeddings(self):
+        dataset = self._make_dataset(num_samples=6)
+        model = _MeanColorModel()
+
+        dataset.compute_patch_embeddings(
+            model, "ground_truth", embeddings_key="patches"
+        )
+
+        num_patches = dataset.count("ground_truth.detections")
+        embeddings = dataset.load_embeddings("patches")
+        self.assertEqual(embeddings.shape, (num_patches, 3))
+
+        view = dataset.filter_labels("ground_truth", F("label") == "cat")
+        view = view.sort_by("index", reverse=True)
+        embeddings = view.load_embeddings("patches")
+        indexes = [
+            idx
+            for idx, num in zip(
+                *view.values(["index", F("ground_truth.detections").length()])
+            )
+            for _ in range(num)
+        ]
+        self.assertTrue(np.allclose(embeddings[:, 0], 10 * np.array(indexes)))
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
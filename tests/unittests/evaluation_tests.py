@@ -18,6 +18,7 @@ import eta.core.utils as etau
 import fiftyone as fo
 import fiftyone.utils.labels as foul
 import fiftyone.utils.iou as foui
+import fiftyone.utils.utils3d as fou3d
 
 from decorators import drop_datasets
 
@@ -1573,6 +1574,49 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_coco(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_coco_multi(self):
+        dataset = self._make_detections_dataset()
+        self._check_evaluate_multi(dataset, "coco")
+
+        dataset = self._make_polylines_dataset()
+        self._check_evaluate_multi(dataset, "open-images")
+
+    def _check_evaluate_multi(self, dataset, method):
+        results1 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval1",
+            method=method,
+        )
+        results2 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            method=method,
+            num_workers=2,
+        )
+
+        self.assertListEqual(results1.ytrue.tolist(), results2.ytrue.tolist())
+        self.assertListEqual(results1.ypred.tolist(), results2.ypred.tolist())
+
+        for field in ("tp", "fp", "fn"):
+            self.assertListEqual(
+                dataset.values("eval1_" + field),
+                dataset.values("eval2_" + field),
+            )
+
+        for field in ("ground_truth", "predictions"):
+            _, path = dataset._get_label_field_path(field)
+            self.assertListEqual(
+                dataset.values(path + ".eval1"),
+                dataset.values(path + ".eval2"),
+            )
+            self.assertListEqual(
+                dataset.values(path + ".eval1_iou"),
+                dataset.values(path + ".eval2_iou"),
+            )
+
     @drop_datasets
     def test_evaluate_detections_open_images(self):
         dataset = self._make_detections_dataset()
@@ -1640,6 +1684,55 @@ class DetectionsTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             detection["eval2"]
 
+    def test_compute_batch_ious(self):
+        gts1 = [
+            fo.Detection(label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4]),
+            fo.Detection(
+                label="dog", bounding_box=[0.5, 0.5, 0.4, 0.4], iscrowd=True
+            ),
+        ]
+        preds1 = [
+            fo.Detection(label="cat", bounding_box=[0.1, 0.1, 0.2, 0.4]),
+            fo.Detection(label="cat", bounding_box=[0.6, 0.6, 0.2, 0.2]),
+            fo.Detection(label="dog", bounding_box=[0.0, 0.0, 0.1, 0.1]),
+        ]
+        gts2 = [fo.Detection(label="cat", bounding_box=[0.2, 0.2, 0.2, 0.2])]
+        preds2 = []
+
+        ious = foui.compute_bbox_ious(
+            [[0.1, 0.1, 0.2, 0.4]], [[0.1, 0.1, 0.4, 0.4], [0, 0, 0, 0]]
+        )
+        self.assertEqual(ious.shape, (1, 2))
+        self.assertAlmostEqual(ious[0, 0], 0.5)
+        self.assertEqual(ious[0, 1], 0)
+
+        for kwargs in (
+            {},
+            {"classwise": True},
+            {"iscrowd": "iscrowd"},
+        ):
+            ious_batch = foui.compute_batch_ious(
+                [preds1, preds2, gts1], [gts1, gts2, gts1], **kwargs
+            )
+            expected = [
+                foui.compute_ious(preds1, gts1, **kwargs),
+                foui.compute_ious(preds2, gts2, **kwargs),
+                foui.compute_ious(gts1, gts1, **kwargs),
+            ]
+
+            self.assertEqual(len(ious_batch), 3)
+            for ious, _ious in zip(ious_batch, expected):
+                self.assertEqual(ious.shape, _ious.shape)
+                self.assertTrue(np.allclose(ious, _ious))
+
+        ious = foui.compute_ious(preds1, gts1, iscrowd="iscrowd")
+        self.assertAlmostEqual(ious[0, 0], 0.5)
+        self.assertAlmostEqual(ious[1, 1], 1.0)
+        self.assertEqual(ious[2, 0], 0)
+
+        ious = foui.compute_ious(gts1, gts1)
+        self.assertTrue(np.allclose(np.diag(ious), 1))
+
 
 class CuboidTests(unittest.TestCase):
     def _make_dataset(self):
@@ -1776,6 +1869,66 @@ class CuboidTests(unittest.TestCase):
         self._check_iou(dataset, "test4_box1", "test4_box3", expected_iou)
         self._check_iou(dataset, "test4_box1", "test4_box4", expected_iou)
 
+    def test_compute_cuboid_ious(self):
+        np.random.seed(0)
+
+        def _make_cuboids(num_cuboids):
+            cuboids = []
+            for idx in range(num_cuboids):
+                # yaw-only, single-axis, and arbitrary rotations
+                rotation = np.zeros(3)
+                if idx % 3 == 0:
+                    rotation[2] = np.random.uniform(-np.pi, np.pi)
+                elif idx % 3 == 1:
+                    rotation[idx % 2] = np.random.uniform(-np.pi, np.pi)
+                else:
+                    rotation = np.random.uniform(-1, 1, size=3)
+
+                cuboids.append(
+                    fo.Detection(
+                        label=random.choice(["cat", "dog"]),
+                        dimensions=list(np.random.uniform(0.5, 3, size=3)),
+                        location=list(np.random.uniform(-2, 2, size=3)),
+                        rotation=list(rotation),
+                    )
+                )
+
+            return cuboids
+
+        preds = _make_cuboids(12)
+        gts = _make_cuboids(9)
+        gt_crowds = [idx % 4 == 0 for idx in range(len(gts))]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            expected = np.array(
+                [
+                    [
+                        fou3d.compute_cuboid_iou(gt, pred, gt_crowd=gt_crowd)
+                        for gt, gt_crowd in zip(gts, gt_crowds)
+                    ]
+                    for pred in preds
+                ]
+            )
+            ious = fou3d.compute_cuboid_ious(preds, gts, gt_crowds=gt_crowds)
+            ious_classwise = foui.compute_ious(
+                preds,
+                gts,
+                iscrowd=lambda l: gt_crowds[gts.index(l)],
+                classwise=True,
+            )
+
+        self.assertGreater(np.count_nonzero(expected), 0)
+        self.assertTrue(np.allclose(ious, expected))
+
+        same_label = np.array(
+            [[pred.label == gt.label for gt in gts] for pred in preds]
+        )
+        self.assertTrue(
+            np.allclose(ious_classwise, np.where(same_label, expected, 0))
+        )
+
 
 class VideoDetectionsTests(unittest.TestCase):
     def _make_video_detections_dataset(self):
@@ -1852,6 +2005,41 @@ class VideoDetectionsTests(unittest.TestCase):
 
         return dataset
 
+    @drop_datasets
+    def test_evaluate_video_detections_coco_multi(self):
+        dataset = self._make_video_detections_dataset()
+
+        dataset.evaluate_detections(
+            "frames.predictions",
+            gt_field="frames.ground_truth",
+            eval_key="eval1",
+        )
+        dataset.evaluate_detections(
+            "frames.predictions",
+            gt_field="frames.ground_truth",
+            eval_key="eval2",
+            num_workers=2,
+        )
+
+        for field in ("tp", "fp", "fn"):
+            self.assertListEqual(
+                dataset.values("eval1_" + field),
+                dataset.values("eval2_" + field),
+            )
+            self.assertListEqual(
+                dataset.values("frames.eval1_" + field),
+                dataset.values("frames.eval2_" + field),
+            )
+
+        self.assertListEqual(
+            dataset.values("frames.ground_truth.detections.eval1"),
+            dataset.values("frames.ground_truth.detections.eval2"),
+        )
+        self.assertListEqual(
+            dataset.values("frames.predictions.detections.eval1_id"),
+            dataset.values("frames.predictions.detections.eval2_id"),
+        )
+
     def test_evaluate_video_detections_coco(self):
         dataset = self._make_video_detections_dataset()
 
@@ -2511,6 +2699,37 @@ class SegmentationTests(unittest.TestCase):
         self.assertIn("eval_precision", dataset.get_field_schema())
         self.assertIn("eval_recall", dataset.get_field_schema())
 
+        # Test parallel evaluation with observed mask values
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # suppress missing masks warning
+
+            results = dataset.evaluate_segmentations(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval_parallel",
+                method="simple",
+                compute_dice=True,
+                num_workers=2,
+            )
+
+        self.assertListEqual(results.classes.tolist(), ["0", "1", "2"])
+
+        actual = results.confusion_matrix()
+        self.assertEqual(actual.shape, expected.shape)
+        self.assertTrue((actual == expected).all())
+
+        self.assertListEqual(
+            dataset.values("eval_parallel_accuracy"),
+            dataset.values("eval_accuracy"),
+        )
+        self.assertListEqual(
+            dataset.values("eval_parallel_dice"),
+            [None, None, None, 1.0, 0.0],
+        )
+
+        dataset.delete_evaluation("eval_parallel")
+
         # Test rename
 
         dataset.rename_evaluation("eval", "eval2")
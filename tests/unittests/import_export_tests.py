@@ -8,12 +8,14 @@ FiftyOne import/export-related unit tests.
 import os
 import random
 import string
+import time
 import unittest
 
 import cv2
 import numpy as np
 import pytest
 
+import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.video as etav
 
@@ -1215,6 +1217,99 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
             dataset2.count("predictions.detections"),
         )
 
+        # Parallel media export
+
+        export_dir = self._new_dir()
+        export_dir2 = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.COCODetectionDataset,
+        )
+        dataset.export(
+            export_dir=export_dir2,
+            dataset_type=fo.types.COCODetectionDataset,
+            num_workers=4,
+        )
+
+        labels = etas.load_json(os.path.join(export_dir, "labels.json"))
+        labels2 = etas.load_json(os.path.join(export_dir2, "labels.json"))
+        labels.pop("info")
+        labels2.pop("info")
+        self.assertDictEqual(labels, labels2)
+
+        data_dir = os.path.join(export_dir2, "data")
+        filenames = sorted(os.listdir(data_dir))
+        self.assertListEqual(
+            filenames, sorted(os.listdir(os.path.join(export_dir, "data")))
+        )
+
+        # Media that was already exported is skipped
+        mtimes = [
+            os.path.getmtime(os.path.join(data_dir, f)) for f in filenames
+        ]
+        time.sleep(0.01)
+
+        dataset.export(
+            export_dir=export_dir2,
+            dataset_type=fo.types.COCODetectionDataset,
+            num_workers=4,
+        )
+
+        mtimes2 = [
+            os.path.getmtime(os.path.join(data_dir, f)) for f in filenames
+        ]
+        self.assertListEqual(mtimes, mtimes2)
+
+        # Streaming
+
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.COCODetectionDataset,
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.COCODetectionDataset,
+            label_types="detections",
+            label_field="predictions",
+            streaming=True,
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        self.assertListEqual(
+            dataset.values("predictions.detections.label"),
+            dataset2.values("predictions.detections.label"),
+        )
+        self.assertListEqual(
+            dataset.values("predictions.detections.bounding_box"),
+            dataset2.values("predictions.detections.bounding_box"),
+        )
+        self.assertEqual(
+            dataset.distinct("predictions.detections.mood"),
+            dataset2.distinct("predictions.detections.mood"),
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.COCODetectionDataset,
+            label_types="detections",
+            label_field="predictions",
+            classes="dog",
+            only_matching=True,
+            streaming=True,
+        )
+
+        self.assertEqual(
+            len(dataset2),
+            len(dataset.filter_labels("predictions", F("label") == "dog")),
+        )
+        self.assertListEqual(
+            dataset2.distinct("predictions.detections.label"), ["dog"]
+        )
+
         # Standard format (with rel dir)
 
         export_dir = self._new_dir()
@@ -2968,6 +3063,107 @@ class MultitaskImageDatasetTests(ImageDatasetTests):
             dataset3.count("predictions.detections"),
         )
 
+        # Sharded
+
+        export_dir = self._new_dir()
+        samples_dir = os.path.join(export_dir, "samples")
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            shard_size=2,
+        )
+
+        manifest = etas.read_json(os.path.join(samples_dir, "manifest.json"))
+        self.assertTrue(manifest["complete"])
+        self.assertEqual(manifest["num_docs"], len(dataset))
+        self.assertEqual(len(manifest["shards"]), (len(dataset) + 1) // 2)
+
+        dataset4 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+        )
+
+        self.assertListEqual(
+            [os.path.basename(f) for f in dataset.values("filepath")],
+            [os.path.basename(f) for f in dataset4.values("filepath")],
+        )
+        self.assertListEqual(
+            dataset.values("weather.label"), dataset4.values("weather.label")
+        )
+
+        # Resume an interrupted import
+
+        dataset4.delete_samples(dataset4.skip(1))
+
+        dataset4.add_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            resume=True,
+        )
+
+        self.assertListEqual(
+            [os.path.basename(f) for f in dataset.values("filepath")],
+            [os.path.basename(f) for f in dataset4.values("filepath")],
+        )
+
+        dataset5 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            ordered=False,
+            num_workers=2,
+        )
+
+        self.assertSetEqual(
+            set(dataset.values("id")), set(dataset5.values("id"))
+        )
+
+        # Resuming an export doesn't rewrite completed shards
+
+        shard_path = os.path.join(
+            samples_dir, manifest["shards"][0]["filename"]
+        )
+        mtime = os.path.getmtime(shard_path)
+        time.sleep(0.01)
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            shard_size=2,
+        )
+
+        self.assertEqual(os.path.getmtime(shard_path), mtime)
+
+        # Re-exporting after editing the dataset rewrites modified shards
+
+        dataset.set_values("index", list(range(100, 100 + len(dataset))))
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            shard_size=2,
+        )
+
+        dataset6 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+        )
+
+        self.assertListEqual(
+            dataset6.values("index"), list(range(100, 100 + len(dataset)))
+        )
+
+        # Corrupt shards are detected
+
+        with open(shard_path, "a") as f:
+            f.write("\n")
+
+        with self.assertRaises(ValueError):
+            fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=fo.types.FiftyOneDataset,
+            )
+
         # Labels-only (absolute paths)
 
         export_dir = self._new_dir()
@@ -318,6 +318,70 @@ class PatchesTests(unittest.TestCase):
         self.assertTrue(still_view.is_saved)
         self.assertEqual(still_view, view)
 
+    @drop_datasets
+    def test_to_patches_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.png" % i,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(label="cat"),
+                            fo.Detection(label="dog"),
+                        ][: i % 3]
+                    ),
+                )
+                for i in range(6)
+            ]
+        )
+
+        patches = dataset.to_patches("ground_truth", cache=True)
+        patches_dataset = patches._patches_dataset
+
+        self.assertEqual(len(patches), 6)
+        self.assertTrue(patches_dataset.persistent)
+        self.assertNotIn(patches_dataset.name, fo.list_datasets())
+
+        rands1 = {
+            d["_id"]: d["_rand"]
+            for d in patches_dataset._sample_collection.find()
+        }
+
+        sample = dataset.skip(1).first()
+        sample.ground_truth.detections.append(fo.Detection(label="rabbit"))
+        sample.save()
+
+        dataset.delete_samples(dataset.skip(2).first())
+
+        patches = dataset.to_patches("ground_truth", cache=True)
+        patches2 = dataset.to_patches("ground_truth")
+
+        self.assertEqual(patches._patches_dataset.name, patches_dataset.name)
+        self.assertEqual(len(patches), 5)
+        # Incremental updates preserve the order of an uncached dataset
+        self.assertListEqual(patches.values("id"), patches2.values("id"))
+        self.assertListEqual(
+            patches.values("ground_truth.label"),
+            patches2.values("ground_truth.label"),
+        )
+
+        # Patches of unmodified samples are not regenerated
+        rands2 = {
+            d["_id"]: d["_rand"]
+            for d in patches_dataset._sample_collection.find()
+        }
+        num_unchanged = sum(rands1.get(k) == v for k, v in rands2.items())
+        self.assertEqual(num_unchanged, 3)
+
+        patches.reload()
+        self.assertEqual(len(patches), 5)
+        self.assertTrue(fo.dataset_exists(patches_dataset.name))
+
+        # Cached datasets are deleted along with their source dataset
+        dataset.delete()
+        self.assertFalse(fo.dataset_exists(patches_dataset.name))
+
     @drop_datasets
     def test_to_evaluation_patches(self):
         dataset = fo.Dataset()
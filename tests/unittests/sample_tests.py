@@ -520,6 +520,58 @@ class SampleInDatasetTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             sample2["dynamic.classifications.classifications.foo"]
 
+    @drop_datasets
+    def test_lazy_fields(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat")]
+                    ),
+                    embedding=np.ones(4),
+                )
+                for i in range(2)
+            ]
+        )
+
+        sample = dataset.first()
+        data = sample._doc._data
+
+        # Fields are only deserialized when they are accessed
+        self.assertIn("ground_truth", data._raw)
+        self.assertIn("embedding", data._raw)
+
+        self.assertEqual(
+            sample.filepath, fo.core.storage.normalize_path("image0.jpg")
+        )
+        self.assertEqual(sample.ground_truth.detections[0].label, "cat")
+        self.assertNotIn("ground_truth", data._raw)
+        self.assertIn("embedding", data._raw)
+
+        # Saving doesn't deserialize fields that weren't accessed
+        sample.ground_truth.detections[0].label = "dog"
+        sample.save()
+
+        self.assertIn("embedding", data._raw)
+
+        for sample in dataset.iter_samples(autosave=True):
+            sample["index"] = len(sample.ground_truth.detections)
+
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.label"),
+            [["dog"], ["cat"]],
+        )
+        self.assertListEqual(dataset.values("index"), [1, 1])
+        for embedding in dataset.values("embedding"):
+            self.assertTrue(np.array_equal(embedding, np.ones(4)))
+
+        sample = dataset.last()
+        d = sample.to_dict()
+        self.assertEqual(d["ground_truth"]["detections"][0]["label"], "cat")
+        self.assertTrue(np.array_equal(sample.embedding, np.ones(4)))
+
 
 class SampleCollectionTests(unittest.TestCase):
     @drop_datasets
@@ -5,15 +5,24 @@ FiftyOne server-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
 import math
+import os
 import unittest
 
+import numpy as np
+
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.core.dataset as fod
 import fiftyone.core.labels as fol
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
+import fiftyone.server.aggregations as fosa
+import fiftyone.server.metadata as fosm
 import fiftyone.server.view as fosv
+import fiftyone.utils.image as foui
 from fiftyone.server.samples import paginate_samples
 
 from decorators import drop_datasets
@@ -805,6 +814,14 @@ class ServerViewTests(unittest.TestCase):
 
 
 class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # Each test runs in its own event loop, so the async client must be
+        # recreated rather than reused from a previous test's (closed) loop
+        foo.database._async_client = None
+
+    async def asyncTearDown(self):
+        foo.database._async_client = None
+
     @drop_datasets
     async def test_disjoint_groups(self):
         dataset, first, second = make_disjoint_groups_dataset()
@@ -838,3 +855,181 @@ class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(len(second_samples.edges), 1)
         self.assertEqual(second_samples.edges[0].node.id, second._id)
+
+    @drop_datasets
+    async def test_metadata_cache(self):
+        writeback = fo.config.app_metadata_writeback
+        fosm.clear_metadata_cache()
+
+        with etau.TempDir() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "image.png")
+            foui.write(np.zeros((10, 20, 3), dtype=np.uint8), filepath)
+            mtime = os.stat(filepath).st_mtime_ns
+
+            dataset = fo.Dataset()
+            dataset.add_sample(fo.Sample(filepath=filepath))
+
+            try:
+                fo.config.app_metadata_writeback = False
+
+                samples = await paginate_samples(dataset.name, [], {}, 1)
+                self.assertEqual(samples.edges[0].node.aspect_ratio, 2)
+                self.assertIsNone(dataset.first().metadata)
+
+                # Unmodified files are served from the cache
+                foui.write(np.zeros((20, 10, 3), dtype=np.uint8), filepath)
+                os.utime(filepath, ns=(mtime, mtime))
+
+                samples = await paginate_samples(dataset.name, [], {}, 1)
+                self.assertEqual(samples.edges[0].node.aspect_ratio, 2)
+
+                # Modified files are re-read
+                os.utime(filepath, ns=(mtime + 10**9, mtime + 10**9))
+
+                samples = await paginate_samples(dataset.name, [], {}, 1)
+                self.assertEqual(samples.edges[0].node.aspect_ratio, 0.5)
+
+                fo.config.app_metadata_writeback = True
+                fosm.clear_metadata_cache()
+
+                samples = await paginate_samples(dataset.name, [], {}, 1)
+                self.assertEqual(samples.edges[0].node.aspect_ratio, 0.5)
+
+                await asyncio.gather(*fosm._writeback_tasks)
+                dataset.reload()
+
+                metadata = dataset.first().metadata
+                self.assertIsInstance(metadata, fo.ImageMetadata)
+                self.assertEqual(metadata.width, 10)
+                self.assertEqual(metadata.height, 20)
+            finally:
+                fo.config.app_metadata_writeback = writeback
+
+    @drop_datasets
+    async def test_keyset_pagination(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image%d.png" % i, value=i % 3)
+                for i in range(25)
+            ]
+        )
+
+        for stages in (
+            [fo.SortBy("value")],
+            [fo.SortBy("value", reverse=True), fo.MatchTags([], bool=False)],
+            [fo.SortBy(fo.ViewField("value") * -1)],
+        ):
+            view = dataset.view()
+            for stage in stages:
+                view = view.add_stage(stage)
+
+            stages = [stage._serialize() for stage in stages]
+
+            for use_end_cursor in (True, False):
+                ids = []
+                after = None
+                while True:
+                    samples = await paginate_samples(
+                        dataset.name,
+                        stages,
+                        {},
+                        10,
+                        after=after,
+                        pagination_data=True,
+                    )
+                    ids.extend(str(e.node.id) for e in samples.edges)
+
+                    if not samples.page_info.has_next_page:
+                        break
+
+                    if use_end_cursor:
+                        after = samples.page_info.end_cursor
+                    else:
+                        after = samples.edges[-1].cursor
+
+                self.assertEqual(len(ids), 25)
+                self.assertEqual(len(set(ids)), 25)
+                self.assertListEqual(
+                    [dataset[_id].value for _id in ids], view.values("value")
+                )
+
+    @drop_datasets
+    async def test_keyset_pagination_nulls(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.png" % i, value=i if i < 5 else None
+                )
+                for i in range(12)
+            ]
+        )
+
+        for reverse in (False, True):
+            view = dataset.sort_by("value", reverse=reverse)
+            stages = [fo.SortBy("value", reverse=reverse)._serialize()]
+
+            ids = []
+            after = None
+            while True:
+                samples = await paginate_samples(
+                    dataset.name,
+                    stages,
+                    {},
+                    3,
+                    after=after,
+                    pagination_data=True,
+                )
+                ids.extend(str(e.node.id) for e in samples.edges)
+
+                if not samples.page_info.has_next_page:
+                    break
+
+                after = samples.page_info.end_cursor
+
+            self.assertEqual(len(ids), 12)
+            self.assertEqual(len(set(ids)), 12)
+            self.assertListEqual(
+                [dataset[_id].value for _id in ids], view.values("value")
+            )
+
+    @drop_datasets
+    async def test_slider_quantiles(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image%d.png" % i, int=i, float=i / 10)
+                for i in range(101)
+            ]
+        )
+
+        def _form(quantiles):
+            return fosa.AggregationForm(
+                dataset=dataset.name,
+                extended_stages=[],
+                filters=None,
+                group_id=None,
+                hidden_labels=[],
+                index=0,
+                mixed=False,
+                paths=["int", "float"],
+                quantiles=quantiles,
+                sample_ids=[],
+                slice=None,
+                slices=None,
+                view=[],
+            )
+
+        results = await fosa.aggregate_resolver(_form(False))
+        self.assertListEqual([r.quantiles for r in results], [None, None])
+
+        results = await fosa.aggregate_resolver(_form(True))
+        for result, scale in zip(results, (1, 0.1)):
+            self.assertEqual(result.min, 0)
+            self.assertAlmostEqual(result.max, 100 * scale)
+            self.assertEqual(len(result.quantiles), 5)
+            for value, expected in zip(result.quantiles, (5, 25, 50, 75, 95)):
+                self.assertAlmostEqual(
+                    value, expected * scale, delta=0.02 * expected * scale
+                )
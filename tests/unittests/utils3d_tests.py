@@ -177,6 +177,59 @@ class OrthographicProjectionTests(BaseOrthographicProjectionTests):
             get_abs_path("specs/3d/30x30_seed_42_none.png"),
         )
 
+    @drop_datasets
+    def test_parallel_projections(self):
+        dataset = fo.Dataset()
+
+        samples = []
+        for seed in range(3):
+            self.write_test_pcd(num_points=100, seed=seed)
+            pcd_path = os.path.join(self.temp_dir.name, "%d.pcd" % seed)
+            os.rename(self.test_pcd_path, pcd_path)
+
+            group = fo.Group()
+            samples.extend(
+                [
+                    fo.Sample(
+                        filepath="image.jpg",
+                        group_field=group.element("image"),
+                    ),
+                    fo.Sample(
+                        filepath=pcd_path, group_field=group.element("pcd")
+                    ),
+                ]
+            )
+
+        dataset.add_samples(samples)
+
+        for num_workers in (1, 2):
+            fou3d.compute_orthographic_projection_images(
+                dataset,
+                size=(30, 30),
+                output_dir=os.path.join(self.temp_dir.name, str(num_workers)),
+                shading_mode="rgb",
+                in_group_slice="pcd",
+                out_group_slice="bev%d" % num_workers,
+                metadata_field="bev%d" % num_workers,
+                num_workers=num_workers,
+            )
+
+        view = dataset.select_group_slices("pcd")
+        for metadata1, metadata2 in zip(*view.values(["bev1", "bev2"])):
+            self.assertNotEqual(metadata1.filepath, metadata2.filepath)
+            self.assertTrue(
+                np.array_equal(metadata1.min_bound, metadata2.min_bound)
+            )
+            self.assertValidProjection(
+                metadata2, expected_image_path=metadata1.filepath
+            )
+
+        view = dataset.select_group_slices("bev2")
+        self.assertEqual(len(view), 3)
+        self.assertListEqual(
+            view.values("filepath"), view.values("bev2.filepath")
+        )
+
     @drop_datasets
     def test_rgb_projection(self):
         dataset = fo.Dataset()
@@ -7,13 +7,16 @@ FiftyOne utilities unit tests.
 """
 import time
 import unittest
+from unittest import mock
 
 import numpy as np
 
 import fiftyone as fo
 import fiftyone.constants as foc
+import fiftyone.core.config as focn
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.odm.database as food
 import fiftyone.core.utils as fou
 import fiftyone.core.uid as foui
 from fiftyone.migrations.runner import MigrationRunner
@@ -79,6 +82,35 @@ class CoreUtilsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             fou.to_slug("a" * 101)  # too long
 
+    def test_dynamic_batcher_target_size(self):
+        elements = list(range(1000))
+
+        # Each element is 10 bytes, so batches converge to 100 elements
+        batcher = fou.DynamicBatcher(elements, target_size_bytes=1000)
+
+        batch_sizes = []
+        for batch in batcher:
+            batch_sizes.append(len(batch))
+            batcher.record_size(10 * len(batch))
+
+        self.assertEqual(sum(batch_sizes), len(elements))
+        self.assertEqual(batch_sizes[0], 1)
+        self.assertEqual(batch_sizes[1], 100)
+
+        # Learned batch sizes are remembered across batchers with the same key
+        key = "test_dynamic_batcher_target_size"
+
+        batcher = fou.DynamicBatcher(
+            elements, target_size_bytes=1000, warm_start_key=key
+        )
+        for batch in batcher:
+            batcher.record_size(10 * len(batch))
+
+        batcher = fou.DynamicBatcher(
+            elements, target_size_bytes=1000, warm_start_key=key
+        )
+        self.assertEqual(len(next(iter(batcher))), 100)
+
 
 class LabelsTests(unittest.TestCase):
     @drop_datasets
@@ -213,6 +245,100 @@ class SerializationTests(unittest.TestCase):
 
         self.assertDictEqual(s1.to_dict(), s2.to_dict())
 
+    def test_numpy_array_encodings(self):
+        arrays = [
+            np.random.randn(16).astype(np.float32),
+            np.arange(12, dtype=">i4").reshape(3, 4),
+            np.asfortranarray(np.random.randn(3, 5)),
+            np.zeros((0, 3)),
+            np.array(3.5),
+        ]
+
+        for array in arrays:
+            for encoding in ("zlib", "none", "raw"):
+                array_bytes = fou.serialize_numpy_array(
+                    array, encoding=encoding
+                )
+                array2 = fou.deserialize_numpy_array(array_bytes)
+                self.assertEqual(array2.shape, array.shape)
+                self.assertTrue(np.array_equal(array2, array))
+
+                array_str = fou.serialize_numpy_array(
+                    array, ascii=True, encoding=encoding
+                )
+                array2 = fou.deserialize_numpy_array(array_str, ascii=True)
+                self.assertTrue(np.array_equal(array2, array))
+
+        # Raw arrays are zero-copy views into the serialized bytes
+        array_bytes = fou.serialize_numpy_array(arrays[0], encoding="raw")
+        array2 = fou.deserialize_numpy_array(array_bytes)
+        self.assertFalse(array2.flags.writeable)
+
+        with self.assertRaises(ValueError):
+            fou.serialize_numpy_array(arrays[0], encoding="unsupported")
+
+        with self.assertRaises(ValueError):
+            fou.serialize_numpy_array(
+                np.array([{}], dtype=object), encoding="raw"
+            )
+
+    @drop_datasets
+    def test_array_field_encodings(self):
+        dataset = fo.Dataset()
+        dataset.add_sample_field("vector", fo.VectorField, encoding="raw")
+        dataset.add_sample_field("array", fo.ArrayField, encoding="none")
+
+        vector = np.random.randn(8).astype(np.float32)
+        array = np.ones((2, 3))
+        sample = fo.Sample(
+            filepath="image.png", vector=vector, array=array, other=array
+        )
+        dataset.add_sample(sample)
+
+        d = dataset._sample_collection.find_one()
+        self.assertEqual(d["vector"][:6], b"\x93FOARR")
+        self.assertEqual(d["array"][:6], b"\x93NUMPY")
+        self.assertNotEqual(d["other"][:6], b"\x93NUMPY")
+
+        self.assertTrue(np.array_equal(dataset.values("vector")[0], vector))
+        self.assertTrue(np.array_equal(dataset.values("array")[0], array))
+        self.assertTrue(np.array_equal(dataset.values("other")[0], array))
+
+        # Raw-encoded arrays are loaded as read-only views
+        loaded = dataset.values("vector")[0]
+        self.assertFalse(loaded.flags.writeable)
+        self.assertTrue(loaded.copy().flags.writeable)
+        self.assertTrue(dataset.values("array")[0].flags.writeable)
+
+        # Encodings are persisted
+        dataset.reload()
+        self.assertEqual(dataset.get_field("vector").encoding, "raw")
+        self.assertEqual(dataset.get_field("array").encoding, "none")
+        self.assertIsNone(dataset.get_field("other").encoding)
+
+        sample.vector = np.zeros(4)
+        sample.save()
+
+        d = dataset._sample_collection.find_one()
+        self.assertEqual(d["vector"][:6], b"\x93FOARR")
+        self.assertTrue(np.array_equal(sample.vector, np.zeros(4)))
+
+        # Samples from datasets with other encodings are re-encoded
+        dataset2 = fo.Dataset()
+        dataset2.add_sample(
+            fo.Sample(filepath="image2.png", vector=vector, array=array)
+        )
+
+        dataset.merge_samples(dataset2, key_fcn=lambda s: s.filepath)
+
+        d = dataset._sample_collection.find_one({"filepath": {"$regex": "2"}})
+        self.assertEqual(d["vector"][:6], b"\x93FOARR")
+        self.assertEqual(d["array"][:6], b"\x93NUMPY")
+        self.assertTrue(np.array_equal(dataset.values("vector")[-1], vector))
+
+        with self.assertRaises(ValueError):
+            fo.VectorField(encoding="unsupported")
+
 
 class MediaTypeTests(unittest.TestCase):
     @drop_datasets
@@ -323,6 +449,64 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(len(list(db.config.aggregate([]))), 1)
         self.assertEqual(config.id, orig_config.id)
 
+    def test_deferred_db_conn(self):
+        config = object()
+        calls = []
+
+        def establish_db_conn(config):
+            calls.append(config)
+
+            # Nested access uses the connection that is being established
+            food._establish_deferred_db_conn()
+
+            if len(calls) == 1:
+                raise ConnectionError("Failed to connect")
+
+        env = {"FIFTYONE_DISABLE_SERVICES": "0"}
+        with mock.patch.dict("os.environ", env), mock.patch.object(
+            food, "_deferred_config", config
+        ), mock.patch.object(
+            food, "establish_db_conn", side_effect=establish_db_conn
+        ), mock.patch.object(
+            food.fom, "migrate_database_if_necessary"
+        ) as migrate:
+            # A failed connection is retried on the next access
+            with self.assertRaises(ConnectionError):
+                food._establish_deferred_db_conn()
+
+            self.assertIs(food._deferred_config, config)
+            migrate.assert_not_called()
+
+            food._establish_deferred_db_conn()
+            food._establish_deferred_db_conn()
+
+            self.assertIsNone(food._deferred_config)
+            self.assertListEqual(calls, [config, config])
+            migrate.assert_called_once()
+
+    def test_default_save_batch_size(self):
+        for value, expected in (
+            ("100", 100),
+            ("1e3", 1000),
+            (" 500 ", 500),
+            ("1.0", 1.0),
+            ("0.5", 0.5),
+            ("1e-1", 0.1),
+        ):
+            env = {"FIFTYONE_DEFAULT_SAVE_BATCH_SIZE": value}
+            with mock.patch.dict("os.environ", env):
+                config = focn.FiftyOneConfig()
+
+            self.assertEqual(config.default_save_batch_size, expected)
+            self.assertIsInstance(
+                config.default_save_batch_size, type(expected)
+            )
+
+        for value in (1, 1.0, 1.5):
+            config = focn.FiftyOneConfig(d={"default_save_batch_size": value})
+            self.assertEqual(config.default_save_batch_size, value)
+            self.assertIsInstance(config.default_save_batch_size, type(value))
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
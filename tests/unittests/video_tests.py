@@ -2170,6 +2170,66 @@ class VideoTests(unittest.TestCase):
         frames = view.to_frames()
         self.assertEqual(len(frames), 1)
 
+    @drop_datasets
+    def test_to_frames_cache(self):
+        dataset = fo.Dataset()
+
+        for i in range(3):
+            sample = fo.Sample(filepath="video%d.mp4" % i)
+            for fn in range(1, 5):
+                sample.frames[fn] = fo.Frame(
+                    filepath="image%d%d.jpg" % (i, fn),
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat", index=1)]
+                        if fn % 2
+                        else []
+                    ),
+                )
+
+            dataset.add_sample(sample)
+
+        frames = dataset.to_frames(cache=True)
+        clips = dataset.to_clips("frames.ground_truth", cache=True)
+
+        self.assertEqual(len(frames), 12)
+        self.assertEqual(len(clips), 6)
+
+        sample = dataset.first()
+        sample.frames[2]["ground_truth"].detections.append(
+            fo.Detection(label="dog", index=2)
+        )
+        sample.frames[5] = fo.Frame(filepath="image05.jpg")
+        sample.save()
+
+        frames2 = dataset.to_frames(cache=True)
+        clips2 = dataset.to_clips("frames.ground_truth", cache=True)
+
+        self.assertEqual(
+            frames2._frames_dataset.name, frames._frames_dataset.name
+        )
+        self.assertEqual(clips2._clips_dataset.name, clips._clips_dataset.name)
+        self.assertEqual(len(frames2), 13)
+        self.assertEqual(frames2.count("ground_truth.detections"), 7)
+
+        self.assertListEqual(
+            frames2.values("id"), dataset.to_frames().values("id")
+        )
+        self.assertListEqual(
+            clips2.values("support"),
+            dataset.to_clips("frames.ground_truth").values("support"),
+        )
+
+        # Patches of a cached frames view can be cached as well
+        patches = frames2.to_patches("ground_truth", cache=True)
+        self.assertEqual(len(patches), 7)
+
+        dataset.delete_samples(dataset.last())
+
+        patches = dataset.to_frames(cache=True).to_patches(
+            "ground_truth", cache=True
+        )
+        self.assertEqual(len(patches), 5)
+
     @drop_datasets
     def test_to_frames_filepaths(self):
         sample = fo.Sample(filepath="video.mp4")
@@ -312,6 +312,63 @@ class DatasetViewTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             view.reload()
 
+    @drop_datasets
+    def test_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image1.jpg", value=1),
+                fo.Sample(filepath="image2.jpg", value=2),
+                fo.Sample(filepath="image3.jpg", value=3),
+            ]
+        )
+
+        view = dataset.match(F("value") > 1).sort_by("value", reverse=True)
+        pipeline = view._pipeline()
+
+        view.enable_cache()
+
+        self.assertEqual(len(view), 2)
+        self.assertListEqual(view._pipeline(), pipeline)
+        self.assertListEqual(view.values("value"), [3, 2])
+
+        # Cached pipelines must not be mutated by callers
+        view._pipeline().append({"$limit": 1})
+        self.assertListEqual(view._pipeline(), pipeline)
+
+        # Sample saves invalidate the cache
+        sample = dataset.first()
+        sample["value"] = 4
+        sample.save()
+
+        self.assertEqual(len(view), 3)
+        self.assertListEqual(view.values("value"), [4, 3, 2])
+
+        # Batch edits invalidate the cache
+        dataset.set_values("value", [0, 0, 0])
+        self.assertEqual(len(view), 0)
+
+        with dataset.save_context() as context:
+            for sample in dataset:
+                sample["value"] = 5
+                context.save(sample)
+
+        self.assertEqual(len(view), 3)
+
+        # Additions and deletions invalidate the cache
+        dataset.add_sample(fo.Sample(filepath="image4.jpg", value=6))
+        self.assertEqual(len(view), 4)
+
+        dataset.delete_samples(dataset.match(F("value") == 6))
+        self.assertEqual(len(view), 3)
+
+        # Field-level counts are never cached
+        self.assertEqual(view.count("value"), 3)
+
+        view.disable_cache()
+        self.assertIsNone(view._view_cache)
+        self.assertEqual(len(view), 3)
+
 
 class ViewFieldTests(unittest.TestCase):
     @skip_windows  # TODO: don't skip on Windows
@@ -1168,6 +1225,76 @@ class SetValuesTests(unittest.TestCase):
             [[], ["0"], ["0", "ONE"], ["0", "ONE", "2"]],
         )
 
+    def test_set_list_values(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(label=str(j), confidence=0.0)
+                            for j in range(i)
+                        ]
+                    ),
+                )
+                for i in range(4)
+            ]
+        )
+
+        # Every element changes; lists are rewritten in a single update
+        values = [[0.1 * (j + 1) for j in range(i)] for i in range(4)]
+        dataset.set_values("ground_truth.detections.confidence", values)
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.confidence"), values
+        )
+
+        # Values that look like expressions are stored literally
+        values = [["$label" for j in range(i)] for i in range(4)]
+        dataset.set_values("ground_truth.detections.custom", values)
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.custom"), values
+        )
+
+        # Only some elements change; other elements are untouched
+        view = dataset.filter_labels(
+            "ground_truth", F("label").is_in(["0", "2"])
+        )
+        view.set_values(
+            "ground_truth.detections.confidence",
+            [[1.0], [1.0], [1.0, None]],
+            skip_none=True,
+        )
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.confidence"),
+            [[], [1.0], [1.0, 0.2], [1.0, 0.2, 0.30000000000000004]],
+        )
+
+        # Nested fields
+        dataset.set_values(
+            "ground_truth.detections.attributes.x",
+            [[{"y": j} for j in range(i)] for i in range(4)],
+        )
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.attributes.x.y"),
+            [[], [0], [0, 1], [0, 1, 2]],
+        )
+
+        # Entire elements
+        dets = dataset.values("ground_truth.detections")
+        for _dets in dets:
+            for det in _dets:
+                det.label = "other"
+
+        dataset.set_values("ground_truth.detections", dets)
+        self.assertListEqual(
+            dataset.distinct("ground_truth.detections.label"), ["other"]
+        )
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.attributes.x.y"),
+            [[], [0], [0, 1], [0, 1, 2]],
+        )
+
     def test_set_values_validation(self):
         sample = fo.Sample(
             filepath="image.jpg",